@@ -1,13 +1,34 @@
 # Re-export the public API for simple imports in notebooks
-from .core import mmd, mmd_prefix_against_measure, AnalyticalMeasure
-from .kernels import make_kernel, restrict_to_unit_cube, make_cd_kernel
-from .measures import cd_uniform_k_mean, cd_uniform_k_self, CDUniformMeasure
+from .core import mmd, mmd_sweep, mmd_prefix_against_measure, AnalyticalMeasure
+from .kernels import (make_kernel, restrict_to_unit_cube, ProductKernel, make_cd_kernel,
+                      make_wraparound_kernel, make_star_kernel, make_symmetric_kernel,
+                      make_bernoulli_kernel, make_sobolev_kernel, make_matern_product_kernel)
+from .measures import (cd_uniform_k_mean, cd_uniform_k_self, CDUniformMeasure, PeriodicUniformMeasure,
+                       SEGaussianMeasure, SEUniformMeasure, MaternUniformMeasure, L2UniformMeasure)
+from .fast import StructuredDesign, Rank1Lattice, KroneckerSet
+from .two_sample import mmd_permutation_test
+from .features import RandomFourierFeatures
+from .nystrom import Nystrom, nystrom_quadrature_weights
+from .tracker import DiscrepancyTracker
+from .coreset import kernel_herding, kernel_thinning
+from .sparse import sparse_gram, sparse_quadrature_weights
+from .classical import l2_discrepancy
+from .cache import GramCache
+from .logdomain import log_mmd
 from .usage import show_mmd_usage
 
 
 __all__ = [
-    "mmd", "mmd_prefix_against_measure", "AnalyticalMeasure",
-    "make_kernel", "restrict_to_unit_cube", "make_cd_kernel",
-    "cd_uniform_k_mean", "cd_uniform_k_self", "CDUniformMeasure",
+    "mmd", "mmd_sweep", "mmd_prefix_against_measure", "AnalyticalMeasure",
+    "make_kernel", "restrict_to_unit_cube", "ProductKernel", "make_cd_kernel",
+    "make_wraparound_kernel", "make_star_kernel", "make_symmetric_kernel",
+    "make_bernoulli_kernel", "make_sobolev_kernel", "make_matern_product_kernel",
+    "cd_uniform_k_mean", "cd_uniform_k_self", "CDUniformMeasure", "PeriodicUniformMeasure",
+    "SEGaussianMeasure", "SEUniformMeasure", "MaternUniformMeasure", "L2UniformMeasure",
+    "StructuredDesign", "Rank1Lattice", "KroneckerSet",
+    "mmd_permutation_test", "RandomFourierFeatures",
+    "Nystrom", "nystrom_quadrature_weights", "DiscrepancyTracker",
+    "kernel_herding", "kernel_thinning", "sparse_gram", "sparse_quadrature_weights",
+    "l2_discrepancy", "GramCache", "log_mmd",
     "show_mmd_usage",
 ]
\ No newline at end of file
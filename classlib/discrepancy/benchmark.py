@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the discrepancy engine.
+
+Sweeps sample size n, dimension d, kernel, biased/unbiased mode and input
+generator over four targets:
+
+- mmd       two samples, mmd(X, Y)                          ~3 n^2 kernel evaluations
+- measure   sample vs analytic measure, mmd(X, P)           ~n^2
+- prefix    mmd_prefix_against_measure(X, K, P)             ~n^2 / 2
+- periodic  generators.Kronecker.periodic_discrepancy(n)    O(n d)  (needs qmcpy)
+
+Kernels are paired with their closed-form measures: 'se' + SEUniformMeasure,
+'matern' (product, ν=3/2) + MaternUniformMeasure, 'cd' (make_cd_kernel) +
+CDUniformMeasure and 'bernoulli' + PeriodicUniformMeasure.  Generators are
+'iid' (uniform), 'lattice' (Rank1Lattice) and 'kronecker' (KroneckerSet).
+
+Each case records the best wall time over `repeat` runs, the peak traced
+memory of one extra run (tracemalloc), kernel evaluations per second
+(counted as the O(n^2) reference would evaluate them, so fast paths show up
+as a higher rate) and the value.  Where mmd() takes a fast path (the
+closed-form L2 path for 'cd', the O(n d) structured path for 'bernoulli' on a
+lattice / Kronecker set), the value is also checked against the generic
+tiled O(n^2) computation (`ref_rel_err`).
+
+Runs are appended to a JSON history file; against a stored baseline run,
+cases that got slower (or use more memory) by more than `tolerance` are
+flagged, and the CLI exits with status 1.
+
+    classlib-mmd-bench --preset quick --history bench.json
+    python -m classlib.discrepancy.benchmark --baseline base.json --save-baseline base.json
+
+Public:
+- default_cases(preset="quick")
+- run_benchmarks(cases=None, repeat=3, ...)
+- compare_to_baseline(results, baseline, tolerance=0.25, ...)
+- main(argv=None)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from itertools import product
+from typing import Callable, Optional
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+from .core import mmd, mmd_prefix_against_measure
+from .fast import Rank1Lattice, KroneckerSet
+from .kernels import make_kernel, make_cd_kernel, make_bernoulli_kernel, make_matern_product_kernel
+from .measures import CDUniformMeasure, PeriodicUniformMeasure, SEUniformMeasure, MaternUniformMeasure
+
+__all__ = ["default_cases", "run_benchmarks", "compare_to_baseline", "main"]
+
+TARGETS = ("mmd", "measure", "prefix", "periodic")
+KERNELS = ("se", "matern", "cd", "bernoulli")
+GENERATORS = ("iid", "lattice", "kronecker")
+
+_PRESETS = {
+    "quick": dict(n=(256, 1024), d=(2, 16)),
+    "full": dict(n=(256, 1024, 4096, 16384), d=(2, 8, 32)),
+}
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+def _case_key(case: dict) -> str:
+    return (f"{case['target']} n={case['n']} d={case['d']} kernel={case['kernel']} "
+            f"biased={int(case['biased'])} gen={case['generator']}")
+
+
+def default_cases(
+    preset: str = "quick",
+    *,
+    n=None,
+    d=None,
+    kernels=KERNELS,
+    generators=GENERATORS,
+    targets=TARGETS,
+    modes=(True, False),
+) -> list[dict]:
+    """
+    Benchmark grid as a list of case dicts (target, n, d, kernel, biased, generator).
+
+    `preset` ('quick' or 'full') supplies n and d unless given.  Combinations
+    that do not apply are dropped: 'prefix' and 'periodic' have no unbiased
+    mode, and 'periodic' only runs the Bernoulli kernel on Kronecker points.
+    """
+    if preset not in _PRESETS:
+        raise ValueError(f"unknown preset {preset!r}; use one of {tuple(_PRESETS)}.")
+    n = _PRESETS[preset]["n"] if n is None else n
+    d = _PRESETS[preset]["d"] if d is None else d
+    cases = []
+    for target, nn, dd, kern, biased, gen in product(targets, n, d, kernels, modes, generators):
+        if target not in TARGETS or kern not in KERNELS or gen not in GENERATORS:
+            raise ValueError(f"unknown target/kernel/generator in {(target, kern, gen)}")
+        if target in ("prefix", "periodic") and not biased:
+            continue
+        if target == "periodic" and (kern != "bernoulli" or gen != "kronecker"):
+            continue
+        cases.append(dict(target=target, n=int(nn), d=int(dd), kernel=kern, biased=bool(biased), generator=gen))
+    return cases
+
+
+def _points(generator: str, n: int, d: int, rng: np.random.Generator):
+    if generator == "iid":
+        return rng.random((n, d))
+    shift = rng.random(d)
+    if generator == "lattice":
+        a = (int(0.6180339887 * n) | 1) % n or 1                 # Korobov generator
+        z = np.array([pow(a, j, n) for j in range(d)], dtype=np.int64)
+        return Rank1Lattice(z, n, shift=shift)
+    alpha = 2.0 ** (np.arange(1, d + 1) / (d + 1)) % 1.0           # Suzuki direction
+    return KroneckerSet(alpha, n, shift=shift)
+
+
+def _kernel_and_measure(kernel: str, d: int):
+    if kernel == "se":
+        return make_kernel("se", 1.0), SEUniformMeasure(0.0, 1.0, sigma=1.0, d=d)
+    if kernel == "matern":
+        return make_matern_product_kernel(d, 1.0, 1.5), MaternUniformMeasure(d, 1.0, 1.5)
+    if kernel == "cd":
+        return make_cd_kernel(d, 1.0), CDUniformMeasure(d, 1.0)
+    return make_bernoulli_kernel(d, 1.0), PeriodicUniformMeasure()
+
+
+def _untagged(K: Callable) -> Callable:
+    """The same kernel without fast-path tags: mmd() then takes the generic tiled path."""
+    def plain(A, B):
+        return K(A, B)
+
+    if hasattr(K, "k_tilde_integral"):          # still needed by PeriodicUniformMeasure
+        plain.k_tilde_integral = K.k_tilde_integral
+    return plain
+
+
+def _build(case: dict, rng: np.random.Generator, ref_max_n: int):
+    """(run, kernel evaluations, reference or None) for one case, or None if unavailable."""
+    n, d, biased = case["n"], case["d"], case["biased"]
+    X = _points(case["generator"], n, d, rng)
+    K, P = _kernel_and_measure(case["kernel"], d)
+    target = case["target"]
+
+    if target == "mmd":
+        Y = rng.random((n, d))
+        return (lambda: mmd(X, Y, kernel=K, biased=biased, return_squared=True)), 3.0 * n * n, None
+    if target == "measure":
+        fast = case["kernel"] == "cd" or (case["kernel"] == "bernoulli" and case["generator"] != "iid")
+        ref = None
+        if fast and n <= ref_max_n:
+            Xa = np.asarray(X)
+            ref = lambda: mmd(Xa, P, kernel=_untagged(K), biased=biased, return_squared=True)
+        return (lambda: mmd(X, P, kernel=K, biased=biased, return_squared=True)), float(n * n), ref
+    if target == "prefix":
+        Xa = np.asarray(X)
+        return (lambda: mmd_prefix_against_measure(Xa, K, P)[-1]), n * (n + 1) / 2.0, None
+    try:
+        from ..generators.kronecker import Kronecker
+    except ImportError:                              # qmcpy / sympy not installed
+        return None
+    gen = Kronecker(dimension=d, alpha="richtmyer", randomize=False)
+    return (lambda: gen.periodic_discrepancy(n)[-1] ** 2), float(n), None
+
+
+# ---------------------------------------------------------------------------
+# Running and comparing
+# ---------------------------------------------------------------------------
+def _measure(run: Callable, repeat: int) -> tuple[float, float, float]:
+    """(best wall time, peak traced MiB, value): one traced run, then `repeat` timed runs."""
+    tracemalloc.start()
+    try:
+        value = run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    best = math.inf
+    for _ in range(max(int(repeat), 1)):
+        t0 = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - t0)
+    return best, peak / 2**20, float(value)
+
+
+def run_benchmarks(
+    cases: Optional[list[dict]] = None,
+    *,
+    repeat: int = 3,
+    ref_max_n: int = 4096,
+    seed: int = 0,
+    progress: Optional[Callable[[dict], None]] = None,
+) -> list[dict]:
+    """
+    Run benchmark cases and return one record per case.
+
+    Parameters
+    ----------
+    cases : list of dict, optional
+        From default_cases() (default: the 'quick' preset).
+    repeat : int, default 3
+        Timed runs per case; the best is kept.
+    ref_max_n : int, default 4096
+        Largest n for which fast paths are checked against the generic
+        O(n^2) computation.
+    seed : int
+        Seeds the points of every case (together with n and d).
+    progress : callable, optional
+        Called with each record as it completes.
+
+    Returns
+    -------
+    list of dict
+        Case fields plus key, time_s, peak_mib, evals, evals_per_s, value,
+        ref_rel_err (None if not checked) and skipped (reason or None).
+    """
+    cases = default_cases() if cases is None else cases
+    records = []
+    for case in cases:
+        rng = np.random.default_rng([seed, case["n"], case["d"]])
+        rec = dict(case, key=_case_key(case), time_s=None, peak_mib=None, evals=None,
+                   evals_per_s=None, value=None, ref_rel_err=None, skipped=None)
+        built = _build(case, rng, ref_max_n)
+        if built is None:
+            rec["skipped"] = "generators.kronecker unavailable (needs qmcpy)"
+        else:
+            run, evals, ref = built
+            t, peak, value = _measure(run, repeat)
+            rec.update(time_s=t, peak_mib=peak, evals=evals, evals_per_s=evals / t if t > 0 else None, value=value)
+            if ref is not None:
+                r = float(ref())
+                rec["ref_rel_err"] = abs(value - r) / max(abs(r), 1e-300)
+        records.append(rec)
+        if progress is not None:
+            progress(rec)
+    return records
+
+
+def compare_to_baseline(
+    results: list[dict],
+    baseline: list[dict],
+    tolerance: float = 0.25,
+    *,
+    min_time: float = 0.005,
+) -> list[dict]:
+    """
+    Cases that regressed against a baseline run.
+
+    A case regresses when its time exceeds (1 + tolerance) times the
+    baseline time (ignored below `min_time` seconds, where timer noise
+    dominates) or its peak memory exceeds (1 + tolerance) times the baseline
+    peak plus 1 MiB.  Cases missing from either run are not compared.
+
+    Returns
+    -------
+    list of dict with key, metric ('time_s' or 'peak_mib'), baseline, current, ratio.
+    """
+    base = {r["key"]: r for r in baseline if r.get("skipped") is None}
+    out = []
+    for r in results:
+        b = base.get(r["key"])
+        if b is None or r.get("skipped") is not None:
+            continue
+        if r["time_s"] > max(min_time, (1.0 + tolerance) * b["time_s"]):
+            out.append(dict(key=r["key"], metric="time_s", baseline=b["time_s"], current=r["time_s"],
+                            ratio=r["time_s"] / b["time_s"]))
+        if r["peak_mib"] > (1.0 + tolerance) * b["peak_mib"] + 1.0:
+            out.append(dict(key=r["key"], metric="peak_mib", baseline=b["peak_mib"], current=r["peak_mib"],
+                            ratio=r["peak_mib"] / max(b["peak_mib"], 1e-9)))
+    return out
+
+
+def _run_info(label: str, results: list[dict]) -> dict:
+    return dict(
+        timestamp=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        label=label,
+        host=platform.node(),
+        machine=platform.machine(),
+        python=platform.python_version(),
+        numpy=np.__version__,
+        results=results,
+    )
+
+
+def _load_json(path: str, default):
+    if not path or not os.path.exists(path):
+        return default
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _write_json(path: str, obj) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(obj, fh, indent=1)
+    os.replace(tmp, path)
+
+
+def _fmt_row(rec: dict) -> str:
+    if rec["skipped"] is not None:
+        return f"{rec['key']:<58} skipped: {rec['skipped']}"
+    err = "" if rec["ref_rel_err"] is None else f"  ref_err={rec['ref_rel_err']:.1e}"
+    return (f"{rec['key']:<58} {rec['time_s'] * 1e3:9.2f} ms {rec['peak_mib']:8.1f} MiB "
+            f"{rec['evals_per_s']:10.3g} evals/s{err}")
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+def _csv(conv):
+    return lambda s: tuple(conv(tok.strip()) for tok in s.split(",") if tok.strip())
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    p = argparse.ArgumentParser(prog="classlib-mmd-bench", description="Benchmark the discrepancy engine.")
+    p.add_argument("--preset", choices=sorted(_PRESETS), default="quick")
+    p.add_argument("--n", type=_csv(int), default=None, help="comma-separated sample sizes")
+    p.add_argument("--d", type=_csv(int), default=None, help="comma-separated dimensions")
+    p.add_argument("--kernels", type=_csv(str), default=KERNELS)
+    p.add_argument("--generators", type=_csv(str), default=GENERATORS)
+    p.add_argument("--targets", type=_csv(str), default=TARGETS)
+    p.add_argument("--modes", choices=["both", "biased", "unbiased"], default="both")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--ref-max-n", type=int, default=4096)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--label", default="")
+    p.add_argument("--history", default="mmd_bench_history.json", help="JSON file the run is appended to ('' to skip)")
+    p.add_argument("--baseline", default="", help="JSON file with a baseline run to compare against")
+    p.add_argument("--save-baseline", default="", help="write this run as the new baseline")
+    p.add_argument("--tolerance", type=float, default=0.25)
+    p.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = p.parse_args(argv)
+
+    modes = {"both": (True, False), "biased": (True,), "unbiased": (False,)}[args.modes]
+    cases = default_cases(args.preset, n=args.n, d=args.d, kernels=args.kernels,
+                          generators=args.generators, targets=args.targets, modes=modes)
+    if args.list:
+        for c in cases:
+            print(_case_key(c))
+        return 0
+
+    results = run_benchmarks(cases, repeat=args.repeat, ref_max_n=args.ref_max_n, seed=args.seed,
+                             progress=lambda rec: print(_fmt_row(rec), flush=True))
+    run = _run_info(args.label, results)
+
+    if args.history:
+        history = _load_json(args.history, {"runs": []})
+        history["runs"].append(run)
+        _write_json(args.history, history)
+        print(f"Appended run to {args.history}")
+
+    status = 0
+    bad_ref = [r for r in results if r["ref_rel_err"] is not None and r["ref_rel_err"] > 1e-8]
+    for r in bad_ref:
+        print(f"MISMATCH {r['key']}: fast path differs from the O(n^2) reference by {r['ref_rel_err']:.2e}")
+        status = 1
+    if args.baseline:
+        base = _load_json(args.baseline, None)
+        if base is None:
+            print(f"No baseline at {args.baseline}; nothing to compare.")
+        else:
+            regressions = compare_to_baseline(results, base["results"], args.tolerance)
+            for g in regressions:
+                print(f"REGRESSION {g['key']}: {g['metric']} {g['baseline']:.4g} -> {g['current']:.4g} "
+                      f"(x{g['ratio']:.2f})")
+            if regressions:
+                status = 1
+            else:
+                print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%}).")
+    if args.save_baseline:
+        _write_json(args.save_baseline, run)
+        print(f"Saved baseline to {args.save_baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
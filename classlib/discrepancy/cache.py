@@ -0,0 +1,263 @@
+"""
+Opt-in disk cache for Gram matrices and Gram reductions.
+
+Entries are .npy files in one directory, named by a SHA-1 fingerprint of the
+point arrays (shape, dtype and bytes) and the kernel parameters.  They are
+read back with np.load(mmap_mode="r"), so a cached Gram matrix is paged in
+on demand rather than loaded whole.  A size cap is enforced after every
+write by deleting the least recently used entries (file modification time,
+refreshed on every hit), which also works when several processes share the
+directory.
+
+Two granularities:
+- mmd(..., cache=GramCache(...)) stores the tiled reductions (sum, trace)
+  of each Gram matrix, a few bytes per entry;
+- GramCache.gram(kernel, A, B) stores the full Gram matrix, written tile by
+  tile into a memory-mapped file (for quadrature solves and other uses
+  that need the matrix itself).
+
+Public:
+- GramCache(directory=None, max_bytes=2**30)
+
+Internal:
+- _kernel_key(kernel, sigma, nu, dtype)   fingerprint parts of a kernel, or None
+- _memo_for(cache, kernel, sigma, nu, dtype)
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Callable, Optional
+import hashlib
+import os
+import numpy as np
+
+from .fast import StructuredDesign
+from .kernels import _make_kernel, ProductKernel
+from .tiling import DEFAULT_TILE, _tile_slices
+
+__all__ = ["GramCache", "_kernel_key", "_memo_for"]
+
+_DEFAULT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "classlib", "gram")
+
+
+def _kernel_key(kernel: Any, sigma: float = 1.0, nu: float = 1.5, dtype=None) -> tuple | None:
+    """
+    Hashable description of a kernel, or None if it cannot be identified.
+
+    String kernels are described by (name, sigma, nu, dtype); ProductKernel by
+    its term function, parameters and flags; any callable may declare its own
+    `cache_key` attribute.  Other callables (closures, lambdas) are not cached.
+    """
+    if isinstance(kernel, str):
+        return ("named", kernel.lower(), float(sigma), float(nu), str(np.dtype(dtype or float)))
+    own = getattr(kernel, "cache_key", None)
+    if own is not None:
+        return ("custom", str(own))
+    if isinstance(kernel, ProductKernel):
+        term = kernel.term
+        if isinstance(term, partial):
+            term_id = (term.func.__module__, term.func.__qualname__, tuple(sorted(term.keywords.items())))
+        else:
+            term_id = (term.__module__, term.__qualname__)
+        return ("product", kernel.name, term_id, kernel.params, kernel.one_plus, str(kernel.dtype))
+    return None
+
+
+class GramCache:
+    """
+    Directory of cached Gram matrices / reductions with an LRU size cap.
+
+    Parameters
+    ----------
+    directory : str or path, optional
+        Cache location.  Default: $CLASSLIB_GRAM_CACHE, else
+        ~/.cache/classlib/gram.  Created if missing.
+    max_bytes : int, default 1 GiB
+        Total size of the .npy files kept; least recently used entries are
+        removed after a write that exceeds it.
+
+    Notes
+    -----
+    Keys include every byte of the input arrays, so any change to the points
+    (or to sigma, nu, dtype, tile) is a miss.  Fingerprinting costs one pass
+    over the data, far less than the O(n^2) Gram work it saves.  Structured
+    designs (Rank1Lattice, KroneckerSet) are keyed by their parameters
+    (StructuredDesign.cache_key), without generating the points.
+    """
+
+    def __init__(self, directory=None, max_bytes: int = 2**30):
+        if directory is None:
+            directory = os.environ.get("CLASSLIB_GRAM_CACHE", _DEFAULT_DIR)
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    # ---- keys and files ----------------------------------------------------------
+    @staticmethod
+    def fingerprint(*parts) -> str:
+        """
+        SHA-1 hex digest of arrays (shape, dtype, bytes), structured designs
+        (their cache_key()) and other values (repr).
+        """
+        h = hashlib.sha1()
+        for p in parts:
+            if isinstance(p, StructuredDesign):
+                h.update(b"design(")
+                h.update(GramCache.fingerprint(*p.cache_key()).encode())
+                h.update(b")")
+            elif isinstance(p, (tuple, list)):
+                h.update(b"(")
+                h.update(GramCache.fingerprint(*p).encode())
+                h.update(b")")
+            elif isinstance(p, np.ndarray) or hasattr(p, "__array__"):
+                a = np.ascontiguousarray(np.asarray(p))
+                h.update(f"{a.dtype.str}{a.shape}".encode())
+                h.update(a.view(np.uint8).reshape(-1).data if a.size else b"")
+            else:
+                h.update(repr(p).encode())
+            h.update(b"|")
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".npy")
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        out = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".npy"):
+                path = os.path.join(self.directory, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:       # removed by another process
+                    continue
+                out.append((st.st_mtime, st.st_size, path))
+        return out
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """The cached array (memory-mapped, read-only) or None; a hit refreshes its LRU time."""
+        path = self._path(key)
+        try:
+            arr = np.load(path, mmap_mode="r")
+            os.utime(path)
+        except (FileNotFoundError, ValueError, OSError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return arr
+
+    def put(self, key: str, value) -> None:
+        """Store an array under `key` (atomic rename), then enforce the size cap."""
+        tmp = self._path(key) + f".{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            np.save(fh, np.asarray(value))
+        os.replace(tmp, self._path(key))
+        self._evict(keep=self._path(key))
+
+    def _evict(self, keep: str | None = None) -> None:
+        entries = sorted(self._entries())                      # oldest first
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:                     # gone already, or mapped elsewhere (Windows)
+                pass
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    # ---- cached computations -----------------------------------------------------
+    def cached(self, parts: tuple, compute: Callable[[], Any]) -> np.ndarray:
+        """Return the cached array for `parts`, computing and storing it on a miss."""
+        key = self.fingerprint(*parts)
+        hit = self.get(key)
+        if hit is not None:
+            return hit
+        value = np.asarray(compute())
+        self.put(key, value)
+        return value
+
+    def gram(
+        self,
+        kernel: Any,
+        A,
+        B=None,
+        *,
+        sigma: float = 1.0,
+        nu: float = 1.5,
+        dtype=None,
+        tile: int | None = DEFAULT_TILE,
+    ) -> np.ndarray:
+        """
+        Gram matrix K(A, B) (B=None: K(A, A)) as a read-only memory map.
+
+        On a miss the matrix is computed tile by tile straight into a
+        memory-mapped .npy file, so peak RAM stays O(tile^2) however large
+        the matrix.
+        """
+        kkey = _kernel_key(kernel, sigma, nu, dtype)
+        if kkey is None:
+            raise ValueError("kernel cannot be fingerprinted; give it a `cache_key` attribute.")
+        A = np.atleast_2d(np.asarray(A, float))
+        B = A if B is None else np.atleast_2d(np.asarray(B, float))
+        key = self.fingerprint("gram", kkey, A, B)
+        hit = self.get(key)
+        if hit is not None:
+            return hit
+        K = _make_kernel(kernel, sigma, nu=nu, dtype=dtype)["K"]
+        tmp = self._path(key) + f".{os.getpid()}.tmp"
+        out = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.dtype(dtype or float),
+                                        shape=(len(A), len(B)))
+        for si in _tile_slices(len(A), tile):
+            for sj in _tile_slices(len(B), tile):
+                out[si, sj] = K(A[si], B[sj])
+        out.flush()
+        del out
+        os.replace(tmp, self._path(key))
+        self._evict(keep=self._path(key))
+        return np.load(self._path(key), mmap_mode="r")
+
+    def __repr__(self) -> str:
+        return f"GramCache({self.directory!r}, entries={len(self)}, hits={self.hits}, misses={self.misses})"
+
+
+def _no_memo(parts: tuple, compute: Callable[[], Any]):
+    return compute()
+
+
+def _memo_for(cache: Optional[GramCache], kernel: Any, sigma: float, nu: float, dtype=None) -> Callable:
+    """
+    memo(parts, compute) for mmd(): cached through `cache` when the kernel can be
+    fingerprinted, a plain call otherwise.  Tuples of floats come back as tuples.
+    """
+    if cache is None:
+        return _no_memo
+    kkey = _kernel_key(kernel, sigma, nu, dtype)
+    if kkey is None:
+        return _no_memo
+
+    def memo(parts: tuple, compute: Callable[[], Any]):
+        value = cache.cached((kkey,) + tuple(parts), compute)
+        value = np.asarray(value, float)
+        return float(value) if value.ndim == 0 else tuple(float(v) for v in value)
+
+    return memo
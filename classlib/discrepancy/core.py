@@ -6,6 +6,12 @@ Core MMD / Discrepancy engine.
 - Estimators:
   * biased=True (default): includes diagonals; always ≥ 0.
   * biased=False: unbiased U-statistic (only when BOTH sides are samples).
+- Structured designs (Rank1Lattice, KroneckerSet from fast.py) paired with a
+  shift-invariant kernel (tagged with `k_tilde`) use O(n d) double sums.
+- Gram matrices are reduced tile by tile (see tiling.py), so peak memory is
+  O(tile^2) instead of O(n^2).
+- Replicate stacks (R,n,d) give an (R,) vector of discrepancies; kernel
+  evaluations are batched over the replicate axis.
 - Kernels:
   * Use names "sqexp"/"se" (squared exponential), "matern", "linear", or pass a callable K(A,B).
     NOTE: We avoid the ambiguous name “RBF” (radial basis function is broader).
@@ -14,11 +20,18 @@ Core MMD / Discrepancy engine.
 from __future__ import annotations
 
 from typing import Callable, Any
+import math
 import numpy as np
 
-from .kernels import _make_kernel  # internal factory
+from .kernels import _make_kernel, _stationary_profile, _pairwise_sq_dists  # internal factories
+from .tiling import (DEFAULT_TILE, _tile_slices, _sym_tile_pairs, _gram_sum, _gram_sum_sym,
+                     _gram_sum_stacked, _gram_sum_sym_stacked, _executor_scope, _map_tiles)
+from .fast import StructuredDesign
+from .streaming import _streaming_mmd2
+from .features import RandomFourierFeatures, _feature_measure_mmd2, _feature_mmd2
+from .cache import _memo_for, _no_memo
 
-__all__ = ["mmd", "mmd_prefix_against_measure", "AnalyticalMeasure"]
+__all__ = ["mmd", "mmd_sweep", "mmd_prefix_against_measure", "AnalyticalMeasure"]
 
 
 # ---------------------------------------------------------------------------
@@ -32,12 +45,23 @@ class AnalyticalMeasure:
     ----------
     k_mean : callable
         k_mean(x, K) -> array (len(x),) with entries E_{Z~P}[k(x_i, Z)].
-        - x : (n,d) array (will be np.atleast_2d)
+        - x : (n,d) array (will be np.atleast_2d); a replicate stack (R,n,d)
+              is flattened to (R*n,d) and the result reshaped to (R,n)
         - K : kernel callable used for compatibility (can be ignored if not needed)
 
     k_self : callable
         k_self(K) -> float with value E_{Z,Z'~P}[k(Z, Z')].
 
+    log_k_mean, log_k_self : callable, optional
+        Logarithms of the same integrals, computed without forming them
+        (sums of per-coordinate logs for product kernels).  Used by log_mmd();
+        when omitted, the logs of k_mean / k_self are taken.
+
+    characteristic : callable, optional
+        characteristic(W) -> complex array (m,) with entries E_{Z~P}[exp(i w_k·Z)]
+        for the rows w_k of an (m, d) frequency matrix.  Lets mmd(features=...)
+        take the measure's random-Fourier-feature mean embedding exactly.
+
     Notes
     -----
     If both sides are measures, a cross expectation E[k(X, Y)] is required
@@ -48,18 +72,131 @@ class AnalyticalMeasure:
         self,
         k_mean: Callable[[np.ndarray, Callable], np.ndarray],
         k_self: Callable[[Callable], float],
+        log_k_mean: Callable[[np.ndarray, Callable], np.ndarray] | None = None,
+        log_k_self: Callable[[Callable], float] | None = None,
+        characteristic: Callable[[np.ndarray], np.ndarray] | None = None,
     ):
         self._k_mean = k_mean
         self._k_self = k_self
+        self._log_k_mean = log_k_mean
+        self._log_k_self = log_k_self
+        self._characteristic = characteristic
 
     def k_mean(self, x: np.ndarray, K: Callable) -> np.ndarray:
         x = np.atleast_2d(np.asarray(x, float))
-        out = self._k_mean(x, K)
-        return np.asarray(out, float).reshape(-1)
+        out = self._k_mean(x.reshape(-1, x.shape[-1]), K)
+        return np.asarray(out, float).reshape(x.shape[:-1])
 
     def k_self(self, K: Callable) -> float:
         return float(self._k_self(K))
 
+    def log_k_mean(self, x: np.ndarray, K: Callable) -> np.ndarray:
+        """log E_{Z~P}[k(x_i, Z)], shape as k_mean."""
+        if self._log_k_mean is None:
+            with np.errstate(divide="ignore"):
+                return np.log(self.k_mean(x, K))
+        x = np.atleast_2d(np.asarray(x, float))
+        out = self._log_k_mean(x.reshape(-1, x.shape[-1]), K)
+        return np.asarray(out, float).reshape(x.shape[:-1])
+
+    def characteristic(self, W: np.ndarray) -> np.ndarray:
+        """E_{Z~P}[exp(i W Z)] for the rows of W (m, d); shape (m,), complex."""
+        if self._characteristic is None:
+            raise ValueError(f"{type(self).__name__} has no closed-form characteristic function; "
+                             "features= against it needs a feature map with a k_mean-based "
+                             "mean embedding (Nystrom).")
+        W = np.atleast_2d(np.asarray(W, float))
+        return np.asarray(self._characteristic(W), complex)
+
+    def log_k_self(self, K: Callable) -> float:
+        """log E_{Z,Z'~P}[k(Z, Z')]."""
+        if self._log_k_self is None:
+            with np.errstate(divide="ignore"):
+                return float(np.log(self.k_self(K)))
+        return float(self._log_k_self(K))
+
+
+def _as_points(Z) -> np.ndarray:
+    """Sample (or structured design) as an (n, d) float array."""
+    Z = np.asarray(Z, float)
+    return Z[:, None] if Z.ndim == 1 else Z
+
+
+def _self_sums(K: Callable, X, tile: int | None, executor=None) -> tuple[float, float]:
+    """(sum, trace) of K(X, X); structured designs use their index-difference structure."""
+    if isinstance(X, StructuredDesign) and hasattr(K, "k_tilde"):
+        return X.shift_invariant_sums(K.k_tilde, tile)
+    return _gram_sum_sym(K, X, tile, executor)
+
+
+def _self_term(K: Callable, X, biased: bool, tile: int | None, executor=None, memo=_no_memo) -> float:
+    """Mean of K(X, X): with diagonal (biased) or without it (U-statistic)."""
+    n = len(X)
+    total, trace = memo(("sym", X, tile), lambda: _self_sums(K, X, tile, executor))
+    if biased or n < 2:
+        return total / (n * n)
+    return (total - trace) / (n * (n - 1))
+
+
+def _l2_kind(K: Callable, measure: AnalyticalMeasure, X) -> str | None:
+    """Classical L2 discrepancy recognized from matching kernel / measure tags (classical.py)."""
+    kind = getattr(K, "l2_kind", None)
+    if (kind is None or getattr(measure, "l2_kind", None) != kind
+            or not np.array_equal(K.l2_gamma, measure.l2_gamma)
+            or isinstance(X, StructuredDesign)
+            or getattr(K, "dtype", np.float64) != np.float64):
+        return None
+    return kind
+
+
+def _measure_mean(measure: AnalyticalMeasure, X, K: Callable, tile: int | None) -> float:
+    """Average of measure.k_mean over the points of X (streamed for structured designs)."""
+    if isinstance(X, StructuredDesign):
+        parts = [float(np.sum(measure.k_mean(P, K))) for P in X.iter_points(tile)]
+        return math.fsum(parts) / len(X)
+    return float(measure.k_mean(X, K).mean())
+
+
+def _is_stack(Z) -> bool:
+    """True for an (R, n, d) array of replicates."""
+    return (not isinstance(Z, (AnalyticalMeasure, StructuredDesign))
+            and not hasattr(Z, "__next__") and np.ndim(Z) == 3)
+
+
+def _stacked_mmd2(K: Callable, X, Y, biased: bool, tile: int | None, executor=None) -> np.ndarray:
+    """(R,) MMD^2 values when X and/or Y is a replicate stack (the other side may be
+    a shared (n,d) sample or an AnalyticalMeasure)."""
+    AM = AnalyticalMeasure
+    if isinstance(X, AM):
+        X, Y = Y, X                       # MMD is symmetric
+    X = np.asarray(X, float)
+    if X.ndim != 3:                       # then Y is the stack
+        X, Y = np.asarray(Y, float), X
+    R, n = X.shape[0], X.shape[1]
+
+    Sxx, Txx = _gram_sum_sym_stacked(K, X, tile, executor)
+    if biased or n < 2:
+        x_term = Sxx / (n * n)
+    else:
+        x_term = (Sxx - Txx) / (n * (n - 1))
+
+    if isinstance(Y, AM):
+        # exact integrals: k_self once, k_mean vectorized over all R*n points
+        return x_term + Y.k_self(K) - 2.0 * Y.k_mean(X, K).mean(axis=1)
+
+    Y = _as_points(Y) if np.ndim(Y) < 3 else np.asarray(Y, float)
+    if Y.ndim == 3 and Y.shape[0] != R:
+        raise ValueError(f"replicate stacks differ in length: {R} vs {Y.shape[0]}")
+    m = Y.shape[-2]
+    if Y.ndim == 3:
+        Syy, Tyy = _gram_sum_sym_stacked(K, Y, tile, executor)
+    else:
+        Syy, Tyy = _gram_sum_sym(K, Y, tile, executor)   # shared reference sample: once
+    Sxy = _gram_sum_stacked(K, X, Y, tile, executor)
+    if biased or n < 2 or m < 2:
+        return x_term + Syy / (m * m) - 2.0 * Sxy / (n * m)
+    return x_term + (Syy - Tyy) / (m * (m - 1)) - 2.0 * Sxy / (n * m)
+
 
 # ---------------------------------------------------------------------------
 # MMD (works for samples, sample-vs-measure, measure-vs-sample)
@@ -73,13 +210,24 @@ def mmd(
     nu: float = 1.5,
     biased: bool = True,
     return_squared: bool = False,
-) -> float:
+    tile: int | None = DEFAULT_TILE,
+    estimator: str | None = None,
+    block_size: int = 64,
+    return_variance: bool = False,
+    features: Any = None,
+    dtype=None,
+    executor: Any = None,
+    sparse: bool = False,
+    cache: Any = None,
+) -> float | np.ndarray | tuple[float, float] | tuple[np.ndarray, np.ndarray]:
     """
     Maximum Mean Discrepancy allowing arrays (samples) OR AnalyticalMeasure.
 
     Parameters
     ----------
-    X, Y : array-like (n,d)/(m,d) or AnalyticalMeasure
+    X, Y : array-like (n,d)/(m,d), StructuredDesign, or AnalyticalMeasure
+        Either side may also be a stack (R,n,d) of R replicates; the result
+        is then an (R,) array (see Notes).
     kernel : {'sqexp','se','matern','linear'} or callable K(A,B)
         - If a string, a batched kernel K(A,B) returning a (len(A), len(B)) Gram matrix.
         - If a callable, it may be batched (matrix) or pointwise (scalar).
@@ -88,6 +236,64 @@ def mmd(
     biased : bool   (True=biased includes diagonals; False=unbiased U-statistic
                      only when both sides are samples)
     return_squared : bool  (True → MMD^2; False → sqrt(max(MMD^2,0)))
+    tile : int or None     (edge length of the Gram tiles; None evaluates each
+                            Gram matrix in a single call)
+    estimator : {None, 'linear', 'block'}
+        None uses the full quadratic-time estimator chosen by `biased`.
+        'linear' is the O(n) paired-difference estimator; 'block' averages
+        unbiased U-statistics over disjoint blocks of `block_size` points.
+        Both need two samples, which may also be iterators of (k,d) chunks.
+    block_size : int        (points per sample and block for estimator='block')
+    return_variance : bool  (estimator='linear'/'block' only: also return the
+                             estimated variance of the MMD^2 estimate)
+    features : int or feature map, optional
+        Replace the kernel by K(a,b) ≈ Φ(a)·Φ(b) and compare mean embeddings in
+        O((n+m) D d) time and O(D) memory.  An int D builds
+        RandomFourierFeatures(D) for kernel 'se'/'matern' with this sigma/nu;
+        any object with transform(X) -> (n, D) (e.g. a RandomFourierFeatures
+        with sampler='kronecker', or a Nystrom factor) is used as is; an
+        unfitted Nystrom is first fitted on X and Y pooled.  Against
+        an AnalyticalMeasure both sides are taken in feature space: the
+        measure's mean embedding E_P[Φ(Z)] comes from its characteristic
+        function (random Fourier features) or from its k_mean at the landmarks
+        (Nystrom, fitted on the sample), so the estimate is the feature-space
+        MMD and the biased one is never negative.
+    dtype : numpy dtype, optional
+        Precision of the Gram tiles of a string kernel (e.g. np.float32).
+        Tile sums are still accumulated in float64 and combined with fsum;
+        stationary kernels re-center each tile pair before the distance
+        computation.  For callables, build the kernel with dtype (make_kernel,
+        make_cd_kernel).
+    executor : int or concurrent.futures.Executor, optional
+        Evaluate independent Gram tiles on a thread pool (an int n > 1 creates
+        one with n threads for this call).  Tile sums are collected in a fixed
+        order and combined with fsum, so the result is bitwise identical to
+        the serial one for a given tile.  Use a tile small enough to give
+        every worker several tiles.
+    sparse : bool, sparse matrix or tuple, default False
+        For compactly supported kernels (tagged with `support_radius`, e.g.
+        kernel='wendland1' with support radius sigma): assemble the Gram
+        matrices from a KD-tree neighbor search (sparse.sparse_gram), in
+        O(n k) time and memory for k neighbors per point.  To reuse Gram
+        matrices across calls, pass them instead of True: G =
+        sparse_gram(kernel, S) for a sample S against a measure, or
+        (Gxx, Gyy, Gxy) = (sparse_gram(kernel, X), sparse_gram(kernel, Y),
+        sparse_gram(kernel, X, Y)) for two samples (None entries are built).
+    cache : GramCache, optional
+        Disk cache (cache.py) for the Gram sums of the quadratic-time path,
+        keyed by the point arrays, kernel parameters and tile.  A repeated
+        call with the same inputs reads them back instead of re-evaluating
+        the Gram matrices.  Callable kernels are cached only if they can be
+        fingerprinted (ProductKernel, or a `cache_key` attribute).
+
+    Returns
+    -------
+    float, ndarray of shape (R,), or a tuple of two of them
+        MMD (or MMD^2 with return_squared=True); an (R,) array, one entry per
+        replicate, when X or Y is an (R,n,d) stack.  With estimator='linear'
+        or 'block' and return_variance=True, a tuple (value, var) instead, var
+        being the estimated variance of the MMD^2 estimate (two (R,) arrays
+        for stacks); return_variance is rejected without an estimator.
 
     Notes
     -----
@@ -97,86 +303,364 @@ def mmd(
     - If either side is an AnalyticalMeasure, its exact integrals are used.
       ‘unbiased’ then only applies to any sample side.
     - Measure-vs-measure (both analytic) cross term is not provided here.
+    - The Gram matrices are never stored: sums and traces are accumulated over
+      (tile x tile) blocks, and only the upper block triangle of Kxx / Kyy is
+      evaluated.  Samples with at most `tile` points use one kernel call.
+    - A classical L2 discrepancy kernel (make_cd_kernel, make_wraparound_kernel,
+      make_star_kernel, make_symmetric_kernel) against the matching
+      CDUniformMeasure / L2UniformMeasure uses the closed-form path of
+      classical.py.
+    - A Rank1Lattice / KroneckerSet design paired with a kernel tagged with
+      `k_tilde` (e.g. make_bernoulli_kernel) gets its K(X,X) sums in O(n d)
+      from the circulant / Toeplitz structure; the Gram is never formed.
+    - estimator='linear'/'block' return (value, var) when return_variance=True,
+      where var estimates Var(MMD^2 estimate); under X ~ Y the ratio
+      MMD^2 / sqrt(var) is asymptotically N(0,1), which gives a test threshold.
+    - Replicate stacks: with X of shape (R,n,d), Y may be a stack of the same
+      length, a shared (m,d) sample (its Gram sums are computed once) or an
+      AnalyticalMeasure (k_self once, k_mean on all R*n points in one call).
+      String kernels and ProductKernel evaluate (R, t, t) blocks in one call,
+      with t chosen so that R t^2 <= tile^2; other callables are looped over
+      the replicates.  With features= or estimator= the replicates are
+      processed one at a time.
     """
     AM = AnalyticalMeasure  # alias for isinstance checks
 
     X_is_meas = isinstance(X, AM)
     Y_is_meas = isinstance(Y, AM)
-
-    # Normalize arrays
-    if not X_is_meas:
-        X = np.asarray(X, float)
-        if X.ndim == 1:
-            X = X[:, None]
-    if not Y_is_meas:
-        Y = np.asarray(Y, float)
-        if Y.ndim == 1:
-            Y = Y[:, None]
+    if return_variance and estimator is None:
+        raise ValueError("return_variance requires estimator='linear' or 'block'.")
 
     # Kernel factory: if string, build batched K(A,B); if callable, use as-is
     if isinstance(kernel, str):
-        K = _make_kernel(kernel, sigma, nu=nu)["K"]
+        K = _make_kernel(kernel, sigma, nu=nu, dtype=dtype)["K"]
     else:
         K = kernel
 
-    # ---- both samples
-    if not X_is_meas and not Y_is_meas:
-        n, m = len(X), len(Y)
-        Kxx = K(X, X)
-        Kyy = K(Y, Y)
-        Kxy = K(X, Y)
-        if biased or n < 2 or m < 2:
-            mmd2 = Kxx.mean() + Kyy.mean() - 2.0 * Kxy.mean()
+    # ---- replicate stacks (R, n, d) -> (R,) results
+    if _is_stack(X) or _is_stack(Y):
+        if features is not None or estimator is not None or sparse is not False:
+            Xs = X if _is_stack(X) else None
+            Ys = Y if _is_stack(Y) else None
+            R = len(Xs) if Xs is not None else len(Ys)
+            out = [mmd(X if Xs is None else Xs[r], Y if Ys is None else Ys[r], kernel=kernel,
+                       sigma=sigma, nu=nu, biased=biased, return_squared=return_squared, tile=tile, estimator=estimator,
+                       block_size=block_size, return_variance=return_variance, features=features, dtype=dtype,
+                       executor=executor, sparse=sparse, cache=cache)
+                   for r in range(R)]
+            if return_variance:
+                return np.array([o[0] for o in out]), np.array([o[1] for o in out])
+            return np.array(out)
+        with _executor_scope(executor) as ex:
+            mmd2 = _stacked_mmd2(K, X, Y, biased, tile, ex)
+        return mmd2 if return_squared else np.sqrt(np.maximum(mmd2, 0.0))
+
+    # ---- feature-space (approximate kernel) MMD
+    if features is not None:
+        if X_is_meas and Y_is_meas:
+            raise NotImplementedError("features= needs at least one sample side.")
+        if hasattr(features, "transform"):
+            fmap = features
+        elif isinstance(kernel, str):
+            fmap = RandomFourierFeatures(int(features), kernel=kernel, sigma=sigma, nu=nu)
+        else:
+            raise ValueError("features=<int> needs a string kernel ('se' or 'matern').")
+        if X_is_meas or Y_is_meas:
+            S, P = (Y, X) if X_is_meas else (X, Y)
+            if not getattr(fmap, "fitted", True):
+                S = _as_points(S)                        # fit on the whole sample, not its first chunk
+                fmap.fit(S)
+            mmd2 = _feature_measure_mmd2(fmap, S, P, biased)
+        else:
+            if not getattr(fmap, "fitted", True):
+                # a data-dependent map (Nystrom) must see both samples, or Y gets no landmarks
+                if hasattr(X, "__next__") or hasattr(Y, "__next__"):
+                    raise ValueError("fit the feature map on both samples before streaming them as iterators.")
+                fmap.fit(_as_points(X), _as_points(Y))
+            mmd2 = _feature_mmd2(fmap, X, Y, biased)
+        return mmd2 if return_squared else np.sqrt(max(mmd2, 0.0))
+
+    # ---- linear / block estimators (two samples, streamed in chunks)
+    if estimator is not None:
+        if X_is_meas or Y_is_meas:
+            raise ValueError(f"estimator={estimator!r} needs two samples, not analytic measures.")
+        mmd2, var = _streaming_mmd2(K, X, Y, estimator, block_size)
+        val = mmd2 if return_squared else np.sqrt(max(mmd2, 0.0))
+        return (val, var) if return_variance else val
+
+    # ---- compactly supported kernels: sparse Gram from a neighbor search (or prebuilt)
+    if sparse is not None and sparse is not False:
+        from .sparse import _sparse_sums  # local import: sparse imports this module
+        if X_is_meas and Y_is_meas:
+            raise NotImplementedError("sparse=True needs at least one sample side.")
+        prebuilt = None if sparse is True else sparse
+        if X_is_meas or Y_is_meas:
+            if isinstance(prebuilt, tuple):
+                raise ValueError("against a measure, pass the sample's Gram G = sparse_gram(kernel, S) as sparse=.")
+            S, P = (_as_points(Y), X) if X_is_meas else (_as_points(X), Y)
+            n = len(S)
+            total, trace = _sparse_sums(K, S, G=prebuilt)
+            s_term = total / (n * n) if biased or n < 2 else (total - trace) / (n * (n - 1))
+            mmd2 = s_term + P.k_self(K) - 2.0 * float(P.k_mean(S, K).mean())
+        else:
+            if prebuilt is None:
+                prebuilt = (None, None, None)
+            if not isinstance(prebuilt, tuple) or len(prebuilt) != 3:
+                raise ValueError("for two samples, pass sparse=(Gxx, Gyy, Gxy) from sparse_gram.")
+            Gxx, Gyy, Gxy = prebuilt
+            X, Y = _as_points(X), _as_points(Y)
+            n, m = len(X), len(Y)
+            Sxx, Txx = _sparse_sums(K, X, G=Gxx)
+            Syy, Tyy = _sparse_sums(K, Y, G=Gyy)
+            Sxy = _sparse_sums(K, X, Y, G=Gxy)
+            if biased or n < 2 or m < 2:
+                mmd2 = Sxx / (n * n) + Syy / (m * m) - 2.0 * Sxy / (n * m)
+            else:
+                mmd2 = (Sxx - Txx) / (n * (n - 1)) + (Syy - Tyy) / (m * (m - 1)) - 2.0 * Sxy / (n * m)
+        return mmd2 if return_squared else np.sqrt(max(mmd2, 0.0))
+
+    # Normalize arrays; structured designs are kept when the kernel is shift invariant
+    fast_ok = hasattr(K, "k_tilde")
+    if not X_is_meas and not (fast_ok and isinstance(X, StructuredDesign)):
+        X = _as_points(X)
+    if not Y_is_meas and not (fast_ok and isinstance(Y, StructuredDesign)):
+        Y = _as_points(Y)
+
+    memo = _memo_for(cache, kernel, sigma, nu, dtype)
+    with _executor_scope(executor) as ex:
+        # ---- both samples
+        if not X_is_meas and not Y_is_meas:
+            n, m = len(X), len(Y)
+            Sxx, Txx = memo(("sym", X, tile), lambda: _self_sums(K, X, tile, ex))
+            Syy, Tyy = memo(("sym", Y, tile), lambda: _self_sums(K, Y, tile, ex))
+            Sxy = memo(("cross", X, Y, tile), lambda: _gram_sum(K, _as_points(X), _as_points(Y), tile, ex))
+            if biased or n < 2 or m < 2:
+                mmd2 = Sxx / (n * n) + Syy / (m * m) - 2.0 * Sxy / (n * m)
+            else:
+                mmd2 = (
+                    (Sxx - Txx) / (n * (n - 1))
+                    + (Syy - Tyy) / (m * (m - 1))
+                    - 2.0 * Sxy / (n * m)
+                )
+
+        # ---- classical L2 discrepancies: closed-form tile products (classical.py)
+        elif (X_is_meas != Y_is_meas) and _l2_kind(K, X if X_is_meas else Y, Y if X_is_meas else X):
+            from .classical import _l2_mmd2  # local import: classical imports measures -> core
+            S, P = (Y, X) if X_is_meas else (X, Y)
+            mmd2 = memo(("l2", P.l2_kind, S, P.l2_gamma, biased, tile),
+                        lambda: _l2_mmd2(P.l2_kind, S, P.l2_gamma, biased, tile, ex))
+
+        # ---- sample vs measure
+        elif not X_is_meas and Y_is_meas:
+            Kxx_term = _self_term(K, X, biased, tile, ex, memo)
+            kYY = Y.k_self(K)
+            kY_mean_over_x = _measure_mean(Y, X, K, tile)
+            mmd2 = Kxx_term + kYY - 2.0 * kY_mean_over_x
+
+        # ---- measure vs sample
+        elif X_is_meas and not Y_is_meas:
+            Kyy_term = _self_term(K, Y, biased, tile, ex, memo)
+            kXX = X.k_self(K)
+            kX_mean_over_y = _measure_mean(X, Y, K, tile)
+            mmd2 = kXX + Kyy_term - 2.0 * kX_mean_over_y
+
         else:
-            mmd2 = (
-                (Kxx.sum() - np.trace(Kxx)) / (n * (n - 1))
-                + (Kyy.sum() - np.trace(Kyy)) / (m * (m - 1))
-                - 2.0 * Kxy.mean()
+            raise NotImplementedError(
+                "Analytic measure vs analytic measure requires a provided cross expectation E[k(X,Y)]."
             )
 
-    # ---- sample vs measure
-    elif not X_is_meas and Y_is_meas:
-        n = len(X)
-        Kxx = K(X, X)
-        Kxx_term = (
-            Kxx.mean()
-            if (biased or n < 2)
-            else (Kxx.sum() - np.trace(Kxx)) / (n * (n - 1))
-        )
-        kYY = Y.k_self(K)
-        kY_mean_over_x = Y.k_mean(X, K).mean()
-        mmd2 = Kxx_term + kYY - 2.0 * kY_mean_over_x
-
-    # ---- measure vs sample
-    elif X_is_meas and not Y_is_meas:
-        m = len(Y)
-        Kyy = K(Y, Y)
-        Kyy_term = (
-            Kyy.mean()
-            if (biased or m < 2)
-            else (Kyy.sum() - np.trace(Kyy)) / (m * (m - 1))
-        )
-        kXX = X.k_self(K)
-        kX_mean_over_y = X.k_mean(Y, K).mean()
-        mmd2 = kXX + Kyy_term - 2.0 * kX_mean_over_y
+    return mmd2 if return_squared else np.sqrt(max(mmd2, 0.0))
 
+
+# ---------------------------------------------------------------------------
+# Bandwidth sweeps: many (sigma, nu) values from one distance pass per tile
+# ---------------------------------------------------------------------------
+def _profile_sums(profiles, D2: np.ndarray, diag: bool) -> tuple[np.ndarray, np.ndarray]:
+    """Sums (and traces, if diag) of f(D2) for every profile f."""
+    sums = np.empty(len(profiles))
+    traces = np.zeros(len(profiles))
+    for p, f in enumerate(profiles):
+        G = f(D2)
+        sums[p] = np.sum(G)
+        if diag:
+            traces[p] = np.trace(G)
+    return sums, traces
+
+
+def _fsum_columns(parts: list[np.ndarray], size: int) -> np.ndarray:
+    if not parts:
+        return np.zeros(size)
+    return np.array([math.fsum(col) for col in zip(*parts)])
+
+
+def _sweep_sym_sums(profiles, A: np.ndarray, tile: int | None) -> tuple[np.ndarray, np.ndarray]:
+    parts, diag = [], []
+    for si, sj, w in _sym_tile_pairs(len(A), tile):
+        sums, traces = _profile_sums(profiles, _pairwise_sq_dists(A[si], A[sj]), si is sj)
+        parts.append(w * sums)
+        if si is sj:
+            diag.append(traces)
+    return _fsum_columns(parts, len(profiles)), _fsum_columns(diag, len(profiles))
+
+
+def _sweep_cross_sums(profiles, A: np.ndarray, B: np.ndarray, tile: int | None) -> np.ndarray:
+    parts = []
+    for si in _tile_slices(len(A), tile):
+        for sj in _tile_slices(len(B), tile):
+            parts.append(_profile_sums(profiles, _pairwise_sq_dists(A[si], B[sj]), False)[0])
+    return _fsum_columns(parts, len(profiles))
+
+
+def mmd_sweep(
+    X,
+    Y,
+    sigmas,
+    *,
+    kernel: str = "se",
+    nus=None,
+    biased: bool = True,
+    return_squared: bool = False,
+    tile: int | None = DEFAULT_TILE,
+) -> np.ndarray:
+    """
+    MMD between two samples for many bandwidths in a single pass.
+
+    Parameters
+    ----------
+    X, Y : array-like (n,d)/(m,d)
+        Samples (analytic measures are not supported here).
+    sigmas : array-like of shape (S,)
+        Length scales to evaluate.
+    kernel : {'sqexp','se','matern'}
+        A stationary kernel name; the Gram matrices depend on the data only
+        through squared distances.
+    nus : array-like of shape (V,), optional
+        Matérn smoothness values (kernel='matern' only; default [1.5]).
+    biased, return_squared, tile : as in mmd().
+
+    Returns
+    -------
+    values : ndarray of shape (S,), or (V, S) when `nus` is given
+        values[..., s] equals mmd(X, Y, kernel=kernel, sigma=sigmas[s], nu=...).
+
+    Notes
+    -----
+    Each (tile x tile) block of squared distances is computed once and every
+    (nu, sigma) transform is applied to it, so a K-point sweep costs one
+    distance pass plus K cheap elementwise transforms per tile.
+    """
+    name = str(kernel).lower()
+    if name not in ("sqexp", "se", "matern"):
+        raise ValueError("mmd_sweep needs a stationary kernel name: 'sqexp', 'se' or 'matern'.")
+    if isinstance(X, AnalyticalMeasure) or isinstance(Y, AnalyticalMeasure):
+        raise TypeError("mmd_sweep compares two samples; use mmd() for analytic measures.")
+
+    X = _as_points(X)
+    Y = _as_points(Y)
+    sig = np.asarray(sigmas, float).reshape(-1)
+    nu_list = [1.5] if nus is None else list(np.asarray(nus, float).reshape(-1))
+    if name != "matern":
+        nu_list = nu_list[:1]
+    profiles = [_stationary_profile(name, float(s), nu=float(v)) for v in nu_list for s in sig]
+
+    n, m = len(X), len(Y)
+    Sxx, Txx = _sweep_sym_sums(profiles, X, tile)
+    Syy, Tyy = _sweep_sym_sums(profiles, Y, tile)
+    Sxy = _sweep_cross_sums(profiles, X, Y, tile)
+    if biased or n < 2 or m < 2:
+        mmd2 = Sxx / (n * n) + Syy / (m * m) - 2.0 * Sxy / (n * m)
     else:
-        raise NotImplementedError(
-            "Analytic measure vs analytic measure requires a provided cross expectation E[k(X,Y)]."
+        mmd2 = (
+            (Sxx - Txx) / (n * (n - 1))
+            + (Syy - Tyy) / (m * (m - 1))
+            - 2.0 * Sxy / (n * m)
         )
 
-    return mmd2 if return_squared else np.sqrt(max(mmd2, 0.0))
+    out = mmd2 if return_squared else np.sqrt(np.maximum(mmd2, 0.0))
+    if nus is not None and name == "matern":
+        return out.reshape(len(nu_list), sig.size)
+    return out
 
 
 # ---------------------------------------------------------------------------
 # Prefix MMD^2 for sample vs analytical measure: k = 1..n
 # ---------------------------------------------------------------------------
+def _is_batched(kernel: Callable, X: np.ndarray) -> bool:
+    """True if kernel(A, B) returns a (len(A), len(B)) Gram matrix."""
+    A = np.repeat(X[:1], 2, axis=0)
+    B = np.repeat(X[:1], 3, axis=0)
+    try:
+        return np.shape(kernel(A, B)) == (2, 3)
+    except Exception:
+        return False
+
+
+def _prefix_gram_sums_scalar(X: np.ndarray, kernel: Callable) -> np.ndarray:
+    """S_k = sum_{i,j<=k} k(x_i, x_j) by scalar pair evaluations (pointwise kernels)."""
+    n = X.shape[0]
+
+    def _k_scalar(a: np.ndarray, b: np.ndarray) -> float:
+        val = kernel(np.atleast_2d(a), np.atleast_2d(b))
+        arr = np.asarray(val)
+        if arr.ndim == 0:
+            return float(arr)
+        return float(arr.reshape(-1)[0])
+
+    S = np.zeros(n, dtype=float)
+    for k in range(n):
+        if k == 0:
+            S[k] = _k_scalar(X[0], X[0])
+        else:
+            xk = X[k]
+            cross = 0.0
+            for i in range(k):
+                cross += _k_scalar(X[i], xk)
+            S[k] = S[k - 1] + 2.0 * cross + _k_scalar(xk, xk)
+    return S
+
+
+def _prefix_gram_sums_blocked(
+    X: np.ndarray, kernel: Callable, block: int, tile: int | None, executor=None
+) -> np.ndarray:
+    """
+    S_k = sum_{i,j<=k} k(x_i, x_j) for a batched kernel, one block of new points at a time.
+
+    For a block B = X[s:e]:
+        cross_k = sum_{i<s} k(x_i, x_k)          (one K(X[:s], B) call per tile of rows)
+        inner_k = sum_{s<=i<k} k(x_i, x_k)       (strict upper triangle of K(B, B))
+        S_k     = S_{k-1} + 2 (cross_k + inner_k) + k(x_k, x_k)
+    """
+    n = X.shape[0]
+    def increments(sb):
+        Xb = X[sb]
+        G = np.asarray(kernel(Xb, Xb), float)
+        cross = np.zeros(len(Xb))
+        if sb.start > 0:
+            for sa in _tile_slices(sb.start, tile):
+                cross += np.asarray(kernel(X[sa], Xb), float).sum(axis=0)
+        inner = np.triu(G, 1).sum(axis=0)
+        return 2.0 * (cross + inner) + np.diag(G)
+
+    # blocks are independent given the history; only the running total is sequential
+    blocks = _tile_slices(n, block)
+    S = np.empty(n, dtype=float)
+    prev = 0.0
+    for sb, inc in zip(blocks, _map_tiles(increments, blocks, executor)):
+        S[sb] = prev + np.cumsum(inc)
+        prev = S[sb.stop - 1]
+    return S
+
+
 def mmd_prefix_against_measure(
     X: np.ndarray,
     kernel: Callable[[np.ndarray, np.ndarray], float]
     | Callable[[np.ndarray, np.ndarray], np.ndarray],
     measure: AnalyticalMeasure,
     return_sqrt: bool = False,
+    *,
+    block: int = 256,
+    tile: int | None = DEFAULT_TILE,
+    executor: Any = None,
 ) -> np.ndarray:
     """
     Compute prefix MMD^2 between the empirical sample X[0:k] and a continuous
@@ -195,42 +679,41 @@ def mmd_prefix_against_measure(
         Provides exact expectations via k_mean(x, K) and k_self(K).
     return_sqrt : bool, default False
         If True, return prefix MMD (sqrt); else MMD^2.
+    block : int, default 256
+        Number of new points processed per step for batched kernels.
+    tile : int or None, default DEFAULT_TILE
+        Maximum number of earlier points per kernel call when forming the
+        cross sums of a block against the history.
+    executor : int or concurrent.futures.Executor, optional
+        Process the blocks of new points on a thread pool (as in mmd()); the
+        running sums are assembled in block order, so the curve is bitwise
+        identical to the serial one.
 
     Returns
     -------
     mmd_prefix : (n,) array
         Prefix MMD^2 (or MMD if return_sqrt=True) for k=1..n.
+
+    Notes
+    -----
+    Batched kernels are evaluated block by block: each block costs one
+    K(history, block) call per tile plus one K(block, block) call, and the
+    running double sums follow from cumulative sums inside the block.
+    Pointwise kernels fall back to scalar pair evaluations (O(n^2) calls).
     """
     X = np.atleast_2d(np.asarray(X, float))
     n = X.shape[0]
 
-    # Adapt kernel to a scalar evaluator (works whether kernel is batched or scalar)
-    def _k_scalar(a: np.ndarray, b: np.ndarray) -> float:
-        A = np.atleast_2d(a)
-        B = np.atleast_2d(b)
-        val = kernel(A, B)
-        arr = np.asarray(val)
-        if arr.ndim == 0:
-            return float(arr)
-        # expect (1,1) for scalar pairs when batched
-        return float(arr.reshape(-1)[0])
+    if _is_batched(kernel, X):
+        with _executor_scope(executor) as ex:
+            S = _prefix_gram_sums_blocked(X, kernel, int(block), tile, ex)
+    else:
+        S = _prefix_gram_sums_scalar(X, kernel)
 
     # Exact expectations with THIS kernel
     mu_vals = measure.k_mean(X, kernel)  # shape (n,)
     cumsum_mu = np.cumsum(mu_vals)
 
-    # Stream S_k = sum_{i<=k}\sum_{j<=k} k(x_i, x_j)
-    S = np.zeros(n, dtype=float)
-    for k in range(n):
-        if k == 0:
-            S[k] = _k_scalar(X[0], X[0])
-        else:
-            xk = X[k]
-            cross = 0.0
-            for i in range(k):
-                cross += _k_scalar(X[i], xk)
-            S[k] = S[k - 1] + 2.0 * cross + _k_scalar(xk, xk)
-
     kappa = measure.k_self(kernel)
 
     ks = np.arange(1, n + 1, dtype=float)
@@ -238,4 +721,4 @@ def mmd_prefix_against_measure(
 
     if return_sqrt:
         return np.sqrt(np.clip(mmd2_prefix, 0.0, None))
-    return mmd2_prefix
\ No newline at end of file
+    return mmd2_prefix
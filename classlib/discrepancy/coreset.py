@@ -0,0 +1,220 @@
+"""
+Coresets: small point sets with low MMD to a large sample.
+
+- Kernel herding (Chen, Welling & Smola, 2010) picks points greedily,
+
+      x_{t+1} = argmax_i  μ(x_i) - (1/(t+1)) sum_{s<=t} k(x_i, x_s),
+
+  where μ(x) = mean_j k(x, x_j) is the sample's mean embedding.  One
+  K(X, x_t) column per step: O(n m d) for m points.
+- Kernel thinning by Compress (Shetty, Dwivedi & Mackey, 2022) with greedy
+  kernel halving: the sample is split into four parts, each part is
+  compressed recursively, and the concatenation is halved.  Halving pairs
+  consecutive points (a, b) and keeps whichever of the two reduces the norm
+  of the signed sum ψ = sum (k(·, kept) - k(·, dropped)).  The output of
+  Compress has 2^g sqrt(n) points and costs O(4^g n log n) kernel
+  evaluations; it is then halved down to the requested size.
+
+Both return (points, idx, mmd), where mmd is the MMD between the coreset and
+the full sample.
+
+Public:
+- kernel_herding(X, m, ...)
+- kernel_thinning(X, m, ...)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+import math
+import numpy as np
+
+from .core import mmd
+from .kernels import _make_kernel
+from .tiling import DEFAULT_TILE, _tile_slices
+
+__all__ = ["kernel_herding", "kernel_thinning"]
+
+
+def _as_sample(X) -> np.ndarray:
+    X = np.asarray(X, float)
+    return X[:, None] if X.ndim == 1 else X
+
+
+def _mean_embedding(K: Callable, X: np.ndarray, R: np.ndarray, tile: int | None) -> np.ndarray:
+    """mean_j k(x_i, r_j) for every row of X, in (tile x tile) blocks."""
+    mu = np.zeros(len(X))
+    for si in _tile_slices(len(X), tile):
+        for sj in _tile_slices(len(R), tile):
+            mu[si] += np.asarray(K(X[si], R[sj]), float).sum(axis=1)
+    return mu / len(R)
+
+
+def _herd(K: Callable, X: np.ndarray, mu: np.ndarray, m: int, tile: int | None) -> np.ndarray:
+    """Indices of m herding steps over the candidate rows of X (without repeats)."""
+    n = len(X)
+    acc = np.zeros(n)                    # sum_{s<=t} k(x_i, x_s)
+    taken = np.zeros(n, dtype=bool)
+    idx = np.empty(m, dtype=np.int64)
+    for t in range(m):
+        score = mu - acc / (t + 1)
+        score[taken] = -np.inf
+        i = int(np.argmax(score))
+        idx[t] = i
+        taken[i] = True
+        for s in _tile_slices(n, tile):
+            acc[s] += np.asarray(K(X[s], X[i:i + 1]), float)[:, 0]
+    return idx
+
+
+def _coreset_mmd(K: Callable, X: np.ndarray, idx: np.ndarray, tile: int | None) -> float:
+    return float(mmd(X, X[idx], kernel=K, tile=tile))
+
+
+def kernel_herding(
+    X,
+    m: int,
+    *,
+    kernel: Any = "se",
+    sigma: float = 1.0,
+    nu: float = 1.5,
+    n_ref: Optional[int] = 4096,
+    rng: Optional[np.random.Generator | int] = None,
+    tile: int | None = DEFAULT_TILE,
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """
+    Greedy kernel herding: m points of X that track its mean embedding.
+
+    Parameters
+    ----------
+    X : array-like (n, d)
+        Sample to compress (e.g. MCMC output).
+    m : int
+        Coreset size.
+    kernel, sigma, nu, tile : as in mmd().
+    n_ref : int or None, default 4096
+        The mean embedding μ is estimated from a uniform subsample of n_ref
+        rows (O(n n_ref) kernel evaluations); None uses all n rows (O(n^2)).
+    rng : np.random.Generator | int | None
+        Random generator or seed for the reference subsample.
+
+    Returns
+    -------
+    points : (m, d) array, in selection order
+    idx : (m,) int array of row indices into X
+    mmd : float
+        MMD between the coreset and the full sample.
+    """
+    X = _as_sample(X)
+    n = len(X)
+    m = int(m)
+    if not 1 <= m <= n:
+        raise ValueError(f"m must be between 1 and n={n}, got {m}")
+    K = _make_kernel(kernel, sigma, nu=nu)["K"]
+    if n_ref is not None and n_ref < n:
+        ref = X[np.random.default_rng(rng).choice(n, int(n_ref), replace=False)]
+    else:
+        ref = X
+    idx = _herd(K, X, _mean_embedding(K, X, ref, tile), m, tile)
+    return X[idx], idx, _coreset_mmd(K, X, idx, tile)
+
+
+# ---------------------------------------------------------------------------
+# Kernel thinning: Compress + greedy kernel halving
+# ---------------------------------------------------------------------------
+def _halve(K: Callable, X: np.ndarray, idx: np.ndarray, block: int) -> np.ndarray:
+    """
+    Greedy kernel halving of the rows idx of X: keep one point of each consecutive pair.
+
+    With w_j = +1 for kept and -1 for dropped points seen so far, the pair
+    (a, b) keeps a iff <ψ, k(·,a) - k(·,b)> = sum_j w_j [k(x_j,a) - k(x_j,b)] <= 0.
+    Pairs are processed in blocks: one K(points so far, block) call per block.
+    An unpaired last point is kept.
+    """
+    L = len(idx)
+    P = X[idx]
+    n_pairs = L // 2
+    w = np.zeros(L)
+    keep = np.empty(n_pairs + L % 2, dtype=np.int64)
+    step = max(int(block), 1)
+    for p0 in range(0, n_pairs, step):
+        p1 = min(p0 + step, n_pairs)
+        hi = 2 * p1
+        C = np.asarray(K(P[:hi], P[2 * p0:hi]), float)    # (hi, 2 (p1 - p0))
+        D = C[:, 0::2] - C[:, 1::2]                        # k(x_j, a) - k(x_j, b) per pair
+        for q in range(p1 - p0):
+            p = p0 + q
+            a = 2 * p
+            s = 1.0 if w[:hi] @ D[:, q] <= 0.0 else -1.0
+            w[a], w[a + 1] = s, -s
+            keep[p] = a if s > 0 else a + 1
+    if L % 2:
+        keep[-1] = L - 1
+    return idx[keep]
+
+
+def _compress(K: Callable, X: np.ndarray, idx: np.ndarray, g: int, block: int) -> np.ndarray:
+    """Compress: 2^g sqrt(len(idx)) points (sets of at most 4^g points are returned as is)."""
+    if len(idx) <= 4 ** g:
+        return idx
+    parts = np.array_split(idx, 4)
+    coreset = np.concatenate([_compress(K, X, part, g, block) for part in parts])
+    return _halve(K, X, coreset, block)
+
+
+def kernel_thinning(
+    X,
+    m: int,
+    *,
+    kernel: Any = "se",
+    sigma: float = 1.0,
+    nu: float = 1.5,
+    g: int = 2,
+    block: int = 64,
+    tile: int | None = DEFAULT_TILE,
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """
+    Kernel thinning by Compress with greedy kernel halving.
+
+    Parameters
+    ----------
+    X : array-like (n, d)
+        Sample to compress, in its original order (e.g. an MCMC chain).
+    m : int
+        Coreset size.
+    kernel, sigma, nu, tile : as in mmd().
+    g : int, default 2
+        Oversampling parameter of Compress: its output has about 2^g sqrt(n)
+        points and costs O(4^g n log n) kernel evaluations.  Raised
+        automatically when 2^g sqrt(n) < m.
+    block : int, default 64
+        Pairs resolved per kernel call inside each halving round.
+
+    Returns
+    -------
+    points : (m, d) array
+    idx : (m,) int array of row indices into X
+    mmd : float
+        MMD between the coreset and the full sample.
+
+    Notes
+    -----
+    The Compress output is halved while it has at least 2m points; the last
+    set (between m and 2m points) is reduced to exactly m by kernel herding
+    toward its own mean embedding.
+    """
+    X = _as_sample(X)
+    n = len(X)
+    m = int(m)
+    if not 1 <= m <= n:
+        raise ValueError(f"m must be between 1 and n={n}, got {m}")
+    K = _make_kernel(kernel, sigma, nu=nu)["K"]
+
+    g = max(int(g), math.ceil(math.log2(max(m / math.sqrt(n), 1.0))))
+    idx = _compress(K, X, np.arange(n), g, block)
+    while len(idx) >= 2 * m:
+        idx = _halve(K, X, idx, block)
+    if len(idx) > m:
+        C = X[idx]
+        idx = idx[_herd(K, C, _mean_embedding(K, C, C, tile), m, tile)]
+    return X[idx], idx, _coreset_mmd(K, X, idx, tile)
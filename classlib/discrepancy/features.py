@@ -0,0 +1,217 @@
+"""
+Finite-dimensional feature maps Φ with K(a, b) ≈ Φ(a)·Φ(b).
+
+With a feature map the MMD is the distance between mean embeddings,
+
+    MMD^2 ≈ || mean_i Φ(x_i) - mean_j Φ(y_j) ||^2,
+
+which costs O((n+m) D d) time and O(D) memory (inputs are streamed in chunks).
+
+Public:
+- RandomFourierFeatures(n_features, kernel="se", sigma=1.0, nu=1.5, sampler=None, seed=None)
+
+Internal:
+- _feature_mmd2(fmap, X, Y, biased)
+- _feature_measure_mmd2(fmap, X, P, biased)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+import numpy as np
+
+from .kernels import _make_kernel
+from .streaming import _iter_chunks
+
+__all__ = ["RandomFourierFeatures", "_feature_mmd2", "_feature_measure_mmd2"]
+
+
+class RandomFourierFeatures:
+    """
+    Random Fourier features for the stationary "se" and "matern" kernels.
+
+    Bochner's theorem writes k(a - b) = E_ω[cos(ω·(a - b))] for ω drawn from
+    the kernel's spectral density; with m = D/2 frequencies
+
+        Φ(x) = [cos(W x), sin(W x)] / sqrt(m),   W = (ω_1, ..., ω_m).
+
+    Spectral densities:
+      - "se"/"sqexp": ω = z / σ,                   z ~ N(0, I_d)
+      - "matern":     ω = z sqrt(2ν / u) / σ,       u ~ χ²_{2ν}  (multivariate t)
+
+    Parameters
+    ----------
+    n_features : int
+        Feature dimension D (rounded up to an even number).
+    kernel : {'se','sqexp','matern'}
+    sigma, nu : float
+        Length scale and Matérn smoothness, as in make_kernel().
+    sampler : None, 'kronecker', or object with gen_samples(n)
+        Source of the uniforms mapped to frequencies.  None draws IID uniforms
+        from `seed`; 'kronecker' uses a randomly shifted QPKronecker sequence
+        (lower approximation error); any generator returning (n, d) (or
+        (n, d+1) for Matérn) uniforms may be passed.
+    seed : int or None
+        Seed for the IID draws or the Kronecker shift.
+
+    Notes
+    -----
+    Frequencies are drawn on first use, when the dimension d is known.  The
+    object is itself a kernel: K(A, B) returns Φ(A) Φ(B)^T.  For a measure P
+    with a characteristic function φ_P, E_P[Φ(Z)] = [Re φ_P(W), Im φ_P(W)] / sqrt(m)
+    exactly (mean_embedding).
+    """
+
+    def __init__(
+        self,
+        n_features: int = 512,
+        *,
+        kernel: str = "se",
+        sigma: float = 1.0,
+        nu: float = 1.5,
+        sampler: Any = None,
+        seed: Optional[int] = None,
+    ):
+        name = str(kernel).lower()
+        if name not in ("se", "sqexp", "matern"):
+            raise ValueError("RandomFourierFeatures supports the stationary kernels 'se'/'sqexp' and 'matern'.")
+        self.kernel_name = name
+        self.sigma = float(sigma)
+        self.nu = float(nu)
+        self.m = (int(n_features) + 1) // 2
+        self.sampler = sampler
+        self.seed = seed
+        self.W: np.ndarray | None = None
+
+    @property
+    def n_features(self) -> int:
+        return 2 * self.m
+
+    def _uniforms(self, k: int) -> np.ndarray:
+        if self.sampler is None:
+            U = np.random.default_rng(self.seed).random((self.m, k))
+        else:
+            gen = self.sampler
+            if isinstance(gen, str):
+                if gen.lower() != "kronecker":
+                    raise ValueError("sampler must be None, 'kronecker', or an object with gen_samples(n).")
+                from ..generators.kronecker_qp import QPKronecker
+                gen = QPKronecker(k, randomize=True, seed=self.seed)
+            U = np.asarray(gen.gen_samples(self.m), float)[:, :k]
+        eps = np.finfo(float).eps
+        return np.clip(U, eps, 1.0 - eps)
+
+    def _draw(self, d: int) -> None:
+        from scipy.special import ndtri, gammaincinv
+        if self.kernel_name == "matern":
+            U = self._uniforms(d + 1)
+            chi2 = 2.0 * gammaincinv(self.nu, U[:, d])          # χ²_{2ν} = 2 Gamma(ν, 1)
+            Z = ndtri(U[:, :d]) * np.sqrt(2.0 * self.nu / chi2)[:, None]
+        else:
+            Z = ndtri(self._uniforms(d))
+        self.W = Z / self.sigma                                  # (m, d)
+
+    def transform(self, X) -> np.ndarray:
+        """Feature matrix Φ(X) of shape (n, D)."""
+        X = np.atleast_2d(np.asarray(X, float))
+        if self.W is None:
+            self._draw(X.shape[1])
+        if X.shape[1] != self.W.shape[1]:
+            raise ValueError(f"features were drawn for d={self.W.shape[1]}, got d={X.shape[1]}")
+        P = X @ self.W.T
+        return np.hstack([np.cos(P), np.sin(P)]) / np.sqrt(self.m)
+
+    def mean_embedding(self, measure) -> np.ndarray:
+        """E_{Z~P}[Φ(Z)] of shape (D,) from measure.characteristic(W)."""
+        if self.W is None:
+            raise ValueError("frequencies are not drawn yet; transform a sample first.")
+        phi = measure.characteristic(self.W)
+        return np.concatenate([phi.real, phi.imag]) / np.sqrt(self.m)
+
+    def __call__(self, A, B) -> np.ndarray:
+        return self.transform(A) @ self.transform(B).T
+
+    def paired(self, A, B) -> np.ndarray:
+        return np.einsum("ij,ij->i", self.transform(A), self.transform(B))
+
+    def exact_kernel(self):
+        """The kernel being approximated, as a batched callable."""
+        return _make_kernel(self.kernel_name, self.sigma, nu=self.nu)["K"]
+
+    def error_estimate(self, X, Y, n_sub: int = 1000, *, biased: bool = True, rng=None) -> dict:
+        """
+        Compare the approximation with the exact kernel on random subsamples.
+
+        Returns a dict with the exact and approximate MMD^2 of the subsamples,
+        their absolute difference, and the relative Frobenius error of the
+        approximate Gram matrix of the pooled subsample.
+        """
+        from .core import mmd  # local import: core imports this module
+
+        rng = np.random.default_rng(rng)
+        X = np.atleast_2d(np.asarray(X, float))
+        Y = np.atleast_2d(np.asarray(Y, float))
+        Xs = X[rng.choice(len(X), min(n_sub, len(X)), replace=False)]
+        Ys = Y[rng.choice(len(Y), min(n_sub, len(Y)), replace=False)]
+        K = self.exact_kernel()
+        exact = mmd(Xs, Ys, kernel=K, biased=biased, return_squared=True)
+        approx = _feature_mmd2(self, Xs, Ys, biased)
+        Z = np.vstack([Xs, Ys])
+        G = K(Z, Z)
+        rel = float(np.linalg.norm(self(Z, Z) - G) / np.linalg.norm(G))
+        return {
+            "mmd2_exact": float(exact),
+            "mmd2_approx": float(approx),
+            "abs_error": float(abs(approx - exact)),
+            "gram_rel_error": rel,
+        }
+
+    def __repr__(self) -> str:
+        return (f"RandomFourierFeatures(n_features={self.n_features}, kernel={self.kernel_name!r}, "
+                f"sigma={self.sigma}, nu={self.nu}, sampler={self.sampler!r})")
+
+
+def _embedding_sums(fmap, Z) -> tuple[np.ndarray | None, float, int]:
+    """Streamed (sum_i Φ(z_i), sum_i ||Φ(z_i)||^2, count)."""
+    total, sq, count = None, 0.0, 0
+    for C in _iter_chunks(Z):
+        F = fmap.transform(C)
+        total = F.sum(axis=0) if total is None else total + F.sum(axis=0)
+        sq += float(np.einsum("ij,ij->", F, F))
+        count += len(F)
+    return total, sq, count
+
+
+def _feature_mmd2(fmap, X, Y, biased: bool = True) -> float:
+    """
+    MMD^2 under K(a, b) = Φ(a)·Φ(b) from mean embeddings.
+
+    Unbiased: (||Σ Φ(x_i)||^2 - Σ ||Φ(x_i)||^2) / (n(n-1)) + (same for Y)
+              - 2 mean Φ(X) · mean Φ(Y).
+    """
+    sx, qx, n = _embedding_sums(fmap, X)
+    sy, qy, m = _embedding_sums(fmap, Y)
+    if biased or n < 2 or m < 2:
+        diff = sx / n - sy / m
+        return float(diff @ diff)
+    return float((sx @ sx - qx) / (n * (n - 1)) + (sy @ sy - qy) / (m * (m - 1))
+                 - 2.0 * (sx @ sy) / (n * m))
+
+
+def _feature_measure_mmd2(fmap, X, P, biased: bool = True) -> float:
+    """
+    MMD^2 between a sample and an AnalyticalMeasure under K(a, b) = Φ(a)·Φ(b).
+
+    Both sides live in feature space: ||mean Φ(X) - μ_P||^2 with
+    μ_P = fmap.mean_embedding(P); the unbiased form drops the diagonal of the
+    sample term as in _feature_mmd2.
+    """
+    if not hasattr(fmap, "mean_embedding"):
+        raise ValueError("features= against an AnalyticalMeasure needs a feature map with "
+                         "mean_embedding(measure) (RandomFourierFeatures or Nystrom).")
+    sx, qx, n = _embedding_sums(fmap, X)                 # draws / fits the map first
+    mu = np.asarray(fmap.mean_embedding(P), float)
+    if biased or n < 2:
+        diff = sx / n - mu
+        return float(diff @ diff)
+    return float((sx @ sx - qx) / (n * (n - 1)) + mu @ mu - 2.0 * (sx @ mu) / n)
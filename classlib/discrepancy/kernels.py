@@ -4,47 +4,111 @@ Kernel builders and helpers.
 Public:
 - make_kernel(kernel="se", sigma=1.0, nu=1.5, domain=None)
 - restrict_to_unit_cube(K)
+- ProductKernel(term, params, ...)      separable kernels, one coordinate at a time
+- make_cd_kernel(d, gamma)
+- make_wraparound_kernel(d, gamma), make_star_kernel(d, gamma), make_symmetric_kernel(d, gamma)
+- make_bernoulli_kernel(d, gamma)
+- make_sobolev_kernel(d, gamma)
+- make_matern_product_kernel(d, sigma, nu)
 
 Internal:
 - _make_kernel(name_or_callable, sigma, nu)
+- _stationary_profile(name, sigma, nu)   f with K(A,B) = f(squared distances)
+- _paired_eval(K, A, B)                  k(a_i, b_i) for matching rows
+- _stacked_eval(K, A, B)                 Gram matrices of replicate stacks (R, n, d)
 """
 
 from __future__ import annotations
 from typing import Callable, Any
+from functools import partial
+import math
+import os
 import numpy as np
 
-__all__ = ["make_kernel", "restrict_to_unit_cube", "_make_kernel"]
+__all__ = [
+    "make_kernel", "restrict_to_unit_cube", "ProductKernel",
+    "make_cd_kernel", "make_wraparound_kernel", "make_star_kernel", "make_symmetric_kernel",
+    "make_bernoulli_kernel", "make_sobolev_kernel", "make_matern_product_kernel",
+    "_make_kernel", "_stationary_profile", "_pairwise_sq_dists", "_paired_eval", "_stacked_eval",
+]
 
 # ------- core math helpers -------
 
-def _pairwise_sq_dists(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+def _pairwise_sq_dists(A: np.ndarray, B: np.ndarray, dtype=None) -> np.ndarray:
+    """
+    Squared distances of shape (..., nA, nB); leading (replicate) axes broadcast.
+
+    With a reduced-precision dtype both blocks are first re-centered on the
+    mean of A (in float64), so that ||a||^2 + ||b||^2 - 2 a·b does not cancel
+    when the points lie far from the origin; negative round-off is clipped.
+    """
     A = np.atleast_2d(np.asarray(A, float))
     B = np.atleast_2d(np.asarray(B, float))
-    A2 = np.sum(A*A, axis=1, keepdims=True)
-    B2 = np.sum(B*B, axis=1, keepdims=True).T
-    return A2 + B2 - 2.0 * (A @ B.T)
+    low = dtype is not None and np.dtype(dtype) != np.float64
+    if low:
+        c = A.mean(axis=-2, keepdims=True)
+        A = (A - c).astype(dtype)
+        B = (B - c).astype(dtype)
+    A2 = np.sum(A*A, axis=-1)[..., :, None]
+    B2 = np.sum(B*B, axis=-1)[..., None, :]
+    D2 = A2 + B2 - 2.0 * (A @ np.swapaxes(B, -1, -2))
+    if low:
+        np.maximum(D2, 0.0, out=D2)
+    return D2
 
-# ------- kernel factories -------
+def _rowwise_sq_dists(A: np.ndarray, B: np.ndarray, dtype=None) -> np.ndarray:
+    """||a_i - b_i||^2 for matching rows of A and B."""
+    D = np.atleast_2d(np.asarray(A, float)) - np.atleast_2d(np.asarray(B, float))
+    if dtype is not None:
+        D = D.astype(dtype)
+    return np.einsum("ij,ij->i", D, D)
 
-def _make_kernel(name_or_callable: Any, sigma: float, nu: float = 1.5) -> dict:
+def _paired_eval(K: Callable, A: np.ndarray, B: np.ndarray, chunk: int = 64) -> np.ndarray:
     """
-    Return {'K': K} where K(A,B)->Gram(n,m).
-    name_or_callable ∈ {"sqexp","se","matern","linear"} or a callable.
+    k(a_i, b_i) for matching rows of A and B.
+
+    Uses K.paired when the kernel provides it; otherwise takes the diagonal of
+    small (chunk x chunk) Gram blocks.
     """
-    if callable(name_or_callable):
-        return {"K": name_or_callable}
+    paired = getattr(K, "paired", None)
+    if paired is not None:
+        return np.asarray(paired(A, B), float)
+    out = np.empty(len(A))
+    for s in range(0, len(A), chunk):
+        out[s:s + chunk] = np.diag(np.asarray(K(A[s:s + chunk], B[s:s + chunk]), float))
+    return out
 
-    name = (name_or_callable or "sqexp").lower()
+def _stacked_eval(K: Callable, A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """
+    Gram matrices K(A[r], B[r]) of shape (R, nA, nB) for replicate stacks.
+
+    A and B are (R, n, d) stacks or a shared (n, d) array.  Kernels tagged
+    with `stacked` evaluate all replicates in one broadcast call; other
+    callables are looped over the replicate axis.
+    """
+    if getattr(K, "stacked", False):
+        return np.asarray(K(A, B), float)
+    R = A.shape[0] if A.ndim == 3 else B.shape[0]
+    return np.stack([np.asarray(K(A[r] if A.ndim == 3 else A, B[r] if B.ndim == 3 else B), float)
+                     for r in range(R)])
+
+# ------- kernel factories -------
+
+def _stationary_profile(name: str, sigma: float, nu: float = 1.5) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Return f with K(A,B) = f(D2), D2 = squared distances, for name ∈ {"sqexp","se","matern"}.
 
+    Splitting the distance pass from the elementwise transform lets several
+    bandwidths share one D2 (see core.mmd_sweep).
+    """
     if name in ("sqexp", "se"):  # squared exponential
         two_sig2 = 2.0 * (sigma * sigma)
-        def K(A, B):
-            return np.exp(-_pairwise_sq_dists(A, B) / two_sig2)
-        return {"K": K}
+        def f(D2):
+            return np.exp(-D2 / two_sig2)
+        return f
 
     if name == "matern":
-        def K(A, B):
-            D2 = _pairwise_sq_dists(A, B)
+        def f(D2):
             r = np.sqrt(np.maximum(D2, 0.0))
             ell = float(sigma)
             if np.isclose(nu, 0.5):  # exponential
@@ -63,12 +127,70 @@ def _make_kernel(name_or_callable: Any, sigma: float, nu: float = 1.5) -> dict:
                 c = (2.0**(1.0 - nu)) / gamma(nu)
                 out[mask] = c * (s[mask]**nu) * kv(nu, s[mask]); out[~mask] = 1.0
                 return out
+        return f
+
+    raise ValueError(f"No stationary profile for kernel {name!r}; use 'sqexp','se' or 'matern'.")
+
+def _wendland(r: np.ndarray, k: int, d: int) -> np.ndarray:
+    """
+    Wendland function φ_{d,k}(r), supported on r <= 1, with φ(0) = 1 and
+    ℓ = floor(d/2) + k + 1 (positive definite on R^d):
+      k=0: (1-r)_+^ℓ
+      k=1: (1-r)_+^{ℓ+1} ((ℓ+1) r + 1)
+      k=2: (1-r)_+^{ℓ+2} ((ℓ^2+4ℓ+3) r^2 + (3ℓ+6) r + 3) / 3
+    """
+    ell = d // 2 + k + 1
+    t = np.maximum(1.0 - r, 0.0)
+    if k == 0:
+        return t**ell
+    if k == 1:
+        return t**(ell + 1) * ((ell + 1) * r + 1.0)
+    return t**(ell + 2) * ((ell * ell + 4 * ell + 3) * r * r + (3 * ell + 6) * r + 3.0) / 3.0
+
+def _make_kernel(name_or_callable: Any, sigma: float, nu: float = 1.5, dtype=None) -> dict:
+    """
+    Return {'K': K} where K(A,B)->Gram(n,m).
+    name_or_callable ∈ {"sqexp","se","matern","linear","wendland0/1/2"} or a callable.
+    dtype (e.g. np.float32) sets the precision of the Gram entries of named
+    kernels; callables are returned unchanged.
+    """
+    if callable(name_or_callable):
+        return {"K": name_or_callable}
+
+    name = (name_or_callable or "sqexp").lower()
+
+    if name in ("sqexp", "se", "matern"):
+        f = _stationary_profile(name, sigma, nu)
+        def K(A, B):
+            return f(_pairwise_sq_dists(A, B, dtype))
+        K.paired = lambda A, B: f(_rowwise_sq_dists(A, B, dtype))
+        K.stacked = True
+        return {"K": K}
+
+    if name in ("wendland0", "wendland1", "wendland2"):
+        # compactly supported: k(a, b) = φ_{d,k}(||a-b|| / sigma), zero beyond sigma
+        k = int(name[-1])
+        rho = float(sigma)
+        def radial(r, d):
+            return _wendland(np.asarray(r) / rho, k, d)
+        def K(A, B):
+            A = np.atleast_2d(A)
+            return radial(np.sqrt(np.maximum(_pairwise_sq_dists(A, B, dtype), 0.0)), A.shape[-1])
+        K.paired = lambda A, B: radial(np.sqrt(_rowwise_sq_dists(A, B, dtype)), np.shape(A)[-1])
+        K.stacked = True
+        K.radial = radial                  # value from distances (sparse assembly)
+        K.support_radius = rho
         return {"K": K}
 
     if name == "linear":
-        return {"K": (lambda A, B: np.atleast_2d(A) @ np.atleast_2d(B).T)}
+        dt = np.dtype(float if dtype is None else dtype)
+        def K(A, B):
+            return np.atleast_2d(np.asarray(A, dt)) @ np.swapaxes(np.atleast_2d(np.asarray(B, dt)), -1, -2)
+        K.paired = lambda A, B: np.einsum("ij,ij->i", np.atleast_2d(np.asarray(A, dt)), np.atleast_2d(np.asarray(B, dt)))
+        K.stacked = True
+        return {"K": K}
 
-    raise ValueError("Unknown kernel. Use 'sqexp','se','matern','linear', or a callable.")
+    raise ValueError("Unknown kernel. Use 'sqexp','se','matern','linear','wendland0/1/2', or a callable.")
 
 # ------- domain enforcement for [0,1]^d -------
 
@@ -93,28 +215,293 @@ def restrict_to_unit_cube(K: Callable[[np.ndarray, np.ndarray], np.ndarray]):
         return K(A, B)
     return K_restricted
 
-def make_kernel(kernel: Any = "se", sigma: float = 1.0, nu: float = 1.5, domain: str | None = None):
+def make_kernel(kernel: Any = "se", sigma: float = 1.0, nu: float = 1.5, domain: str | None = None,
+                features: int | None = None, sampler: Any = None, seed: int | None = None,
+                dtype=None):
     """
     Build a kernel callable for passing to mmd(..., kernel=<callable>).
 
+    kernel "wendland0" / "wendland1" / "wendland2" is the compactly supported
+    Wendland kernel φ_{d,k}(||a-b|| / sigma) (C^0 / C^2 / C^4), exactly zero
+    beyond distance sigma; see sparse.sparse_gram for O(n k) Gram assembly.
+
     domain:
       None    → no domain check (R^d).
       "unit"  → strictly enforce inputs in [0,1]^d (raise if violated).
+
+    features:
+      None    → exact kernel.
+      D (int) → random Fourier feature approximation with D features of the
+                "se"/"matern" kernel (see features.RandomFourierFeatures;
+                `sampler` and `seed` are passed through).
+
+    dtype:
+      None         → float64 Gram entries.
+      np.float32   → float32 Gram entries (half the memory traffic per tile);
+                     mmd() still accumulates tile sums in float64.
     """
-    K = _make_kernel(kernel, sigma, nu=nu)["K"]
+    if features is not None:
+        from .features import RandomFourierFeatures  # features imports this module
+        K = RandomFourierFeatures(features, kernel=kernel, sigma=sigma, nu=nu,
+                                  sampler=sampler, seed=seed)
+    else:
+        K = _make_kernel(kernel, sigma, nu=nu, dtype=dtype)["K"]
     if domain == "unit":
         K = restrict_to_unit_cube(K)
     return K
 
-# --- Centered Discrepancy kernel (product form on [0,1]^d) ---
+# --- Separable (product) kernels ---
+
+class ProductKernel:
+    """
+    Separable kernel K(a, b) = ∏_{j=1}^d k_j(a_j, b_j), evaluated one coordinate
+    at a time into a single (nA, nB) accumulator.
 
-def _cd_term_1d(a: np.ndarray, b: np.ndarray, g: float) -> np.ndarray:
-    """Return the 1D matrix: 1 + (g^2/2)(|a-1/2| + |b-1/2| - |a-b|)."""
-    return 1.0 + 0.5*(g*g)*(np.abs(a - 0.5) + np.abs(b - 0.5) - np.abs(a - b))
+    Parameters
+    ----------
+    term : callable
+        term(a, b, p, out) writes the j-th one-dimensional factor into `out`
+        (or, if one_plus=True, the increment δ_j with factor 1 + δ_j).
+        `a` and `b` broadcast against each other ((nA,1) and (1,nB) for a Gram
+        matrix), `p` is the j-th entry of `params`.  Module-level terms keep
+        the kernel picklable.
+    params : array-like of shape (d,)
+        Per-coordinate parameters (weights, inverse length scales, ...).
+    one_plus : bool, default True
+        Factors have the form 1 + δ_j; log space then uses log1p(δ_j).
+    name : str
+        Label used in repr().
+    shift_invariant : bool, default False
+        If True, k_j(a, b) depends only on {a - b}; the kernel is then tagged
+        with k_tilde / k_tilde_integral for the structured fast path in mmd().
+    k_tilde_integral : float, optional
+        ∫ k̃(u) du over [0,1)^d (only used when shift_invariant=True).
+    log_k_tilde_integral : float, optional
+        Its logarithm, for dimensions where the integral itself overflows
+        (default log(k_tilde_integral)).
+    dtype : numpy dtype, optional
+        Precision of the factors and the accumulator (default float64).
+    executor : int or concurrent.futures.Executor, optional
+        Split the rows of large Gram matrices across a thread pool (an int n
+        creates one with n threads on first use).  Each entry is computed
+        exactly as in the serial path, so results are bitwise identical.  Do
+        not pass the same executor to mmd(): a tile task waiting on row tasks
+        queued behind it in the same pool can deadlock.
+    n_workers : int, optional
+        Number of row blocks to split a Gram matrix into when `executor` is
+        an Executor instance (whose worker count is not part of the Executor
+        interface).  Default os.cpu_count().  Ignored for an int executor,
+        which is its own worker count.
 
-import numpy as np
+    Notes
+    -----
+    No (nA, nB, d) intermediate is formed: memory is two (nA, nB) buffers
+    (the accumulator and one scratch buffer) whatever the dimension.
+    gram() also accepts replicate stacks (R, n, d) and returns (R, nA, nB).
+    log_gram() accumulates log-factors instead of products, which stays
+    finite in dimensions where the product over- or underflows.
+    """
+
+    stacked = True   # gram() broadcasts over leading replicate axes
+
+    def __init__(
+        self,
+        term: Callable,
+        params,
+        *,
+        one_plus: bool = True,
+        name: str = "product",
+        shift_invariant: bool = False,
+        k_tilde_integral: float | None = None,
+        log_k_tilde_integral: float | None = None,
+        dtype=None,
+        executor: Any = None,
+        n_workers: int | None = None,
+    ):
+        self.term = term
+        self.dtype = np.dtype(float if dtype is None else dtype)
+        self.executor = executor
+        if n_workers is not None and int(n_workers) < 1:
+            raise ValueError(f"n_workers must be a positive integer, got {n_workers}")
+        self.n_workers = None if n_workers is None else int(n_workers)
+        self._pool = None
+        self.params = np.asarray(params, float).reshape(-1)
+        self.d = self.params.size
+        self.one_plus = bool(one_plus)
+        self.name = name
+        if shift_invariant:
+            self.k_tilde = self._k_tilde
+            self.log_k_tilde = self._log_k_tilde
+            self.k_tilde_integral = 1.0 if k_tilde_integral is None else float(k_tilde_integral)
+            self.log_k_tilde_integral = (math.log(self.k_tilde_integral) if log_k_tilde_integral is None
+                                         else float(log_k_tilde_integral))
+
+    def _check(self, A) -> np.ndarray:
+        A = np.atleast_2d(np.asarray(A, float))
+        if A.shape[-1] != self.d:
+            raise ValueError(f"{self.name} kernel expects d={self.d} coordinates, got {A.shape[-1]}")
+        return A
+
+    def _accumulate(self, a_cols, b_cols, shape, log: bool) -> np.ndarray:
+        out = np.zeros(shape, self.dtype) if log else np.ones(shape, self.dtype)
+        buf = np.empty(shape, self.dtype)
+        for a, b, p in zip(a_cols, b_cols, self.params):
+            self.term(a, b, p, buf)
+            if log:
+                (np.log1p if self.one_plus else np.log)(buf, out=buf)
+                out += buf
+            else:
+                if self.one_plus:
+                    buf += 1.0
+                out *= buf
+        return out
+
+    # rows per thread below which splitting does not pay for the task overhead
+    _min_rows_per_task = 128
+
+    def _get_executor(self):
+        if self.executor is None or isinstance(self.executor, int):
+            if self.executor is None or self.executor <= 1:
+                return None, 1
+            if self._pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._pool = ThreadPoolExecutor(max_workers=int(self.executor))
+            return self._pool, int(self.executor)
+        return self.executor, self.n_workers or os.cpu_count() or 1
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_pool"] = None                       # thread pools do not pickle
+        if not (state["executor"] is None or isinstance(state["executor"], int)):
+            state["executor"] = None
+        return state
+
+    def gram(self, A, B, log: bool = False) -> np.ndarray:
+        """Gram matrix K(A, B) of shape (..., nA, nB) (its elementwise log if log=True)."""
+        ex, workers = self._get_executor()
+        nA = np.shape(A)[-2] if np.ndim(A) >= 2 else 1
+        if ex is not None and nA >= 2 * self._min_rows_per_task:
+            A = self._check(A)
+            parts = min(workers, nA // self._min_rows_per_task)
+            rows = [slice(int(r[0]), int(r[-1]) + 1) for r in np.array_split(np.arange(nA), parts)]
+            blocks = list(ex.map(lambda sl: self._gram(A[..., sl, :], B, log), rows))
+            return np.concatenate(blocks, axis=-2)
+        return self._gram(A, B, log)
+
+    def _gram(self, A, B, log: bool) -> np.ndarray:
+        At = np.ascontiguousarray(np.moveaxis(self._check(A), -1, 0), self.dtype)   # (d, ..., nA): contiguous columns
+        Bt = np.ascontiguousarray(np.moveaxis(self._check(B), -1, 0), self.dtype)
+        a_cols = (a[..., :, None] for a in At)
+        b_cols = (b[..., None, :] for b in Bt)
+        shape = np.broadcast_shapes(At.shape[1:-1], Bt.shape[1:-1]) + (At.shape[-1], Bt.shape[-1])
+        return self._accumulate(a_cols, b_cols, shape, log)
+
+    def log_gram(self, A, B) -> np.ndarray:
+        """Elementwise log of K(A, B)."""
+        return self.gram(A, B, log=True)
+
+    def paired(self, A, B, log: bool = False) -> np.ndarray:
+        """k(a_i, b_i) for matching rows of A and B, shape (n,)."""
+        At = self._check(A).T.astype(self.dtype, copy=False)
+        Bt = self._check(B).T.astype(self.dtype, copy=False)
+        return self._accumulate(iter(At), iter(Bt), (At.shape[1],), log)
+
+    def __call__(self, A, B) -> np.ndarray:
+        return self.gram(A, B)
+
+    def _k_tilde(self, U, log: bool = False) -> np.ndarray:
+        """k̃(u) = K(u, 0) on differences U of shape (..., d) (shift-invariant kernels)."""
+        U = np.asarray(U, float)
+        zero = np.zeros(())
+        return self._accumulate(np.moveaxis(U, -1, 0), (zero,) * self.d, U.shape[:-1], log)
+
+    def _log_k_tilde(self, U) -> np.ndarray:
+        """log k̃(u) on differences U of shape (..., d)."""
+        return self._k_tilde(U, log=True)
+
+    def __repr__(self) -> str:
+        return f"ProductKernel(name={self.name!r}, d={self.d})"
 
-def make_cd_kernel(d: int, gamma):
+
+def _cd_term(a, b, w, out):
+    """δ = w (|a-1/2| + |b-1/2| - |a-b|)   (centered discrepancy, w = γ^2/2)."""
+    np.subtract(a, b, out=out)
+    np.abs(out, out=out)
+    np.subtract(np.abs(a - 0.5), out, out=out)
+    out += np.abs(b - 0.5)
+    out *= w
+
+
+def _wrap_term(a, b, w, out):
+    """δ = w (1/2 - |a-b| + |a-b|^2)   (wrap-around discrepancy, w = γ^2)."""
+    np.subtract(a, b, out=out)
+    np.abs(out, out=out)
+    out -= out * out
+    np.subtract(0.5, out, out=out)
+    out *= w
+
+
+def _star_term(a, b, w, out):
+    """δ = w (1 - max(a, b))   (L2-star discrepancy, w = γ^2)."""
+    np.maximum(a, b, out=out)
+    np.subtract(1.0, out, out=out)
+    out *= w
+
+
+def _sym_term(a, b, w, out):
+    """δ = w (1 - 2|a-b|)   (symmetric discrepancy, w = γ^2)."""
+    np.subtract(a, b, out=out)
+    np.abs(out, out=out)
+    out *= -2.0
+    out += 1.0
+    out *= w
+
+
+def _bernoulli_term(a, b, g, out):
+    """δ = γ B_2({a-b}),  B_2(u) = (u - 1/2)^2 - 1/12."""
+    np.subtract(a, b, out=out)
+    np.mod(out, 1.0, out=out)
+    out -= 0.5
+    np.square(out, out=out)
+    out -= 1.0 / 12.0
+    out *= g
+
+
+def _sobolev_term(a, b, g, out):
+    """δ = γ [B_1(a) B_1(b) + B_2(|a-b|)/2] = γ [c(a) + c(b) - |a-b|/2],  c(x) = x^2/2 - x/2 + 1/6."""
+    np.subtract(a, b, out=out)
+    np.abs(out, out=out)
+    out *= -0.5
+    out += 0.5 * a * a - 0.5 * a + 1.0 / 6.0
+    out += 0.5 * b * b - 0.5 * b + 1.0 / 6.0
+    out *= g
+
+
+def _matern_term(a, b, inv_ell, out, nu=1.5):
+    """One-dimensional Matérn factor k_ν(|a-b| / ℓ) for ν ∈ {1/2, 3/2, 5/2}."""
+    np.subtract(a, b, out=out)
+    np.abs(out, out=out)
+    if np.isclose(nu, 0.5):
+        out *= -inv_ell
+        np.exp(out, out=out)
+    elif np.isclose(nu, 1.5):
+        out *= np.sqrt(3.0) * inv_ell
+        out[...] = (1.0 + out) * np.exp(-out)
+    else:
+        out *= np.sqrt(5.0) * inv_ell
+        out[...] = (1.0 + out + out * out / 3.0) * np.exp(-out)
+
+
+def _coordinate_weights(d: int, gamma) -> np.ndarray:
+    g = np.asarray(gamma, float)
+    if g.ndim == 0:
+        g = np.full(d, float(g))
+    if g.size != d:
+        raise ValueError(f"gamma must be scalar or length {d}, got {g.size}")
+    return g.reshape(-1)
+
+
+def make_cd_kernel(d: int, gamma, dtype=None, executor=None, n_workers=None):
     """
     Centered-discrepancy kernel on [0,1]^d with per-coordinate weights gamma:
 
@@ -124,20 +511,103 @@ def make_cd_kernel(d: int, gamma):
     -----
     - If gamma is scalar, it is broadcast to all d coordinates.
     - With gamma = 0, K ≡ 1.
+    - Returns a ProductKernel: no (nA, nB, d) temporary is formed.
+    - dtype=np.float32 evaluates the factors and the product in float32;
+      mmd() still accumulates tile sums in float64.
+    - executor (int or Executor) splits the rows of large Gram matrices
+      across threads (into n_workers blocks for an Executor); see ProductKernel.
     """
-    g = np.asarray(gamma, float)
-    if g.ndim == 0:
-        g = np.full(d, float(g))
-    if g.size != d:
-        raise ValueError(f"gamma must be scalar or length {d}, got {g.size}")
-    g2 = (g ** 2)
+    g = _coordinate_weights(d, gamma)
+    K = ProductKernel(_cd_term, 0.5 * g**2, name="centered", dtype=dtype, executor=executor,
+                      n_workers=n_workers)
+    return _tag_l2(K, "centered", g)
 
-    def K(A, B):
-        A = np.atleast_2d(np.asarray(A, float))
-        B = np.atleast_2d(np.asarray(B, float))
-        a = A[:, None, :]                  # (nA, 1, d)
-        b = B[None, :, :]                  # (1, nB, d)
-        term = 1.0 + 0.5 * g2 * (np.abs(a - 0.5) + np.abs(b - 0.5) - np.abs(a - b))
-        return np.prod(term, axis=-1)      # (nA, nB)
 
-    return K
\ No newline at end of file
+def _tag_l2(K: ProductKernel, kind: str, g: np.ndarray) -> ProductKernel:
+    """Mark a classical L2-discrepancy kernel so mmd() can pick the closed-form path."""
+    K.l2_kind = kind
+    K.l2_gamma = g
+    return K
+
+
+def make_wraparound_kernel(d: int, gamma=1.0, dtype=None):
+    """
+    Wrap-around discrepancy kernel on [0,1)^d:
+
+        K(t, x) = ∏_j [ 1 + γ_j^2 ( 1/2 - |t_j - x_j| + |t_j - x_j|^2 ) ].
+
+    It is periodic and shift invariant (tagged with k_tilde, so lattices and
+    Kronecker sets use the O(n d) path); every mean embedding equals
+    κ = ∏_j (1 + γ_j^2 / 3).
+    """
+    g = _coordinate_weights(d, gamma)
+    K = ProductKernel(_wrap_term, g**2, name="wraparound", dtype=dtype, shift_invariant=True,
+                      k_tilde_integral=float(np.prod(1.0 + g**2 / 3.0)),
+                      log_k_tilde_integral=float(np.sum(np.log1p(g**2 / 3.0))))
+    return _tag_l2(K, "wraparound", g)
+
+
+def make_star_kernel(d: int, gamma=1.0, dtype=None):
+    """
+    L2-star discrepancy kernel on [0,1]^d (anchored at the corner 1):
+
+        K(t, x) = ∏_j [ 1 + γ_j^2 ( 1 - max(t_j, x_j) ) ].
+    """
+    g = _coordinate_weights(d, gamma)
+    return _tag_l2(ProductKernel(_star_term, g**2, name="star", dtype=dtype), "star", g)
+
+
+def make_symmetric_kernel(d: int, gamma=1.0, dtype=None):
+    """
+    Symmetric discrepancy kernel on [0,1]^d:
+
+        K(t, x) = ∏_j [ 1 + γ_j^2 ( 1 - 2 |t_j - x_j| ) ]
+
+    (γ = 1 gives Hickernell's 2^d ∏_j (1 - |t_j - x_j|)).
+    """
+    g = _coordinate_weights(d, gamma)
+    return _tag_l2(ProductKernel(_sym_term, g**2, name="symmetric", dtype=dtype), "symmetric", g)
+
+
+def make_bernoulli_kernel(d: int, gamma=1.0):
+    """
+    Periodic product kernel on [0,1)^d built from the 2nd Bernoulli polynomial:
+
+        K(t, x) = k̃({t - x}),   k̃(u) = ∏_{j=1}^d [ 1 + γ_j B_2(u_j) ],
+        B_2(u) = u^2 - u + 1/6,
+
+    the kernel behind Kronecker.periodic_discrepancy.
+
+    The returned ProductKernel carries two tags used by the structured fast
+    path in mmd():
+      - K.k_tilde(U):        k̃ evaluated on differences U of shape (..., d)
+      - K.k_tilde_integral:  ∫ k̃(u) du over [0,1)^d  (= 1 here)
+    """
+    g = _coordinate_weights(d, gamma)
+    return ProductKernel(_bernoulli_term, g, name="bernoulli",
+                         shift_invariant=True, k_tilde_integral=1.0)
+
+
+def make_sobolev_kernel(d: int, gamma=1.0):
+    """
+    Unanchored Sobolev product kernel on [0,1]^d:
+
+        K(t, x) = ∏_{j=1}^d [ 1 + γ_j ( B_1(t_j) B_1(x_j) + B_2(|t_j - x_j|) / 2 ) ],
+
+    with B_1(x) = x - 1/2 and B_2 as in make_bernoulli_kernel.
+    """
+    g = _coordinate_weights(d, gamma)
+    return ProductKernel(_sobolev_term, g, name="sobolev")
+
+
+def make_matern_product_kernel(d: int, sigma=1.0, nu: float = 1.5):
+    """
+    Product of one-dimensional Matérn kernels with length scale(s) sigma:
+
+        K(t, x) = ∏_{j=1}^d k_ν(|t_j - x_j| / σ_j),   ν ∈ {1/2, 3/2, 5/2}.
+    """
+    if not any(np.isclose(nu, v) for v in (0.5, 1.5, 2.5)):
+        raise ValueError("make_matern_product_kernel supports nu in {0.5, 1.5, 2.5}.")
+    ell = _coordinate_weights(d, sigma)
+    return ProductKernel(partial(_matern_term, nu=float(nu)), 1.0 / ell,
+                         one_plus=False, name=f"matern{nu:g}-product")
@@ -0,0 +1,168 @@
+"""
+Log-domain MMD for product kernels in very high dimensions.
+
+Product kernels such as make_cd_kernel or make_bernoulli_kernel multiply d
+factors 1 + δ_j: in thousands of dimensions the Gram entries and the measure
+integrals (e.g. κ = ∏_j (1 + γ_j^2/12)) leave the float64 range.  Here every
+quantity is carried as a logarithm:
+
+- Gram tiles come from ProductKernel.log_gram (sums of log1p(δ_j) per
+  coordinate) and are reduced with log-sum-exp (tiling._log_gram_sum*);
+  structured designs use log_shift_invariant_sums with K.log_k_tilde;
+- measures supply log_k_mean / log_k_self (measures.py);
+- the three MMD^2 terms a + b - 2c are combined as
+      log MMD^2 = M + log( e^{a-M} + e^{b-M} - 2 e^{c-M} ),   M = max(a, b, c),
+  so only scaled exponentials in (0, 1] are ever formed.
+
+The result is log MMD (or log MMD^2), and -inf where the estimate is not
+positive (mmd() clips it to 0 there).  The cancellation in the last step is
+the same as in mmd(): the absolute error is about machine epsilon times
+e^M, the size of the largest term.
+
+Public:
+- log_mmd(X, Y, kernel=..., ...)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+import math
+import numpy as np
+
+from .core import AnalyticalMeasure, _as_points, _is_stack
+from .fast import StructuredDesign
+from .kernels import _make_kernel, _pairwise_sq_dists
+from .tiling import DEFAULT_TILE, _executor_scope, _logsumexp, _log_gram_sum, _log_gram_sum_sym
+
+__all__ = ["log_mmd"]
+
+
+def _log_kernel(kernel: Any, K: Callable, sigma: float) -> Callable:
+    """Elementwise log of the Gram tile: log_gram if the kernel has one, else log K(A, B)."""
+    if isinstance(kernel, str) and kernel.lower() in ("se", "sqexp"):
+        s2 = 2.0 * float(sigma) ** 2
+        return lambda A, B: -_pairwise_sq_dists(A, B) / s2
+    log_gram = getattr(K, "log_gram", None)
+    if log_gram is not None:
+        return log_gram
+
+    def log_K(A, B):
+        with np.errstate(divide="ignore"):
+            return np.log(np.asarray(K(A, B), float))
+
+    return log_K
+
+
+def _log_self_term(K: Callable, log_K: Callable, X, biased: bool, tile, executor) -> float:
+    """log of the mean of K(X, X) (with or without the diagonal)."""
+    n = len(X)
+    if isinstance(X, StructuredDesign) and hasattr(K, "log_k_tilde"):
+        log_total, log_trace = X.log_shift_invariant_sums(K.log_k_tilde, tile)
+    else:
+        log_total, log_trace = _log_gram_sum_sym(log_K, _as_points(X), tile, executor)
+    if biased or n < 2:
+        return log_total - 2.0 * math.log(n)
+    gap = log_trace - log_total
+    if gap >= 0.0:                       # off-diagonal part is zero (or lost to rounding)
+        return -math.inf
+    return log_total + math.log(-math.expm1(gap)) - math.log(n) - math.log(n - 1)
+
+
+def _log_mean_term(P: AnalyticalMeasure, S, K: Callable, tile: int | None) -> float:
+    """log mean_i E_{Z~P}[k(s_i, Z)] (streamed for structured designs, as core._measure_mean)."""
+    if isinstance(S, StructuredDesign):
+        parts = [_logsumexp(P.log_k_mean(block, K)) for block in S.iter_points(tile)]
+        return _logsumexp(parts) - math.log(len(S))
+    S = _as_points(S)
+    return _logsumexp(P.log_k_mean(S, K)) - math.log(len(S))
+
+
+def _log_combine(a: float, b: float, c: float) -> float:
+    """log(e^a + e^b - 2 e^c) with the largest exponent factored out; -inf if not positive."""
+    M = max(a, b, math.log(2.0) + c)
+    if M == -math.inf:
+        return -math.inf
+    v = math.exp(a - M) + math.exp(b - M) - 2.0 * math.exp(c - M)
+    return M + math.log(v) if v > 0.0 else -math.inf
+
+
+def log_mmd(
+    X,
+    Y,
+    *,
+    kernel: Any = "se",
+    sigma: float = 1.0,
+    nu: float = 1.5,
+    biased: bool = True,
+    return_squared: bool = False,
+    tile: int | None = DEFAULT_TILE,
+    executor: Any = None,
+):
+    """
+    Logarithm of the MMD, computed without leaving the log domain.
+
+    Parameters
+    ----------
+    X, Y : array-like (n,d)/(m,d), StructuredDesign, AnalyticalMeasure, or
+        replicate stacks (R,n,d), as in mmd().
+    kernel : str or callable
+        Intended for ProductKernel (make_cd_kernel, make_bernoulli_kernel,
+        make_matern_product_kernel, ...), whose log_gram accumulates the
+        per-coordinate log-factors.  'se' uses -||a-b||^2 / (2 sigma^2)
+        directly; any other kernel falls back to log K(A, B).
+    sigma, nu, biased, tile, executor : as in mmd().
+    return_squared : bool
+        Return log MMD^2 instead of log MMD.
+
+    Returns
+    -------
+    float (or (R,) array for stacks)
+        log MMD (or log MMD^2); -inf if the MMD^2 estimate is <= 0.
+
+    Notes
+    -----
+    Measures provide log_k_mean / log_k_self (CDUniformMeasure,
+    L2UniformMeasure, PeriodicUniformMeasure, SEGaussianMeasure,
+    SEUniformMeasure, MaternUniformMeasure do so in closed form).  A shift-
+    invariant ProductKernel with a Rank1Lattice / KroneckerSet uses the
+    O(n d) index-difference sums in log form.
+    """
+    if _is_stack(X) or _is_stack(Y):
+        Xs = X if _is_stack(X) else None
+        Ys = Y if _is_stack(Y) else None
+        R = len(Xs) if Xs is not None else len(Ys)
+        return np.array([
+            log_mmd(X if Xs is None else Xs[r], Y if Ys is None else Ys[r], kernel=kernel, sigma=sigma,
+                    nu=nu, biased=biased, return_squared=return_squared, tile=tile, executor=executor)
+            for r in range(R)
+        ])
+
+    K = _make_kernel(kernel, sigma, nu=nu)["K"]
+    log_K = _log_kernel(kernel, K, sigma)
+    X_is_meas = isinstance(X, AnalyticalMeasure)
+    Y_is_meas = isinstance(Y, AnalyticalMeasure)
+    if X_is_meas and Y_is_meas:
+        raise NotImplementedError(
+            "Analytic measure vs analytic measure requires a provided cross expectation E[k(X,Y)]."
+        )
+    fast_ok = hasattr(K, "log_k_tilde")
+    if not X_is_meas and not (fast_ok and isinstance(X, StructuredDesign)):
+        X = _as_points(X)
+    if not Y_is_meas and not (fast_ok and isinstance(Y, StructuredDesign)):
+        Y = _as_points(Y)
+
+    with _executor_scope(executor) as ex:
+        if not X_is_meas and not Y_is_meas:
+            n, m = len(X), len(Y)
+            unbiased = not biased and n >= 2 and m >= 2
+            a = _log_self_term(K, log_K, X, not unbiased, tile, ex)
+            b = _log_self_term(K, log_K, Y, not unbiased, tile, ex)
+            c = _log_gram_sum(log_K, _as_points(X), _as_points(Y), tile, ex) - math.log(n) - math.log(m)
+        else:
+            S, P = (Y, X) if X_is_meas else (X, Y)
+            a = _log_self_term(K, log_K, S, biased, tile, ex)
+            b = P.log_k_self(K)
+            c = _log_mean_term(P, S, K, tile)
+
+    log2 = _log_combine(a, b, c)
+    return log2 if return_squared else 0.5 * log2
@@ -11,6 +11,37 @@ Currently implemented:
 Closed-form expectations:
     μ(x)  = E_T[K(T,x)] = ∏_j [ 1 + (γ_j^2/2)(|x_j-1/2| + x_j - x_j^2 - 1/4) ],
     κ     = E[K(T,T')]  = ∏_j [ 1 + γ_j^2/12 ].
+
+- Uniform([0,1)^d) for any SHIFT-INVARIANT periodic kernel K(t,x) = k̃({t-x})
+  tagged with `k_tilde_integral` (e.g. make_bernoulli_kernel):
+    μ(x) = κ = ∫ k̃(u) du   (constant in x).
+
+- N(m, Σ) for the SQUARED-EXPONENTIAL kernel exp(-||t-x||^2 / (2σ^2)):
+    μ(x) = det(I + Σ/σ^2)^{-1/2} exp(-½ (x-m)^T (Σ + σ^2 I)^{-1} (x-m)),
+    κ    = det(I + 2Σ/σ^2)^{-1/2}.
+
+- Uniform on a box ∏_j [a_j, b_j] for the SQUARED-EXPONENTIAL kernel
+  (products of one-dimensional erf terms, L_j = b_j - a_j):
+    μ_j(x) = σ sqrt(π/2) / L_j [ erf((b_j-x)/(√2 σ)) - erf((a_j-x)/(√2 σ)) ],
+    κ_j    = [ 2 L_j σ sqrt(π/2) erf(L_j/(√2 σ)) - 2σ^2 (1 - exp(-L_j^2/(2σ^2))) ] / L_j^2.
+
+- Uniform([0,1]^d) for the MATÉRN PRODUCT kernel (make_matern_product_kernel,
+  ν ∈ {1/2, 3/2, 5/2}): μ_j(x) = F(x) + F(1-x) with F(x) = ∫_0^x k_ν(t) dt,
+  and κ_j = 2 ∫_0^1 F.
+
+- Uniform([0,1]^d) for the classical L2 discrepancy kernels (classical.py),
+  per coordinate with w = γ_j^2 and κ_j = 1 + w/3 except for centered:
+    wrap-around: μ_j(x) = 1 + w/3     star: μ_j(x) = 1 + w (1 - x^2) / 2
+    symmetric:   μ_j(x) = 1 + w (2x - 2x^2)
+
+Each of these costs O(n d) for k_mean (O(n d^2) for a full Gaussian
+covariance), so sample-vs-distribution MMD needs no reference sample.
+Each measure also supplies its characteristic function E[exp(i w·Z)]:
+    N(m, Σ):           exp(i w·m - ½ w^T Σ w),
+    box ∏_j [a_j, b_j]: exp(i w·c) ∏_j sin(w_j h_j) / (w_j h_j),  c = (a+b)/2, h = (b-a)/2,
+which gives the exact mean embedding of random Fourier features.
+All of them also supply log_k_mean / log_k_self as sums of per-coordinate
+logs, which log_mmd() uses where the products leave the float64 range.
 """
 
 from __future__ import annotations
@@ -19,8 +50,25 @@ from typing import Callable, Optional
 import numpy as np
 
 from .core import AnalyticalMeasure
+from .kernels import _coordinate_weights
+
+__all__ = [
+    "CDUniformMeasure", "PeriodicUniformMeasure",
+    "SEGaussianMeasure", "SEUniformMeasure", "MaternUniformMeasure", "L2UniformMeasure",
+    "cd_uniform_k_mean", "cd_uniform_k_self",
+]
+
+
+def _box_characteristic(low=0.0, high=1.0) -> Callable[[np.ndarray], np.ndarray]:
+    """Characteristic function of the uniform measure on ∏_j [low_j, high_j] (scalars broadcast)."""
+    c = 0.5 * (np.asarray(low, float) + np.asarray(high, float))
+    h = 0.5 * (np.asarray(high, float) - np.asarray(low, float))
 
-__all__ = ["CDUniformMeasure", "cd_uniform_k_mean", "cd_uniform_k_self"]
+    def _char(W: np.ndarray) -> np.ndarray:
+        # np.sinc(x) = sin(πx) / (πx)
+        return np.exp(1j * np.sum(W * c, axis=-1)) * np.prod(np.sinc(W * h / np.pi), axis=-1)
+
+    return _char
 
 
 # ---------------------------------------------------------------------------
@@ -42,6 +90,8 @@ class CDUniformMeasure(AnalyticalMeasure):
     This class supplies the exact expectations μ(x) and κ required by
     AnalyticalMeasure: k_mean(x, K) and k_self(K). The kernel K is not used
     inside these formulas, but is accepted to satisfy the interface.
+    k_mean also accepts a replicate stack (R, n, d) and returns (R, n), so
+    mmd(stack, CDUniformMeasure(d, γ), ...) gives all R discrepancies at once.
     """
 
     def __init__(self, d: int, gamma):
@@ -53,16 +103,332 @@ class CDUniformMeasure(AnalyticalMeasure):
         self._g = g
 
         def _k_mean(X: np.ndarray, K_unused: Callable) -> np.ndarray:
-            X = np.atleast_2d(np.asarray(X, float))  # (n, d)
+            X = np.atleast_2d(np.asarray(X, float))  # (n, d) or (R, n, d)
             g2 = self._g ** 2
             # Per-dim factor: 1 + 0.5*γ_j^2 * ( |x_j-1/2| + x_j - x_j^2 - 1/4 )
             per = 1.0 + 0.5 * g2 * (np.abs(X - 0.5) + X - X**2 - 0.25)
-            return np.prod(per, axis=1)  # (n,)
+            return np.prod(per, axis=-1)  # (n,) or (R, n)
 
         def _k_self(K_unused: Callable) -> float:
             return float(np.prod(1.0 + (self._g ** 2) / 12.0))
 
-        super().__init__(k_mean=_k_mean, k_self=_k_self)
+        def _log_k_mean(X: np.ndarray, K_unused: Callable) -> np.ndarray:
+            X = np.atleast_2d(np.asarray(X, float))
+            return np.sum(np.log1p(0.5 * self._g**2 * (np.abs(X - 0.5) + X - X**2 - 0.25)), axis=-1)
+
+        def _log_k_self(K_unused: Callable) -> float:
+            return float(np.sum(np.log1p(self._g**2 / 12.0)))
+
+        super().__init__(k_mean=_k_mean, k_self=_k_self, log_k_mean=_log_k_mean, log_k_self=_log_k_self,
+                         characteristic=_box_characteristic())
+        self.l2_kind, self.l2_gamma = "centered", g
+
+
+# ---------------------------------------------------------------------------
+# Class: Uniform([0,1]^d) for the classical L2 discrepancy kernels
+# ---------------------------------------------------------------------------
+def _l2_mean_factors(kind: str, X: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """Per-coordinate factors of μ(x) for kernel `kind` with w = γ^2 (shape of X)."""
+    if kind == "centered":
+        return 1.0 + 0.5 * w * (np.abs(X - 0.5) + X - X**2 - 0.25)
+    if kind == "wraparound":
+        return np.broadcast_to(1.0 + w / 3.0, X.shape)
+    if kind == "star":
+        return 1.0 + 0.5 * w * (1.0 - X**2)
+    if kind == "symmetric":
+        return 1.0 + w * (2.0 * X - 2.0 * X**2)
+    raise ValueError(f"unknown L2 discrepancy {kind!r}; use 'centered', 'wraparound', 'star' or 'symmetric'.")
+
+
+def _l2_kappa(kind: str, w: np.ndarray) -> float:
+    return float(np.prod(1.0 + w / 12.0)) if kind == "centered" else float(np.prod(1.0 + w / 3.0))
+
+
+def _l2_log_kappa(kind: str, w: np.ndarray) -> float:
+    return float(np.sum(np.log1p(w / 12.0 if kind == "centered" else w / 3.0)))
+
+
+class L2UniformMeasure(AnalyticalMeasure):
+    """
+    Uniform([0,1]^d) analytic measure for a classical L2 discrepancy kernel.
+
+    Parameters
+    ----------
+    kind : {'centered', 'wraparound', 'star', 'symmetric'}
+        Matches make_cd_kernel / make_wraparound_kernel / make_star_kernel /
+        make_symmetric_kernel.
+    d : int
+    gamma : float or array-like of shape (d,)
+        Coordinate weights of the kernel.
+
+    Notes
+    -----
+    mmd(X, L2UniformMeasure(kind, d, γ), kernel=<matching kernel>) is the
+    squared (or plain) L2 discrepancy, and is evaluated by classical.py's
+    closed-form path.
+    """
+
+    def __init__(self, kind: str, d: int, gamma=1.0):
+        g = np.asarray(gamma, float)
+        g = np.full(d, float(g)) if g.ndim == 0 else g.reshape(-1)
+        if g.size != d:
+            raise ValueError(f"gamma must be scalar or length {d}, got {g.size}")
+        w = g**2
+        kappa = _l2_kappa(kind, w)
+        _l2_mean_factors(kind, np.zeros((1, d)), w)          # validate kind
+
+        def _k_mean(X: np.ndarray, K_unused: Callable) -> np.ndarray:
+            X = np.atleast_2d(np.asarray(X, float))
+            return np.prod(_l2_mean_factors(kind, X, w), axis=-1)
+
+        def _k_self(K_unused: Callable) -> float:
+            return kappa
+
+        def _log_k_mean(X: np.ndarray, K_unused: Callable) -> np.ndarray:
+            X = np.atleast_2d(np.asarray(X, float))
+            return np.sum(np.log(_l2_mean_factors(kind, X, w)), axis=-1)
+
+        def _log_k_self(K_unused: Callable) -> float:
+            return _l2_log_kappa(kind, w)
+
+        super().__init__(k_mean=_k_mean, k_self=_k_self, log_k_mean=_log_k_mean, log_k_self=_log_k_self,
+                         characteristic=_box_characteristic())
+        self.l2_kind, self.l2_gamma = kind, g
+
+
+# ---------------------------------------------------------------------------
+# Class: Uniform([0,1)^d) for shift-invariant periodic kernels
+# ---------------------------------------------------------------------------
+class PeriodicUniformMeasure(AnalyticalMeasure):
+    """
+    Uniform([0,1)^d) analytic measure for shift-invariant periodic kernels.
+
+    For K(t, x) = k̃({t - x}) every mean embedding equals the integral of k̃,
+    so μ(x) and κ are read from the kernel's `k_tilde_integral` tag.  Paired
+    with a Rank1Lattice or KroneckerSet, mmd() then runs in O(n d).
+    """
+
+    def __init__(self):
+        def _k_mean(X: np.ndarray, K: Callable) -> np.ndarray:
+            return np.full(len(X), _k_tilde_integral(K))
+
+        def _k_self(K: Callable) -> float:
+            return _k_tilde_integral(K)
+
+        def _log_k_mean(X: np.ndarray, K: Callable) -> np.ndarray:
+            return np.full(len(X), _log_k_tilde_integral(K))
+
+        def _log_k_self(K: Callable) -> float:
+            return _log_k_tilde_integral(K)
+
+        super().__init__(k_mean=_k_mean, k_self=_k_self, log_k_mean=_log_k_mean, log_k_self=_log_k_self,
+                         characteristic=_box_characteristic())
+
+
+def _k_tilde_integral(K: Callable) -> float:
+    try:
+        return float(K.k_tilde_integral)
+    except AttributeError:
+        raise ValueError(
+            "PeriodicUniformMeasure needs a shift-invariant kernel tagged with "
+            "k_tilde_integral (e.g. make_bernoulli_kernel)."
+        ) from None
+
+
+def _log_k_tilde_integral(K: Callable) -> float:
+    log_int = getattr(K, "log_k_tilde_integral", None)
+    return float(log_int) if log_int is not None else float(np.log(_k_tilde_integral(K)))
+
+
+# ---------------------------------------------------------------------------
+# Class: N(m, Σ) for the squared-exponential kernel
+# ---------------------------------------------------------------------------
+class SEGaussianMeasure(AnalyticalMeasure):
+    """
+    Gaussian N(mean, cov) analytic measure for the squared-exponential kernel.
+
+    Parameters
+    ----------
+    mean : array-like of shape (d,)
+    cov : float, array-like of shape (d,), or (d, d)
+        Covariance: scalar (isotropic), diagonal, or full (symmetric positive
+        semi-definite).
+    sigma : float
+        Length scale of the kernel, as in mmd(kernel="se", sigma=...).
+
+    Notes
+    -----
+    The kernel passed to k_mean / k_self is not evaluated; it must be the
+    "se" kernel with the same sigma for the integrals to be correct.
+    """
+
+    def __init__(self, mean, cov, sigma: float = 1.0):
+        m = np.atleast_1d(np.asarray(mean, float)).reshape(-1)
+        d = m.size
+        C = np.asarray(cov, float)
+        if C.ndim < 2:
+            C = np.diag(np.broadcast_to(C, (d,)))
+        if C.shape != (d, d):
+            raise ValueError(f"cov must be scalar, length {d} or ({d}, {d}); got shape {C.shape}")
+        s2 = float(sigma) ** 2
+        self.mean, self.cov, self.sigma = m, C, float(sigma)
+
+        L = np.linalg.cholesky(C + s2 * np.eye(d))                 # Σ + σ² I = L L^T
+        # det(I + Σ/σ²) = det(Σ + σ² I) / σ^{2d}
+        log_c = -np.sum(np.log(np.diag(L))) + 0.5 * d * np.log(s2)
+        _, logdet2 = np.linalg.slogdet(np.eye(d) + 2.0 * C / s2)
+        kappa = float(np.exp(-0.5 * logdet2))
+
+        def _log_k_mean(X: np.ndarray, K_unused: Callable) -> np.ndarray:
+            Z = np.linalg.solve(L, (np.atleast_2d(np.asarray(X, float)) - m).T)   # (d, n)
+            return log_c - 0.5 * np.einsum("ij,ij->j", Z, Z)
+
+        def _k_mean(X: np.ndarray, K_unused: Callable) -> np.ndarray:
+            return np.exp(_log_k_mean(X, K_unused))
+
+        def _k_self(K_unused: Callable) -> float:
+            return kappa
+
+        def _log_k_self(K_unused: Callable) -> float:
+            return float(-0.5 * logdet2)
+
+        def _characteristic(W: np.ndarray) -> np.ndarray:
+            return np.exp(1j * (W @ m) - 0.5 * np.einsum("ki,ij,kj->k", W, C, W))
+
+        super().__init__(k_mean=_k_mean, k_self=_k_self, log_k_mean=_log_k_mean, log_k_self=_log_k_self,
+                         characteristic=_characteristic)
+
+
+# ---------------------------------------------------------------------------
+# Class: Uniform(box) for the squared-exponential kernel
+# ---------------------------------------------------------------------------
+class SEUniformMeasure(AnalyticalMeasure):
+    """
+    Uniform measure on the box ∏_j [low_j, high_j] for the squared-exponential kernel.
+
+    Parameters
+    ----------
+    low, high : float or array-like of shape (d,)
+        Box corners (scalars need `d`).
+    sigma : float
+        Length scale of the kernel, as in mmd(kernel="se", sigma=...).
+    d : int, optional
+        Dimension when low and high are both scalars (default [0,1]^d box).
+
+    Notes
+    -----
+    The SE kernel factorizes over coordinates, so μ and κ are products of
+    the one-dimensional erf expressions in the module docstring.
+    """
+
+    def __init__(self, low=0.0, high=1.0, sigma: float = 1.0, d: Optional[int] = None):
+        lo = np.atleast_1d(np.asarray(low, float))
+        hi = np.atleast_1d(np.asarray(high, float))
+        if d is None:
+            d = max(lo.size, hi.size)
+        lo = _coordinate_weights(d, lo if lo.size > 1 else lo[0])
+        hi = _coordinate_weights(d, hi if hi.size > 1 else hi[0])
+        if np.any(hi <= lo):
+            raise ValueError("SEUniformMeasure needs high > low in every coordinate.")
+        from scipy.special import erf
+        sig = float(sigma)
+        r2s = np.sqrt(2.0) * sig
+        Lw = hi - lo
+        c = sig * np.sqrt(np.pi / 2.0)
+        self.low, self.high, self.sigma = lo, hi, sig
+        kappa_j = (2.0 * Lw * c * erf(Lw / r2s) - 2.0 * sig * sig * (1.0 - np.exp(-Lw**2 / (2.0 * sig * sig)))) / Lw**2
+        kappa = float(np.prod(kappa_j))
+
+        def _per(X: np.ndarray) -> np.ndarray:
+            X = np.atleast_2d(np.asarray(X, float))
+            return c / Lw * (erf((hi - X) / r2s) - erf((lo - X) / r2s))
+
+        def _k_mean(X: np.ndarray, K_unused: Callable) -> np.ndarray:
+            return np.prod(_per(X), axis=-1)
+
+        def _k_self(K_unused: Callable) -> float:
+            return kappa
+
+        def _log_k_mean(X: np.ndarray, K_unused: Callable) -> np.ndarray:
+            return np.sum(np.log(_per(X)), axis=-1)
+
+        def _log_k_self(K_unused: Callable) -> float:
+            return float(np.sum(np.log(kappa_j)))
+
+        super().__init__(k_mean=_k_mean, k_self=_k_self, log_k_mean=_log_k_mean, log_k_self=_log_k_self,
+                         characteristic=_box_characteristic(lo, hi))
+
+
+# ---------------------------------------------------------------------------
+# Class: Uniform([0,1]^d) for the Matérn product kernel
+# ---------------------------------------------------------------------------
+def _matern_F(y: np.ndarray, a, nu: float) -> np.ndarray:
+    """F(x) = ∫_0^x k_ν(t) dt as a function of y = a x (a = sqrt(2ν)/ℓ)."""
+    e = np.exp(-y)
+    if np.isclose(nu, 0.5):
+        return (1.0 - e) / a
+    if np.isclose(nu, 1.5):
+        return (2.0 - (2.0 + y) * e) / a
+    return (8.0 - (8.0 + 5.0 * y + y * y) * e) / (3.0 * a)
+
+
+def _matern_self(a: np.ndarray, nu: float) -> np.ndarray:
+    """κ_j = 2 ∫_0^1 F(x) dx per coordinate."""
+    e = np.exp(-a)
+    if np.isclose(nu, 0.5):
+        return 2.0 / a**2 * (a - 1.0 + e)
+    if np.isclose(nu, 1.5):
+        return 2.0 / a**2 * (2.0 * a - 3.0 + (3.0 + a) * e)
+    return 2.0 / (3.0 * a**2) * (8.0 * a - 15.0 + (15.0 + 7.0 * a + a * a) * e)
+
+
+class MaternUniformMeasure(AnalyticalMeasure):
+    """
+    Uniform([0,1]^d) analytic measure for make_matern_product_kernel(d, sigma, nu).
+
+    Parameters
+    ----------
+    d : int
+        Dimension.
+    sigma : float or array-like of shape (d,)
+        Per-coordinate length scales ℓ_j (same as the kernel's).
+    nu : {0.5, 1.5, 2.5}
+        Matérn smoothness.
+
+    Notes
+    -----
+    With a_j = sqrt(2ν)/ℓ_j and y = a_j x, e.g. for ν = 3/2
+        F(x) = (2 - (2 + y) e^{-y}) / a_j,
+        κ_j  = (2 / a_j^2) (2 a_j - 3 + (3 + a_j) e^{-a_j}).
+    """
+
+    def __init__(self, d: int, sigma=1.0, nu: float = 1.5):
+        if not any(np.isclose(nu, v) for v in (0.5, 1.5, 2.5)):
+            raise ValueError("MaternUniformMeasure supports nu in {0.5, 1.5, 2.5}.")
+        ell = _coordinate_weights(d, sigma)
+        a = np.sqrt(2.0 * nu) / ell
+        nu = float(nu)
+        kappa_j = _matern_self(a, nu)
+        kappa = float(np.prod(kappa_j))
+
+        def _per(X: np.ndarray) -> np.ndarray:
+            X = np.atleast_2d(np.asarray(X, float))
+            return _matern_F(a * X, a, nu) + _matern_F(a * (1.0 - X), a, nu)
+
+        def _k_mean(X: np.ndarray, K_unused: Callable) -> np.ndarray:
+            return np.prod(_per(X), axis=-1)
+
+        def _k_self(K_unused: Callable) -> float:
+            return kappa
+
+        def _log_k_mean(X: np.ndarray, K_unused: Callable) -> np.ndarray:
+            return np.sum(np.log(_per(X)), axis=-1)
+
+        def _log_k_self(K_unused: Callable) -> float:
+            return float(np.sum(np.log(kappa_j)))
+
+        super().__init__(k_mean=_k_mean, k_self=_k_self, log_k_mean=_log_k_mean, log_k_self=_log_k_self,
+                         characteristic=_box_characteristic())
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,212 @@
+"""
+Nyström low-rank Gram approximation.
+
+With r landmark points L and W = K(L, L) = V Λ V^T,
+
+    K(a, b) ≈ Φ(a)·Φ(b),   Φ(x) = K(x, L) V Λ^{-1/2}   (r features),
+
+so an n x n Gram matrix is replaced by the (n, r) factor Φ(X): O(n r^2)
+time and O(n r) memory.  A fitted Nystrom object is a feature map for
+mmd(..., features=...) and a factor for kernel quadrature weights.
+
+Public:
+- Nystrom(kernel, r, landmarks="uniform", ...)
+- nystrom_quadrature_weights(X, measure, nys, ridge=0.0)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+import numpy as np
+
+from .core import AnalyticalMeasure
+from .kernels import _make_kernel, _paired_eval
+
+__all__ = ["Nystrom", "nystrom_quadrature_weights"]
+
+
+class Nystrom:
+    """
+    Rank-r Nyström factor of a kernel, built from r landmark points.
+
+    Parameters
+    ----------
+    kernel : str or callable
+        Kernel name (with sigma / nu) or batched callable K(A, B).
+    r : int
+        Number of landmarks (rank of the approximation).
+    landmarks : {'uniform', 'leverage', 'qmc'} or (r, d) array
+        - 'uniform':  r rows of the data, uniformly without replacement.
+        - 'leverage': r rows sampled by approximate ridge leverage scores
+                      (from a preliminary uniform factor of rank 2r).
+        - 'qmc':      the first r rows.  For a design produced by an extensible
+                      low-discrepancy generator the prefix is itself a
+                      well-spread QMC point set.
+        - an array:   explicit landmark points.
+    sigma, nu : float
+        Kernel parameters for string kernels.
+    rng : np.random.Generator | int | None
+        Random generator or seed for landmark selection.
+    rtol : float
+        Eigenvalues of W below rtol * max eigenvalue are dropped.
+
+    Notes
+    -----
+    fit(X, Y, ...) chooses landmarks from the pooled samples.  mmd(X, Y,
+    features=nys) fits an unfitted factor on X and Y together, so both
+    distributions contribute landmarks (with 'qmc', a prefix of each in
+    proportion to its size); fit it yourself first when X or Y is an
+    iterator of chunks.  Against an AnalyticalMeasure the factor is fitted on
+    the sample and the measure enters through mean_embedding(), i.e. its
+    k_mean at the landmarks.  transform() on an unfitted object fits on its
+    argument, which suits single-sample uses such as quadrature weights.
+    """
+
+    def __init__(
+        self,
+        kernel: Any,
+        r: int,
+        *,
+        landmarks: Any = "uniform",
+        sigma: float = 1.0,
+        nu: float = 1.5,
+        rng: Optional[np.random.Generator | int] = None,
+        rtol: float = 1e-12,
+    ):
+        self.K = _make_kernel(kernel, sigma, nu=nu)["K"]
+        self.r = int(r)
+        self.landmarks = landmarks
+        self.rng = np.random.default_rng(rng)
+        self.rtol = float(rtol)
+        self.L: np.ndarray | None = None
+        self._proj: np.ndarray | None = None
+
+    # ---- landmark selection -------------------------------------------------
+    def _select(self, X: np.ndarray) -> np.ndarray:
+        how = self.landmarks
+        n = len(X)
+        r = min(self.r, n)
+        if not isinstance(how, str):
+            return np.atleast_2d(np.asarray(how, float))
+        how = how.lower()
+        if how == "uniform":
+            return X[self.rng.choice(n, r, replace=False)]
+        if how == "qmc":
+            return X[:r]
+        if how == "leverage":
+            r0 = min(2 * r, n)
+            pre = Nystrom(self.K, r0, landmarks=X[self.rng.choice(n, r0, replace=False)],
+                          rtol=self.rtol)
+            F = pre.transform(X)                               # (n, r0)
+            G = F.T @ F
+            lam = 1e-3 * np.trace(G) / max(F.shape[1], 1)       # relative ridge
+            scores = np.einsum("ij,ji->i", F, np.linalg.solve(G + lam * np.eye(len(G)), F.T))
+            p = np.clip(scores, 0.0, None)
+            p = p / p.sum() if p.sum() > 0 else None
+            return X[self.rng.choice(n, r, replace=False, p=p)]
+        raise ValueError("landmarks must be 'uniform', 'leverage', 'qmc' or an array of points.")
+
+    def fit(self, X, *more) -> "Nystrom":
+        """Choose landmarks from X (pooled with any further samples) and factor W = K(L, L)."""
+        parts = [np.atleast_2d(np.asarray(Z, float)) for Z in (X,) + more]
+        if len(parts) > 1 and isinstance(self.landmarks, str) and self.landmarks.lower() == "qmc":
+            # a prefix of each sample, in proportion to its size
+            sizes = np.array([len(P) for P in parts])
+            r = min(self.r, int(sizes.sum()))
+            counts = np.floor(r * sizes / sizes.sum()).astype(int)
+            counts[np.argsort(-(r * sizes / sizes.sum() - counts))[: r - counts.sum()]] += 1
+            self.L = np.vstack([P[:c] for P, c in zip(parts, counts)])
+        else:
+            self.L = self._select(np.vstack(parts))
+        W = np.asarray(self.K(self.L, self.L), float)
+        lam, V = np.linalg.eigh(0.5 * (W + W.T))
+        keep = lam > self.rtol * max(lam.max(), 0.0)
+        self._proj = V[:, keep] / np.sqrt(lam[keep])          # V Λ^{-1/2}
+        return self
+
+    # ---- feature map -----------------------------------------------------------
+    @property
+    def fitted(self) -> bool:
+        return self._proj is not None
+
+    @property
+    def rank(self) -> int:
+        return 0 if self._proj is None else self._proj.shape[1]
+
+    def transform(self, X) -> np.ndarray:
+        """Factor Φ(X) of shape (n, rank) with K(X, X) ≈ Φ Φ^T."""
+        X = np.atleast_2d(np.asarray(X, float))
+        if self._proj is None:
+            self.fit(X)
+        return np.asarray(self.K(X, self.L), float) @ self._proj
+
+    def mean_embedding(self, measure) -> np.ndarray:
+        """E_{Z~P}[Φ(Z)] of shape (rank,): measure.k_mean at the landmarks, projected."""
+        if self._proj is None:
+            raise ValueError("Nystrom factor is not fitted yet.")
+        return np.asarray(measure.k_mean(self.L, self.K), float) @ self._proj
+
+    def __call__(self, A, B) -> np.ndarray:
+        return self.transform(A) @ self.transform(B).T
+
+    def report(self, X, n_check: int = 500, rng=None) -> dict:
+        """
+        Accuracy of the approximation on X.
+
+        Returns
+        -------
+        dict with
+          'rank'          : numerical rank kept,
+          'trace_rel_err' : sum_i [k(x_i,x_i) - ||Φ(x_i)||^2] / sum_i k(x_i,x_i)  (all of X, O(n r)),
+          'fro_rel_err'   : ||K - Φ Φ^T||_F / ||K||_F on a random subsample of n_check rows,
+          'max_abs_err'   : max |K - Φ Φ^T| on that subsample.
+        """
+        X = np.atleast_2d(np.asarray(X, float))
+        rng = np.random.default_rng(rng)
+        kd = _paired_eval(self.K, X, X)
+        F = self.transform(X)
+        resid = kd - np.einsum("ij,ij->i", F, F)
+        S = rng.choice(len(X), min(n_check, len(X)), replace=False)
+        G = np.asarray(self.K(X[S], X[S]), float)
+        E = G - F[S] @ F[S].T
+        return {
+            "rank": self.rank,
+            "trace_rel_err": float(resid.sum() / kd.sum()),
+            "fro_rel_err": float(np.linalg.norm(E) / np.linalg.norm(G)),
+            "max_abs_err": float(np.abs(E).max()),
+        }
+
+    def __repr__(self) -> str:
+        return f"Nystrom(r={self.r}, landmarks={self.landmarks if isinstance(self.landmarks, str) else 'array'!r}, rank={self.rank})"
+
+
+def nystrom_quadrature_weights(
+    X,
+    measure: AnalyticalMeasure,
+    nys: Nystrom,
+    ridge: float = 0.0,
+) -> np.ndarray:
+    """
+    Kernel quadrature weights w solving (Φ Φ^T + ridge I) w = μ in O(n r^2).
+
+    μ_i = E_{Z~P}[k(x_i, Z)] comes from the measure's exact k_mean.  With
+    Φ = Q R (thin QR) and R R^T = U S U^T,
+
+        w = Q U (S + ridge)^{-1} U^T Q^T μ  +  (μ - Q Q^T μ) / ridge,
+
+    where the last term is dropped when ridge = 0 (minimum-norm solution).
+    The estimate of ∫ f dP is then w · f(X).
+    """
+    X = np.atleast_2d(np.asarray(X, float))
+    F = nys.transform(X)
+    mu = measure.k_mean(X, nys.K)
+    Q, R = np.linalg.qr(F)
+    S, U = np.linalg.eigh(R @ R.T)
+    QU = Q @ U
+    c = QU.T @ mu
+    S = np.clip(S, 0.0, None) + ridge
+    keep = S > 1e-14 * max(S.max(), 0.0)
+    w = QU[:, keep] @ (c[keep] / S[keep])
+    if ridge > 0:
+        w += (mu - Q @ (Q.T @ mu)) / ridge
+    return w
@@ -0,0 +1,230 @@
+"""
+Online discrepancy of a growing point set.
+
+For a sample x_1, ..., x_n against an analytic measure P,
+
+    MMD^2 = S / n^2 - 2 M / n + κ              (biased)
+          = (S - T) / (n(n-1)) - 2 M / n + κ   (unbiased)
+
+with S = sum_{i,j} k(x_i, x_j), T = sum_i k(x_i, x_i), M = sum_i μ(x_i) and
+κ = E k(Z, Z').  Appending b points only adds their cross sums with the
+history and their own b x b block, so an update costs O(b n d) and the
+current value is O(1).
+
+Public:
+- DiscrepancyTracker(kernel=None, measure=None, d=None, gamma=1.0, ...)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+import math
+import os
+import numpy as np
+
+from .core import AnalyticalMeasure
+from .kernels import make_cd_kernel
+from .measures import CDUniformMeasure
+from .tiling import DEFAULT_TILE, _tile_slices
+
+__all__ = ["DiscrepancyTracker"]
+
+
+class DiscrepancyTracker:
+    """
+    Running discrepancy of a point set that grows by appends.
+
+    Parameters
+    ----------
+    kernel : callable, optional
+        Batched kernel K(A, B).  Default: make_cd_kernel(d, gamma).
+    measure : AnalyticalMeasure, optional
+        Target measure.  Default: CDUniformMeasure(d, gamma), i.e. the
+        centered L2 discrepancy against Uniform[0,1]^d.
+    d : int, optional
+        Dimension; required for the centered-discrepancy default.
+    gamma : float or array-like of shape (d,)
+        Coordinate weights for the default kernel and measure.
+    biased : bool, default True
+        As in mmd(): include the diagonal, or use the U-statistic for the
+        sample term.
+    tile : int or None
+        Edge length of the blocks of history visited per kernel call.
+
+    Notes
+    -----
+    The points themselves are kept (in a buffer that doubles as it fills),
+    since later appends need their cross sums with the history.  save() and
+    load() checkpoint the points and running sums to one .npz file; a
+    tracker built with the default kernel is restored without arguments.
+    """
+
+    def __init__(
+        self,
+        kernel: Optional[Callable] = None,
+        measure: Optional[AnalyticalMeasure] = None,
+        *,
+        d: Optional[int] = None,
+        gamma: Any = 1.0,
+        biased: bool = True,
+        tile: int | None = DEFAULT_TILE,
+    ):
+        self._gamma = None
+        if kernel is None and measure is None:
+            if d is None:
+                raise ValueError("DiscrepancyTracker needs d for the centered-discrepancy default.")
+            self._gamma = np.broadcast_to(np.asarray(gamma, float), (int(d),)).copy()
+            kernel = make_cd_kernel(int(d), self._gamma)
+            measure = CDUniformMeasure(int(d), self._gamma)
+        elif kernel is None or measure is None:
+            raise ValueError("Pass both kernel and measure, or neither (centered discrepancy).")
+        self.K = kernel
+        self.measure = measure
+        self.biased = bool(biased)
+        self.tile = tile
+        self.kappa = measure.k_self(kernel)
+        self._X: np.ndarray | None = None
+        self.n = 0
+        self.S = 0.0   # sum of the Gram matrix
+        self.T = 0.0   # its trace
+        self.M = 0.0   # sum of the mean embedding over the points
+
+    def __len__(self) -> int:
+        return self.n
+
+    @property
+    def points(self) -> np.ndarray:
+        """The n points seen so far, shape (n, d) (a view of the buffer)."""
+        if self._X is None:
+            return np.empty((0, 0))
+        return self._X[: self.n]
+
+    def _reserve(self, extra: int, d: int) -> None:
+        if self._X is None:
+            self._X = np.empty((max(extra, 64), d))
+        elif self._X.shape[1] != d:
+            raise ValueError(f"tracker holds d={self._X.shape[1]} points, got d={d}")
+        elif self.n + extra > len(self._X):
+            grown = np.empty((max(2 * len(self._X), self.n + extra), d))
+            grown[: self.n] = self._X[: self.n]
+            self._X = grown
+
+    def _value(self, n, S, T, M, squared: bool):
+        n = np.asarray(n, float)
+        if self.biased:
+            v = S / (n * n) - 2.0 * M / n + self.kappa
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                u = np.where(n > 1, (S - T) / (n * np.maximum(n - 1, 1)), S / (n * n))
+            v = u - 2.0 * M / n + self.kappa
+        return v if squared else np.sqrt(np.maximum(v, 0.0))
+
+    def append(self, batch, *, squared: bool = False) -> np.ndarray:
+        """
+        Add the rows of `batch` and return the discrepancy after each new point.
+
+        Parameters
+        ----------
+        batch : array-like (b, d) or (d,)
+        squared : bool
+            Return MMD^2 instead of MMD.
+
+        Returns
+        -------
+        values : (b,) array
+            values[i] is the discrepancy of the first n + i + 1 points, so a
+            stopping rule can look inside a batch.
+        """
+        B = np.atleast_2d(np.asarray(batch, float))
+        if B.size == 0:
+            return np.empty(0)
+        step = len(B) if self.tile is None else int(self.tile)
+        out = [self._append_block(B[s:s + step], squared) for s in range(0, len(B), step)]
+        return np.concatenate(out)
+
+    def _append_block(self, B: np.ndarray, squared: bool) -> np.ndarray:
+        b = len(B)
+        hist = self.points
+        cross = np.zeros(b)                           # row sums of K(B, history)
+        if self.n:
+            for sj in _tile_slices(self.n, self.tile):
+                cross += np.asarray(self.K(B, hist[sj]), float).sum(axis=1)
+        G = np.asarray(self.K(B, B), float)
+        diag = np.diag(G).copy()
+        lower = np.tril(G, -1).sum(axis=1)           # k(b_i, b_j), j < i
+        mu = self.measure.k_mean(B, self.K)
+
+        # running sums after each new point
+        S = self.S + np.cumsum(2.0 * (cross + lower) + diag)
+        T = self.T + np.cumsum(diag)
+        M = self.M + np.cumsum(mu)
+        n = self.n + np.arange(1, b + 1)
+
+        self._reserve(b, B.shape[1])
+        self._X[self.n:self.n + b] = B
+        self.n += b
+        self.S = math.fsum([self.S, 2.0 * math.fsum(cross), 2.0 * math.fsum(lower), math.fsum(diag)])
+        self.T = math.fsum([self.T, math.fsum(diag)])
+        self.M = math.fsum([self.M, math.fsum(mu)])
+        return self._value(n, S, T, M, squared)
+
+    def value(self, squared: bool = False) -> float:
+        """Discrepancy of all points appended so far (O(1))."""
+        if self.n == 0:
+            raise ValueError("DiscrepancyTracker is empty; append points first.")
+        return float(self._value(self.n, self.S, self.T, self.M, squared))
+
+    # ---- checkpointing ---------------------------------------------------------
+    def save(self, path) -> None:
+        """
+        Write points and running sums to `path` (.npz).
+
+        The file is written next to `path` and moved into place, so an
+        interrupted save leaves the previous checkpoint intact.
+        """
+        path = os.fspath(path)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as fh:
+            np.savez(
+                fh,
+                points=self.points,
+                sums=np.array([self.S, self.T, self.M]),
+                biased=self.biased,
+                gamma=np.empty(0) if self._gamma is None else self._gamma,
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(
+        cls,
+        path,
+        kernel: Optional[Callable] = None,
+        measure: Optional[AnalyticalMeasure] = None,
+        *,
+        tile: int | None = DEFAULT_TILE,
+    ) -> "DiscrepancyTracker":
+        """
+        Restore a tracker written by save().
+
+        A centered-discrepancy tracker is rebuilt from the stored weights; a
+        tracker with a custom kernel/measure needs them passed again.
+        """
+        with np.load(os.fspath(path)) as f:
+            X = f["points"]
+            S, T, M = (float(v) for v in f["sums"])
+            biased = bool(f["biased"])
+            gamma = f["gamma"]
+        if kernel is None and measure is None:
+            if gamma.size == 0:
+                raise ValueError("checkpoint uses a custom kernel; pass kernel and measure to load().")
+            tr = cls(d=gamma.size, gamma=gamma, biased=biased, tile=tile)
+        else:
+            tr = cls(kernel, measure, biased=biased, tile=tile)
+        if len(X):
+            tr._reserve(len(X), X.shape[1])
+            tr._X[: len(X)] = X
+        tr.n, tr.S, tr.T, tr.M = len(X), S, T, M
+        return tr
+
+    def __repr__(self) -> str:
+        return f"DiscrepancyTracker(n={self.n}, biased={self.biased})"
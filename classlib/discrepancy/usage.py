@@ -13,6 +13,13 @@ MMD_USAGE = r"""
   - `"matern"`: Matérn family (ν = 0.5, 1.5, 2.5, or general with SciPy).  
   - `"linear"`: Linear kernel.  
   - `make_cd_kernel(weights)`: Centered discrepancy kernel on [0,1]^d with coordinate weights γ_j.
+  - `"wendland0"` / `"wendland1"` / `"wendland2"`: compactly supported (zero beyond
+    distance `sigma`); `mmd(..., sparse=True)` builds sparse Gram matrices by neighbor search.
+  - `make_bernoulli_kernel(d, gamma)`: Periodic (shift-invariant) Bernoulli kernel.  
+    With `Rank1Lattice(z, n)` or `KroneckerSet(alpha, n)` and `PeriodicUniformMeasure()`,
+    `mmd()` costs O(n d) instead of O(n^2 d).
+  - Thousands of dimensions: `log_mmd(X, P, kernel=K)` returns log MMD, summing
+    per-coordinate log-factors so product kernels and measure integrals stay finite.
 
 - **Domain**:
   - $\mathbb{R}^d$ (default): e.g. `kernel="se"` or `make_kernel("se", sigma)`
@@ -22,6 +29,15 @@ MMD_USAGE = r"""
 - **Estimator**:
   - `biased=True` (default): includes diagonals, always nonnegative.
   - `biased=False`: unbiased U-statistic (only when both sides are samples).
+  - `estimator="linear"` / `"block"`: O(n) / O(n·block_size) estimators for huge
+    samples (arrays or iterators of chunks); `return_variance=True` also returns
+    the variance of the MMD² estimate.
+
+- **Memory**:
+  - `tile=2048` (default): Gram matrices are summed in tiles, never stored.  
+    Lower `tile` to cap memory; `tile=None` evaluates each Gram in one call.
+  - `cache=GramCache(dir)`: repeated runs on the same points read the Gram sums
+    from disk (LRU size cap `max_bytes`); `GramCache.gram(kernel, A)` caches full matrices.
 
 - **Analytic distributions**:
   - Wrap as `AnalyticalMeasure(k_mean, k_self)` providing exact integrals.
@@ -31,6 +47,10 @@ MMD_USAGE = r"""
     U01 = AnalyticalMeasure(k_mean=cd_uniform_k_mean(weights),
                             k_self=cd_uniform_k_self(weights))
     ```
+  - Closed forms, no reference sample needed:
+    `SEGaussianMeasure(mean, cov, sigma)` and `SEUniformMeasure(low, high, sigma)`
+    for `kernel="se"`; `MaternUniformMeasure(d, sigma, nu)` for
+    `make_matern_product_kernel(d, sigma, nu)`.
 
 **Examples**
 ```python
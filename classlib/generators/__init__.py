@@ -1,4 +1,6 @@
 from .kronecker_qp import QPKronecker
 from .kronecker import Kronecker
 from .tensor_product_grid import TensorProductGrid
-__all__ = ["QPKronecker", "Kronecker", "TensorProductGrid" ]
\ No newline at end of file
+from .lattice import Lattice
+from .kronecker_cbc import cbc_alpha, shipped_cbc_alpha
+__all__ = ["QPKronecker", "Kronecker", "TensorProductGrid", "Lattice", "cbc_alpha", "shipped_cbc_alpha" ]
\ No newline at end of file
@@ -2,6 +2,8 @@
 from qmcpy.discrete_distribution.abstract_discrete_distribution import AbstractLDDiscreteDistribution
 from numpy import *
 from sympy import nextprime
+from .streaming import ChunkedSamplingMixin, _work_buffer, _deliver
+from .kronecker_cbc import _prefix_square_discrepancies
 
 PRIMES = array([2,   3,   5,   7,  11,  13,  17,  19,  23,  29,  31,  37,  41, 
                 43,  47,  53,  59,  61,  67,  71,  73,  79,  83,  89,  97, 101,
@@ -28,7 +30,7 @@ CBCALPHA = array([4.224371872086318813e-01,
 1.958399682530986008e-01,
 3.216346950830996643e-01], dtype=float64)
 
-class Kronecker(AbstractLDDiscreteDistribution):
+class Kronecker(ChunkedSamplingMixin, AbstractLDDiscreteDistribution):
     def __init__(self, dimension=1, alpha=CBCALPHA, delta=None, replications=None, randomize=True, seed=None):
         # attributes required for cub_qmc_clt.py
         self.mimics = 'StdUniform'
@@ -45,6 +47,8 @@ class Kronecker(AbstractLDDiscreteDistribution):
             self.alpha = alpha[:dimension]
 
         super(Kronecker,self).__init__(dimension,replications,seed,d_limit=dimension,n_limit=inf) 
+        # the base class stores replications=None as 1; gen_samples then drops the replicate axis
+        self._single = replications is None
 
         if self.randomize:
             self.delta = self.rng.uniform(size =(self.replications, self.d))
@@ -63,7 +67,20 @@ class Kronecker(AbstractLDDiscreteDistribution):
         return points
 
 
-    def periodic_discrepancy(self, n, k_tilde=None, gamma=None):
+    # iter_chunks blocks: replications x (n_max-n_min) x len(dims), like gen_samples;
+    # without replications (n_max-n_min) x len(dims)
+    def _replication_shape(self):
+        return () if self._single else (self.delta.shape[0],)
+
+    def _gen_block(self, n_min, n_max, dims, out):
+        alpha = asarray(self.alpha, dtype=float64)[dims]
+        buf = _work_buffer(out, self._replication_shape() + (n_max - n_min, alpha.size))
+        multiply(arange(n_min, n_max, dtype=float64)[:, None], alpha, out=buf)
+        buf += self.delta[0, dims] if self._single else self.delta[:, None, dims]
+        mod(buf, 1, out=buf)
+        return _deliver(buf, out)
+
+    def periodic_discrepancy(self, n, k_tilde=None, gamma=None, log=False):
         """
         Calculates the discrepancy for a periodic kernel.
 
@@ -71,7 +88,10 @@ class Kronecker(AbstractLDDiscreteDistribution):
             n (int): the number of sample points
             k_tilde (tuple(function, float)): the function takes in 2 arguments: the sample points and the coordinate weights.
                 The float is the integral over the unit hypercube.
+                With log=True, both are logarithms: log k_tilde and the log of the integral.
             gamme (ndarray): shape (1xd)
+            log (bool): return the log discrepancy, accumulated from per-dimension log1p terms.
+                Use it in high dimensions, where the product kernel over- or underflows.
 
         Returns:
             float
@@ -83,6 +103,11 @@ class Kronecker(AbstractLDDiscreteDistribution):
         if gamma is None:
             gamma = ones(self.d)
 
+        if log:
+            if k_tilde is None:
+                k_tilde = (lambda x, gamma: sum(log1p((x * (x - 1) + 1/6) * gamma), axis=-1), 0)
+            return self._log_square_periodic_discrepancies(n, k_tilde, gamma) / 2
+
         if k_tilde is None:
             k_tilde = (lambda x, gamma: prod(1 + (x * (x - 1) + 1/6) * gamma, axis=-1), 1)
 
@@ -102,16 +127,19 @@ class Kronecker(AbstractLDDiscreteDistribution):
     
     
     def _square_periodic_discrepancies(self, n, k_tilde, gamma):
-        n_array = arange(1, n + 1)
         k_tilde_terms = k_tilde[0](self.gen_samples(n=n), gamma)
-
-        left_sum = cumsum(k_tilde_terms[...,1:], axis=-1) * n_array[1:]
-        right_sum = cumsum(n_array[:-1] * k_tilde_terms[...,1:], axis=-1)
-
-        k_tilde_zero_terms = k_tilde_terms[...,0] * n_array
-        summation = zeros_like(k_tilde_terms)
-        summation[...,1:] = left_sum - right_sum
-        return (k_tilde_zero_terms + 2 * summation) / (n_array ** 2) - k_tilde[1]
+        return self._prefix_square_discrepancies(n, k_tilde_terms, k_tilde[1])
+
+    # same prefix sums on exp(log k_tilde - max), rescaled in the log domain
+    def _log_square_periodic_discrepancies(self, n, log_k_tilde, gamma):
+        log_terms = log_k_tilde[0](self.gen_samples(n=n), gamma)
+        log_max = log_terms.max(axis=-1, keepdims=True)
+        scaled = self._prefix_square_discrepancies(n, exp(log_terms - log_max), exp(log_k_tilde[1] - log_max))
+        with errstate(divide='ignore', invalid='ignore'):
+            return where(scaled > 0, log_max + log(scaled), -inf)
+
+    # numpy-only helper shared with the CBC search in kronecker_cbc
+    _prefix_square_discrepancies = staticmethod(_prefix_square_discrepancies)
     
     
     def _spawn(self, child_seed, dimension):
@@ -0,0 +1,218 @@
+"""
+Component-by-component (CBC) construction of Kronecker directions alpha.
+
+Component s is the candidate c that minimizes the weighted sum of square
+periodic discrepancies over all prefixes n' = 1..n of the unshifted sequence
+{i (alpha_1, ..., alpha_{s-1}, c)}, with the product Bernoulli kernel
+
+    K(x, y) = prod_j (1 + gamma_j B2({x_j - y_j})),   B2(x) = x^2 - x + 1/6,
+
+i.e. Kronecker.wssd_discrepancy with unit weights, evaluated by
+_prefix_square_discrepancies (numpy only; Kronecker uses it too).  The kernel is shift invariant, so the
+discrepancy needs only k_tilde({i alpha}) for i = 0..n-1: the product over
+the chosen components is kept as one length-n vector, and a candidate costs
+O(n) work.  Candidates are evaluated in blocks, serially or on a process pool.
+
+Since the construction is greedy, the first s components of a d-dimensional
+vector are the s-dimensional vector: tables are stored once per parameter set
+in a cache directory ($CLASSLIB_KRONECKER_CACHE, default
+~/.cache/classlib/kronecker_alpha) and extended on demand.  The default
+table (the 13 PREFERRED components of kronecker_qp extended to d = 1000) ships
+in kronecker_rules/, so QPKronecker only searches beyond that.
+
+Public:
+- cbc_alpha(d, n=4096, gamma=None, n_candidates=256, ...)
+- shipped_cbc_alpha()  -> the precomputed default table
+
+Internal:
+- _prefix_square_discrepancies(n, k_tilde_terms, integral) -> square discrepancy of every prefix
+"""
+
+from __future__ import annotations
+import functools
+import hashlib
+import os
+import numpy as np
+
+__all__ = ["cbc_alpha", "shipped_cbc_alpha"]
+
+_SHIPPED_TABLE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "kronecker_rules", "cbc_alpha_1000dim.txt")
+_CACHE_DIR = os.environ.get(
+    "CLASSLIB_KRONECKER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "classlib", "kronecker_alpha"),
+)
+
+
+def _prefix_square_discrepancies(n, k_tilde_terms, integral):
+    """
+    Square discrepancies of the prefixes 1..n of a shift-invariant design.
+
+    k_tilde_terms[..., i] = k_tilde(x_i - x_0), i = 0..n-1, for a Kronecker
+    sequence (where x_j - x_i depends on j - i only); leading axes are batched.
+    """
+    n_array = np.arange(1, n + 1)
+
+    left_sum = np.cumsum(k_tilde_terms[..., 1:], axis=-1) * n_array[1:]
+    right_sum = np.cumsum(n_array[:-1] * k_tilde_terms[..., 1:], axis=-1)
+
+    k_tilde_zero_terms = k_tilde_terms[..., :1] * n_array
+    summation = np.zeros_like(k_tilde_terms)
+    summation[..., 1:] = left_sum - right_sum
+    return (k_tilde_zero_terms + 2 * summation) / (n_array ** 2) - integral
+
+
+def _bernoulli_factor(i: np.ndarray, c: np.ndarray, gamma: float) -> np.ndarray:
+    """1 + gamma B2({i c}) for every candidate c (rows) and index i (columns)."""
+    x = np.multiply.outer(c, i)
+    np.mod(x, 1.0, out=x)
+    x *= x - 1.0
+    x += 1.0 / 6.0
+    x *= gamma
+    x += 1.0
+    return x
+
+
+def _score_candidates(prod_terms: np.ndarray, candidates: np.ndarray, gamma: float) -> np.ndarray:
+    """Worker: sum over prefixes of the square discrepancy, one value per candidate."""
+    n = prod_terms.size
+    terms = _bernoulli_factor(np.arange(n, dtype=float), candidates, gamma)
+    terms *= prod_terms
+    return _prefix_square_discrepancies(n, terms, 1.0).sum(axis=-1)
+
+
+def _table_path(n, gamma, n_candidates, seed, base) -> str | None:
+    """
+    Cache file for one parameter set; the name hashes everything but d.
+    Callable weights are keyed by their qualified name, so lambdas and local
+    functions (which cannot be told apart) are not cached.
+    """
+    if callable(gamma):
+        key = f"{gamma.__module__}.{gamma.__qualname__}"
+        if "<" in key:
+            return None
+    else:
+        key = np.asarray(gamma, dtype=np.float64).tobytes()
+    h = hashlib.sha1()
+    for part in (np.int64([n, n_candidates, seed]), np.asarray(base, dtype=np.float64)):
+        h.update(part.tobytes())
+    h.update(key.encode() if isinstance(key, str) else key)
+    return os.path.join(_CACHE_DIR, f"cbc_n{n}_{h.hexdigest()[:16]}.npy")
+
+
+def _gamma_weight(gamma, j: int) -> float:
+    """Coordinate weight of component j (0-based): gamma(j+1), gamma[j], or a constant."""
+    if callable(gamma):
+        return float(gamma(j + 1))
+    g = np.asarray(gamma, dtype=float)
+    return float(g) if g.ndim == 0 else float(g[j])
+
+
+def _default_gamma(j):
+    return j ** -2.0
+
+
+@functools.lru_cache(maxsize=None)
+def _read_shipped_table() -> np.ndarray:
+    values = []
+    with open(_SHIPPED_TABLE, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                values.append(float(line))
+    return np.asarray(values)
+
+
+def shipped_cbc_alpha() -> np.ndarray:
+    """
+    The shipped CBC table: kronecker_qp's 13 PREFERRED components extended to
+    d = 1000 by cbc_alpha with its default parameters (a copy).
+    """
+    return _read_shipped_table().copy()
+
+
+def cbc_alpha(d: int, n: int = 4096, gamma=None, n_candidates: int = 256, seed: int = 7,
+              base=None, n_workers: int | None = None, cache: bool = True) -> np.ndarray:
+    """
+    Kronecker direction vector of length d built component by component.
+
+    Parameters
+    ----------
+    d : int
+        Number of components.
+    n : int, default 4096
+        Largest prefix the criterion looks at (all prefixes 1..n count).
+    gamma : callable, float or array_like, optional
+        Coordinate weights: gamma(j) for j = 1..d, a constant, or an array of
+        length >= d.  Default gamma_j = j^-2, which keeps the product kernel
+        bounded in high dimensions and ranks early coordinates first.
+    n_candidates : int, default 256
+        Candidates per component, drawn uniformly from (0, 1/2) (alpha and
+        1 - alpha give the same discrepancy) by a generator seeded with
+        (seed, component).
+    seed : int, default 7
+    base : array_like, optional
+        Leading components to keep fixed (e.g. a hand-tuned table); CBC
+        starts after them.
+    n_workers : int, optional
+        If > 1, split each component's candidates across a process pool.
+    cache : bool, default True
+        Read and extend the on-disk table for this parameter set.
+
+    Returns
+    -------
+    ndarray of shape (d,)
+    """
+    d, n, n_candidates = int(d), int(n), int(n_candidates)
+    if d < 0 or n < 2 or n_candidates < 1:
+        raise ValueError("need d >= 0, n >= 2 and n_candidates >= 1.")
+    if gamma is None:
+        gamma = _default_gamma
+    base = np.zeros(0) if base is None else np.asarray(base, dtype=float).reshape(-1)
+
+    path = _table_path(n, gamma, n_candidates, seed, base) if cache else None
+    alpha = base
+    if path is not None and os.path.exists(path):
+        alpha = np.load(path)
+    if alpha.size >= d:
+        return alpha[:d].copy()
+
+    # k_tilde({i alpha}) over the components already fixed
+    i = np.arange(n, dtype=float)
+    prod_terms = np.ones(n)
+    for j, a in enumerate(alpha):
+        prod_terms *= _bernoulli_factor(i, np.array([a]), _gamma_weight(gamma, j))[0]
+
+    pool = None
+    if n_workers is not None and int(n_workers) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=int(n_workers))
+    try:
+        new = []
+        for j in range(alpha.size, d):
+            g = _gamma_weight(gamma, j)
+            candidates = np.random.default_rng([seed, j]).uniform(0.0, 0.5, n_candidates)
+            if pool is None:
+                scores = _score_candidates(prod_terms, candidates, g)
+            else:
+                blocks = [b for b in np.array_split(candidates, int(n_workers)) if b.size]
+                futures = [pool.submit(_score_candidates, prod_terms, b, g) for b in blocks]
+                scores = np.concatenate([f.result() for f in futures])  # fixed block order
+            best = candidates[int(np.argmin(scores))]
+            new.append(best)
+            prod_terms *= _bernoulli_factor(i, np.array([best]), g)[0]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    alpha = np.concatenate([alpha, new])
+
+    if path is not None:
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            tmp = path + f".{os.getpid()}.tmp"
+            with open(tmp, "wb") as fh:
+                np.save(fh, alpha)
+            os.replace(tmp, path)
+        except OSError:
+            pass                                     # read-only home: the table is just not kept
+    return alpha[:d].copy()
@@ -7,7 +7,8 @@
 
 from __future__ import annotations
 import numpy as np
-import warnings
+
+from .streaming import ChunkedSamplingMixin, _work_buffer, _deliver
 
 # --- Try to import qmcpy's LD base; fall back to a shim if not present ----
 try:
@@ -54,18 +55,18 @@ def _suzuki(d: int) -> np.ndarray:
     # components 2^{i/(d+1)}, i = 1..d
     return 2.0 ** (np.arange(1, d + 1, dtype=float) / (d + 1.0))
 
-def _alpha_from_string(alpha: str | None, d: int) -> np.ndarray:
+def _alpha_from_string(alpha: str | None, d: int, n_workers: int | None = None,
+                       cache: bool = True) -> np.ndarray:
     if alpha is None or str(alpha).lower() == "preferred":
-        base = _ALPHA_PREFERRED
+        if d <= _ALPHA_PREFERRED.size:
+            return _ALPHA_PREFERRED[:d].copy()
+        # d > preferred length: the shipped CBC extension of the table (d <= 1000),
+        # searched component by component beyond that
+        from .kronecker_cbc import cbc_alpha, shipped_cbc_alpha
+        base = shipped_cbc_alpha()
         if d <= base.size:
-            return base[:d].copy()
-        # d > preferred length: warn and return random alpha
-        warnings.warn(
-            f"Requested dimension {d} exceeds preferred vector length {base.size}. "
-            "Using random alpha for all dimensions.",
-            UserWarning,
-        )
-        return np.random.default_rng().random(d)
+            return base[:d]
+        return cbc_alpha(d, base=base, n_workers=n_workers, cache=cache)
 
     a = alpha.lower()
     if a == "richtmyer":
@@ -94,33 +95,76 @@ def _alpha_from_string(alpha: str | None, d: int) -> np.ndarray:
     else:
         raise ValueError("alpha must be 'PREFERRED', 'RICHTMYER', 'SUZUKI', or None (or pass an array).")
 
+# ---- 64-bit fixed point ---------------------------------------------------------
+_TWO32 = 2.0 ** 32
+
+def _to_fixed(x: np.ndarray) -> np.ndarray:
+    """floor({x} * 2^64) as uint64, exact: the two 32-bit halves are each exact in float64."""
+    x = np.mod(np.asarray(x, dtype=np.float64), 1.0) * _TWO32
+    hi = np.floor(x)
+    lo = np.floor((x - hi) * _TWO32)
+    return (hi.astype(np.uint64) << np.uint64(32)) | lo.astype(np.uint64)
+
+def _from_fixed(P: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Write P / 2^64 into float `out`, keeping the leading mantissa bits of out's dtype (in place on P)."""
+    mant = np.finfo(out.dtype).nmant + 1                 # 53 for float64, 24 for float32
+    P >>= np.uint64(64 - mant)                           # truncate: result stays < 1
+    np.multiply(P, 2.0 ** -mant, out=out, casting="unsafe")  # exact power-of-2 scaling
+    return out
+
 # ---- qmcpy-compatible Kronecker ---------------------------------------------
 
-class QPKronecker(_LDBase):
+class QPKronecker(ChunkedSamplingMixin, _LDBase):
     """
     Kronecker (irrational rotation) sequence compatible with qmcpy LD API.
 
     Parameters
     ----------
     dimension : int
-    alpha : {'RICHTMYER','SUZUKI'} or array_like of shape (d,), default "RICHTMYER"
+    alpha : {'PREFERRED','RICHTMYER','SUZUKI'} or array_like of shape (d,), default "PREFERRED"
+        'PREFERRED' uses the hand-tuned 13-component table, extended beyond
+        d = 13 by the component-by-component search in kronecker_cbc (a
+        shipped table up to d = 1000; computed on first use beyond that).
     randomize : bool, default True
         If True, apply Cranley–Patterson shift.
         - seed=None  -> fresh entropy (randomized by default)
         - seed=int   -> reproducible
     seed : int or None, default None
+    fixed_point : bool, default False
+        If True, hold alpha and the shift as 64-bit fixed-point integers
+        (floor(alpha * 2^64)) and generate point i as (i*alpha + shift) mod 2^64
+        with wrapping uint64 arithmetic.  The fractional part is then exact to
+        2^-64 at every index (the float path loses low bits once i*alpha is
+        large, around i ~ 2^30), and each block is one uint64 temporary
+        converted straight into the output dtype.  Float outputs are truncated
+        to their mantissa width (2^-53 for float64, 2^-24 for float32).
+    replications : int or None, default None
+        Number of independent Cranley–Patterson shifts, one per child of
+        SeedSequence(seed).  gen_samples then returns a C-contiguous (R, n, d)
+        array from a single vectorized call, so a payoff can be applied to all
+        replicates at once, e.g.
+        price_rqmc(payoff(X.reshape(-1, d)).reshape(R, n)).
+    n_workers : int or None, default None
+        Process-pool size for the CBC search when alpha='PREFERRED' and
+        d > 1000 (see kronecker_cbc.cbc_alpha).
+    alpha_cache : bool, default True
+        Read and store that search's table in the on-disk cache.
     """
-    def __init__(self, dimension=1, alpha="PREFERRED", randomize=True, seed=None, **kwargs):
-    
+    def __init__(self, dimension=1, alpha="PREFERRED", randomize=True, seed=None,
+                 fixed_point=False, replications=None, n_workers=None, alpha_cache=True, **kwargs):
+
         self.dimension = int(dimension)
         self.d = self.dimension              # alias some code expects
         self.mimics = "StdUniform"
         self.randomize = bool(randomize)
+        self.replications = None if replications is None else int(replications)
+        if self.replications is not None and self.replications < 1:
+            raise ValueError("replications must be a positive integer.")
         self.seed = seed
 
         # Direction vector
         if isinstance(alpha, (str, type(None))):
-            self.alpha = _alpha_from_string(alpha, self.dimension)
+            self.alpha = _alpha_from_string(alpha, self.dimension, n_workers, alpha_cache)
         else:
             a = np.asarray(alpha, dtype=float).reshape(-1)
             if a.size < self.dimension:
@@ -128,24 +172,51 @@ class QPKronecker(_LDBase):
             self.alpha = a[: self.dimension]
 
         # Shift (randomized by default; seed controls reproducibility)
-        if self.randomize:
-            self.rng = np.random.default_rng(seed)  # seed=None -> fresh entropy
-            self.shift = self.rng.random(self.dimension)
-        else:
-            self.rng = None
-            self.shift = np.zeros(self.dimension)
+        self.set_seed(seed)
+        self.fixed_point = bool(fixed_point)
 
         # Some qmcpy code checks this
         self.low_discrepancy = True
 
-    def gen_samples(self, n: int) -> np.ndarray:
-        """Return (n, d) samples in [0,1). Rows = samples; cols = coordinates."""
-        n = int(n)
-        if n <= 0:
-            return np.empty((0, self.dimension), dtype=float)
-        idx = np.arange(n, dtype=float).reshape(n, 1)  # n = 0..n-1
-        pts = self.shift + idx * self.alpha.reshape(1, self.dimension)
-        return np.mod(pts, 1.0)
+    def gen_samples(self, n: int, dtype=np.float64) -> np.ndarray:
+        """
+        Return (n, d) samples in [0,1), or (R, n, d) with replications=R.
+        Rows = samples; cols = coordinates.
+        """
+        n = max(int(n), 0)
+        out = np.empty(self._replication_shape() + (n, self.dimension), dtype=dtype)
+        return self._gen_block(0, n, slice(None), out)
+
+    def _replication_shape(self):
+        return () if self.replications is None else (self.replications,)
+
+    def _gen_block(self, n_min, n_max, dims, out):
+        """Points n_min..n_max-1, coordinates dims (see iter_chunks)."""
+        if self.fixed_point:
+            return self._gen_block_fixed(n_min, n_max, dims, out)
+        alpha, shift = self.alpha[dims], self.shift[..., dims]
+        frac = np.multiply.outer(np.arange(n_min, n_max, dtype=float), alpha)
+        buf = _work_buffer(out, self._replication_shape() + frac.shape)
+        if self.replications is None:
+            np.add(frac, shift, out=buf)
+            np.mod(buf, 1.0, out=buf)
+        else:
+            # reduce i*alpha mod 1 once; each shifted copy then needs one conditional subtraction
+            np.mod(frac, 1.0, out=frac)
+            np.add(frac, shift[:, None, :], out=buf)
+            buf -= buf >= 1.0
+        return _deliver(buf, out)
+
+    def _gen_block_fixed(self, n_min, n_max, dims, out):
+        """_gen_block in 64-bit fixed point: uint64 products and sums wrap mod 2^64 = mod 1."""
+        alpha = _to_fixed(self.alpha[dims])
+        P = np.multiply.outer(np.arange(n_min, n_max, dtype=np.uint64), alpha)
+        shift = _to_fixed(self.shift[..., dims])
+        if self.replications is None:
+            P += shift
+        else:
+            P = np.add(P, shift[:, None, :])
+        return _from_fixed(P, np.empty(P.shape) if out is None else out)
 
     def spawn(self, n_streams: int):
         """Return a list of independent shifted Kronecker generators."""
@@ -157,18 +228,25 @@ class QPKronecker(_LDBase):
             ints = [int(np.random.default_rng(s).integers(2**31 - 1)) for s in seeds]
         else:
             ints = [int(np.random.default_rng().integers(2**31 - 1)) for _ in range(n_streams)]
-        return [QPKronecker(self.dimension, alpha=self.alpha.copy(),
-                            randomize=True, seed=s) for s in ints]
+        return [QPKronecker(self.dimension, alpha=self.alpha.copy(), randomize=True, seed=s,
+                            fixed_point=self.fixed_point) for s in ints]
 
     def set_seed(self, seed: int | None):
-        """Reset RNG/shift according to current randomize flag."""
+        """
+        Reset RNG/shift according to current randomize flag.  With replications,
+        shift r comes from child r of SeedSequence(seed) (R x d).
+        """
         self.seed = seed
-        if self.randomize:
+        if not self.randomize:
+            self.rng = None
+            self.shift = np.zeros(self._replication_shape() + (self.dimension,))
+        elif self.replications is None:
             self.rng = np.random.default_rng(seed)  # seed=None -> fresh entropy
             self.shift = self.rng.random(self.dimension)
         else:
-            self.rng = None
-            self.shift = np.zeros(self.dimension)
+            self.rng = np.random.default_rng(seed)
+            children = np.random.SeedSequence(seed).spawn(self.replications)
+            self.shift = np.stack([np.random.default_rng(c).random(self.dimension) for c in children])
         return self
     
     def __call__(self, *args, **kwargs):
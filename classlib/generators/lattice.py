@@ -0,0 +1,263 @@
+## Rank-1 lattice generator backed by the generating vectors in lattice_rules/.
+## Fits the qmcpy discrete distributions the same way QPKronecker does:
+#
+# import qmcpy as qp
+# from classlib.generators import Lattice
+# qp.Lattice = Lattice
+
+from __future__ import annotations
+import hashlib
+import os
+import numpy as np
+
+from .streaming import ChunkedSamplingMixin, _work_buffer, _deliver
+
+# --- Try to import qmcpy's LD base; fall back to a shim if not present ----
+try:
+    # Newer qmcpy layout
+    from qmcpy.discrete_distribution._discrete_distribution import \
+        LDDiscreteDistribution as _LDBase
+except Exception:
+    try:
+        # Older qmcpy layout
+        from qmcpy.abstract_discrete_distribution import \
+            AbstractLDDiscreteDistribution as _LDBase
+    except Exception:
+        class _LDBase:  # minimal shim
+            pass
+
+# ---- Shipped generating vectors ---------------------------------------------
+_RULES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lattice_rules")
+LATTICE_RULES = {
+    "3600": "2exp20_3600dim_new_lattice_rule_NO_REPEATS.txt",
+    "9125": "2exp20_9125dim_new_lattice_rule.txt",
+}
+
+
+def _cache_dir() -> str:
+    """Cache directory for parsed rules, read from the environment at each use."""
+    return os.environ.get(
+        "CLASSLIB_LATTICE_CACHE",
+        os.path.join(os.path.expanduser("~"), ".cache", "classlib", "lattice_rules"),
+    )
+
+
+def _parse_rule(path: str) -> tuple[np.ndarray, int]:
+    """
+    Read a generating vector file: comma- or newline-separated integers.
+
+    Lines with a '#' are comments; a number in front of the comment is a
+    header value ("1048576 # 2^20" gives the point-set size).  Without such
+    a header, the size is taken from a '2expM' file name prefix.
+    """
+    entries, n_max = [], None
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            if "#" in line:
+                value, comment = line.split("#", 1)
+                if value.strip() and "2^" in comment:
+                    n_max = int(value)
+                continue
+            entries.extend(int(tok) for tok in line.replace(",", " ").split())
+    if n_max is None:
+        stem = os.path.basename(path)
+        if not stem.startswith("2exp"):
+            raise ValueError(f"cannot tell the point-set size of {path}; add a '<n> # 2^m' header line.")
+        n_max = 2 ** int(stem[4:].split("_", 1)[0])
+    m_max = int(n_max).bit_length() - 1
+    if 2**m_max != n_max:
+        raise ValueError(f"{path}: point-set size {n_max} is not a power of 2.")
+    return np.asarray(entries, dtype=np.int64), m_max
+
+
+def _load_rule(path: str) -> tuple[np.ndarray, int]:
+    """
+    Generating vector as a read-only memory map of a cached .npy file.
+
+    The text file is parsed once.  The .npy cache is named after the file
+    plus a hash of its absolute path, size and mtime (and m_max), so a
+    different or edited file with the same basename never reuses it.  When
+    the cache directory cannot be created or written, the parsed vector is
+    returned in memory.
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    key = hashlib.sha1(f"{path}\0{st.st_size}\0{st.st_mtime_ns}".encode()).hexdigest()[:16]
+    prefix = f"{os.path.splitext(os.path.basename(path))[0]}.{key}.m"
+    cache_dir = _cache_dir()
+    try:
+        for name in os.listdir(cache_dir):
+            if name.startswith(prefix) and name.endswith(".npy"):
+                return np.load(os.path.join(cache_dir, name), mmap_mode="r"), int(name[len(prefix):-4])
+    except OSError:
+        pass                                             # no cache yet (or unreadable)
+    z, m_max = _parse_rule(path)
+    cached = os.path.join(cache_dir, f"{prefix}{m_max}.npy")
+    tmp = cached + f".{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp, "wb") as fh:
+            np.save(fh, z)
+        os.replace(tmp, cached)
+    except OSError:
+        return z, m_max                                  # read-only home / sandbox: keep it in memory
+    return np.load(cached, mmap_mode="r"), m_max
+
+
+# ---- Radical-inverse (bit-reversal) ordering ----------------------------------
+_REV8 = np.array([int(f"{b:08b}"[::-1], 2) for b in range(256)], dtype=np.uint64)
+
+
+def _bit_reverse(i: np.ndarray, m: int) -> np.ndarray:
+    """Reverse the lowest m bits of each index (m <= 32): φ_2(i) = bitrev(i) / 2^m."""
+    i = np.asarray(i, dtype=np.uint64)
+    r = np.zeros_like(i)
+    for k in range(4):                                   # 4 bytes -> 32-bit reversal
+        r |= _REV8[(i >> np.uint64(8 * k)) & np.uint64(255)] << np.uint64(8 * (3 - k))
+    return r >> np.uint64(32 - m)
+
+
+def _wrap(frac: np.ndarray, shift: np.ndarray) -> np.ndarray:
+    """{frac + shift} in place; both lie in [0, 1), so one conditional subtraction suffices."""
+    frac += shift
+    frac -= frac >= 1.0
+    return frac
+
+
+# ---- qmcpy-compatible rank-1 lattice -----------------------------------------
+
+class Lattice(ChunkedSamplingMixin, _LDBase):
+    """
+    Extensible rank-1 lattice x_i = {φ_2(i) z + Δ}, compatible with qmcpy LD API.
+
+    Parameters
+    ----------
+    dimension : int
+    generating_vector : {'3600', '9125'}, path, or array_like of int, optional
+        A shipped rule from lattice_rules/ (default: '3600' if dimension <=
+        3600, else '9125'), a file in the same format, or the vector itself
+        (then `m_max` is required).
+    randomize : bool, default True
+        If True, apply a Cranley–Patterson shift Δ.
+        - seed=None  -> fresh entropy (randomized by default)
+        - seed=int   -> reproducible
+    seed : int or None, default None
+    replications : int or None, default None
+        Number of independent shifts; gen_samples then returns (R, n, d).
+    m_max : int, optional
+        log2 of the largest point set the vector supports (read from the
+        shipped files; 20 for both).
+
+    Notes
+    -----
+    Points come in radical-inverse order, so every prefix of 2^m points is
+    itself a lattice and the sequence can be extended without recomputing
+    earlier points.  Point i is computed in integer arithmetic as
+    (bitrev_m(i) * z mod 2^m) / 2^m with m = m_max, then shifted: O(n d)
+    work and no accumulated float error at any index.  The generating
+    vector file is parsed once into a cached .npy (see _load_rule) and
+    memory-mapped.
+    """
+    def __init__(self, dimension=1, generating_vector=None, randomize=True, seed=None,
+                 replications=None, m_max=None, **kwargs):
+
+        self.dimension = int(dimension)
+        self.d = self.dimension              # alias some code expects
+        self.mimics = "StdUniform"
+        self.randomize = bool(randomize)
+        self.replications = None if replications is None else int(replications)
+        self.seed = seed
+
+        # Generating vector
+        if generating_vector is None:
+            generating_vector = "3600" if self.dimension <= 3600 else "9125"
+        if isinstance(generating_vector, str):
+            path = os.path.join(_RULES_DIR, LATTICE_RULES[generating_vector]) \
+                if generating_vector in LATTICE_RULES else generating_vector
+            z, file_m_max = _load_rule(path)
+            self.m_max = file_m_max if m_max is None else int(m_max)
+        else:
+            if m_max is None:
+                raise ValueError("m_max is required with an explicit generating vector.")
+            z = np.asarray(generating_vector, dtype=np.int64).reshape(-1)
+            self.m_max = int(m_max)
+        if not 1 <= self.m_max <= 32:
+            raise ValueError("m_max must be between 1 and 32.")
+        if z.size < self.dimension:
+            raise ValueError(f"generating vector has {z.size} components; dimension {self.dimension} requested.")
+        self.z = z[: self.dimension]             # memory-mapped view for shipped rules
+        self.n_max = 2 ** self.m_max
+
+        self.set_seed(seed)
+
+        # Some qmcpy code checks this
+        self.low_discrepancy = True
+
+    def gen_samples(self, n: int | None = None, n_min: int = 0, n_max: int | None = None) -> np.ndarray:
+        """
+        Return points n_min..n_max-1 (or the first n) as an (n, d) array in [0,1),
+        or (R, n, d) with replications=R.
+        """
+        if n_max is None:
+            n_max = n_min + (0 if n is None else int(n))
+        return self._gen_block(int(n_min), int(n_max), slice(None), None)
+
+    def _n_limit(self):
+        return self.n_max
+
+    def _replication_shape(self):
+        return () if self.replications is None else (self.replications,)
+
+    def _gen_block(self, n_min, n_max, dims, out):
+        """Points n_min..n_max-1, coordinates dims (see iter_chunks)."""
+        if not 0 <= n_min <= n_max <= self.n_max:
+            raise ValueError(f"need 0 <= n_min <= n_max <= 2^{self.m_max}; got {n_min}, {n_max}.")
+        k = _bit_reverse(np.arange(n_min, n_max, dtype=np.uint64), self.m_max)
+        z = np.asarray(self.z[dims], dtype=np.uint64)
+        # uint64 products wrap mod 2^64, a multiple of 2^m: masking the low m bits is exact
+        P = np.multiply.outer(k, z)
+        np.bitwise_and(P, np.uint64(self.n_max - 1), out=P)
+        shift = self.shift[..., dims]
+        buf = _work_buffer(out, self._replication_shape() + P.shape)
+        if self.replications is None:
+            np.multiply(P, 1.0 / self.n_max, out=buf)      # exact: a power-of-2 scaling
+            _wrap(buf, shift)
+        else:
+            frac = P * (1.0 / self.n_max)
+            for r in range(self.replications):
+                buf[r] = frac
+                _wrap(buf[r], shift[r])
+        return _deliver(buf, out)
+
+    def set_seed(self, seed: int | None):
+        """Reset RNG/shift according to current randomize flag."""
+        self.seed = seed
+        shape = (self.dimension,) if self.replications is None else (self.replications, self.dimension)
+        if self.randomize:
+            self.rng = np.random.default_rng(seed)  # seed=None -> fresh entropy
+            self.shift = self.rng.random(shape)
+        else:
+            self.rng = None
+            self.shift = np.zeros(shape)
+        return self
+
+    def __call__(self, *args, **kwargs):
+        """
+        Match the callable interface used by plotting helpers.
+        Accept (n) or (d, n) and return (n, d) samples.
+        """
+        if len(args) == 1:
+            return self.gen_samples(int(args[0]), **kwargs)
+        elif len(args) == 2:
+            d, n = map(int, args)
+            if d != self.d:
+                raise ValueError(f"Lattice is dimension {self.d}, but was called with d={d}.")
+            return self.gen_samples(n, **kwargs)
+        else:
+            raise TypeError("Lattice.__call__ expects (n) or (d, n).")
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(dimension={self.dimension}, m_max={self.m_max}, "
+                f"randomize={self.randomize}, replications={self.replications})")
+
+__all__ = ["Lattice", "LATTICE_RULES"]
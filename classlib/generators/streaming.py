@@ -0,0 +1,116 @@
+"""
+Chunked, range-addressable point generation shared by the generators.
+
+Every generator in classlib.generators can produce points n_min..n_max-1
+directly (no need to generate from index 0), so a huge design can be walked
+in fixed-size blocks with bounded memory:
+
+    for X in gen.iter_chunks(0, 2**20, chunk=4096, dims=slice(0, 500)):
+        total += f(X).sum()
+
+With `out=` every block is written into the same caller-owned buffer (any
+float dtype), so steady-state iteration allocates nothing of size n x d; the
+yielded array is then a view of `out` and is overwritten by the next block.
+
+A generator opts in by inheriting ChunkedSamplingMixin and implementing
+_gen_block(n_min, n_max, dims, out); generators with replications return
+(R, k, len(dims)) blocks.
+"""
+
+from __future__ import annotations
+from typing import Iterator
+import numpy as np
+
+
+def _dims_index(dims, d: int):
+    """Normalize `dims` (None, int, slice or sequence of ints) to a slice or int array, and its length."""
+    if dims is None:
+        return slice(None), d
+    if isinstance(dims, slice):
+        return dims, len(range(d)[dims])
+    idx = np.atleast_1d(np.asarray(dims, dtype=np.int64))
+    if idx.ndim != 1 or (idx.size and (idx.min() < -d or idx.max() >= d)):
+        raise ValueError(f"dims must index coordinates 0..{d - 1}.")
+    return idx, idx.size
+
+
+def _work_buffer(out: np.ndarray | None, shape: tuple) -> np.ndarray:
+    """float64 buffer to compute a block in: `out` itself when it is float64, else a new array."""
+    if out is not None and out.dtype == np.float64:
+        return out
+    return np.empty(shape)
+
+
+def _deliver(buf: np.ndarray, out: np.ndarray | None) -> np.ndarray:
+    """Return the block, copied (and cast) into `out` when that is a different array."""
+    if out is None or buf is out:
+        return buf
+    out[...] = buf
+    return out
+
+
+class ChunkedSamplingMixin:
+    """
+    Adds iter_chunks() to a generator with attribute `d` and a _gen_block method.
+
+    _gen_block(n_min, n_max, dims, out) returns points n_min..n_max-1 restricted
+    to coordinates `dims`; when `out` is given (a view of the right shape) the
+    points are written into it and it is returned.
+    """
+
+    # default chunk: 4096 x 1000 float64 is 32 MB
+    default_chunk = 4096
+
+    def _n_limit(self):
+        """Default n_max for iter_chunks, or None for an unbounded sequence."""
+        return None
+
+    def _replication_shape(self) -> tuple:
+        return ()
+
+    def _gen_block(self, n_min: int, n_max: int, dims, out):
+        raise NotImplementedError
+
+    def iter_chunks(self, n_min: int = 0, n_max: int | None = None, chunk: int | None = None,
+                    dims=None, out: np.ndarray | None = None) -> Iterator[np.ndarray]:
+        """
+        Yield points n_min..n_max-1 in consecutive blocks of at most `chunk` rows.
+
+        Parameters
+        ----------
+        n_min, n_max : int
+            Index range; n_max defaults to the generator's size limit (required
+            for unbounded sequences).
+        chunk : int, optional
+            Rows per block (default `default_chunk`).
+        dims : None, int, slice or sequence of int
+            Coordinates to produce (default all).
+        out : ndarray, optional
+            Buffer of shape (*reps, >= chunk rows, len(dims)), any float dtype.
+            Each block is written into out[..., :k, :] and that view is yielded.
+
+        Yields
+        ------
+        ndarray of shape (*reps, k, len(dims))
+        """
+        if n_max is None:
+            n_max = self._n_limit()
+            if n_max is None or not np.isfinite(n_max):
+                raise ValueError("n_max is required for an unbounded sequence.")
+        n_min, n_max = int(n_min), int(n_max)
+        if n_min < 0 or n_max < n_min:
+            raise ValueError(f"invalid index range [{n_min}, {n_max}).")
+        chunk = int(self.default_chunk if chunk is None else chunk)
+        if chunk < 1:
+            raise ValueError("chunk must be positive.")
+        dims, dd = _dims_index(dims, int(self.d))
+        if out is not None:
+            reps = self._replication_shape()
+            rows = min(chunk, n_max - n_min)
+            if out.shape[:-2] != reps or out.shape[-1] != dd or out.shape[-2] < rows:
+                raise ValueError(f"out must have shape {reps + (rows, dd)} or more rows; got {out.shape}.")
+        for lo in range(n_min, n_max, chunk):
+            hi = min(lo + chunk, n_max)
+            yield self._gen_block(lo, hi, dims, None if out is None else out[..., : hi - lo, :])
+
+__all__ = ["ChunkedSamplingMixin"]
@@ -1,5 +1,7 @@
 import numpy as np
 
+from .streaming import ChunkedSamplingMixin, _work_buffer, _deliver
+
 # 👇 IMPORTANT: import the SAME base class you used for Kronecker.
 # In your code this might be `DiscreteDistribution` or `AbstractDiscreteDistribution`.
 # For example, if Kronecker has:
@@ -8,7 +10,7 @@ import numpy as np
 from qmcpy.discrete_distribution.abstract_discrete_distribution import AbstractLDDiscreteDistribution  # adjust to match Kronecker
 
 
-class TensorProductGrid(AbstractLDDiscreteDistribution):
+class TensorProductGrid(ChunkedSamplingMixin, AbstractLDDiscreteDistribution):
     """
     Deterministic tensor-product grid on [0,1]^d, implemented as a
     QMCPy DiscreteDistribution-style object.
@@ -77,7 +79,7 @@ class TensorProductGrid(AbstractLDDiscreteDistribution):
         # then do the same here. Copy & paste from Kronecker and just swap in d.
         super(TensorProductGrid,self).__init__(dimension,replications,seed,d_limit=dimension,n_limit=np.inf)
 
-        # ---- Precompute the grid in [0,1]^d -------------------------------
+        # ---- Per-axis levels; points are built from their index on demand --
         axes = []
         for L in self.levels_per_dim:
             if self.centered:
@@ -87,11 +89,10 @@ class TensorProductGrid(AbstractLDDiscreteDistribution):
                 axis = np.linspace(0.0, 1.0, num=L, endpoint=self.endpoint)
             axes.append(axis)
 
-        mesh = np.meshgrid(*axes, indexing="ij")
-        points = np.stack([m.ravel(order="C") for m in mesh], axis=1)
-
-        self._points = points                 # shape (n_total, d)
-        self.n_total = int(points.shape[0])
+        self._axes = axes
+        # point i has digit (i // stride_j) % L_j on axis j (C order, last axis fastest)
+        self._strides = [int(np.prod(self.levels_per_dim[j + 1:], dtype=object)) for j in range(d)]
+        self.n_total = int(np.prod(self.levels_per_dim, dtype=object))
 
         # Optional: bounds in [0,1]^d for nice printing
         self.lower_bound = np.zeros(d, dtype=float)
@@ -112,14 +113,24 @@ class TensorProductGrid(AbstractLDDiscreteDistribution):
         -------
         x : ndarray, shape (n, dimension)
         """
-        n = int(n)
-        if n <= self.n_total:
-            return self._points[:n, :].copy()
-
-        # If more points requested than in the grid, tile deterministically.
-        reps = (n + self.n_total - 1) // self.n_total
-        tiled = np.tile(self._points, (reps, 1))
-        return tiled[:n, :].copy()
+        # Past n_total the grid repeats (tiles) deterministically.
+        return self._gen_block(0, int(n), slice(None), None)
+
+    def _n_limit(self):
+        return self.n_total
+
+    def _gen_block(self, n_min, n_max, dims, out):
+        """Grid points n_min..n_max-1 (index mod n_total), coordinates dims (see iter_chunks)."""
+        cols = np.arange(self.dimension)[dims]
+        idx = np.arange(n_min, n_max, dtype=np.int64)
+        if self.n_total < 2**63:              # larger grids never wrap at int64 indices
+            idx %= self.n_total
+        buf = _work_buffer(out, (n_max - n_min, cols.size))
+        for c, j in enumerate(cols):
+            stride = self._strides[j]
+            digit = (idx // stride) % self.levels_per_dim[j] if stride < 2**63 else np.zeros_like(idx)
+            buf[:, c] = self._axes[j][digit]
+        return _deliver(buf, out)
 
     # QMCPy usually calls the sampler like sampler(n)
     def __call__(self, n, **kwargs):